@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - V1 범위 클레임 경합 벤치마크
+여러 프로세스가 같은 범위 목록을 동시에 클레임할 때 초당 클레임 시도 수와 이중 클레임 비율 측정
+(이전 방식: 변경 전 claim_frame_range 재현 - claims/에 범위 JSON, 랜덤/동기화/검증 sleep + 덮어쓰기, 재시도 읽기
+ 현재 방식: FarmManager.claim_frame_range 그대로 - pending 티켓을 running/<worker_id>/로 rename 한 번)
+
+사용:
+    python bench_claims.py --root //NAS/farm/bench --procs 12 --ranges 500
+    python bench_claims.py --root /tmp/bench --expired   # 모든 범위가 만료된 클레임 상태에서 시작
+
+--expired에서 현재 방식은 각 프로세스가 return_stale_tickets로 만료 티켓을 pending에 돌려놓은 뒤 클레임한다
+(반환 경합도 측정 구간에 포함). --root는 실제 공유 폴더를 지정해야 네트워크 지연이 반영된다 (로컬 폴더는 상한 측정용).
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from config import (
+    BATCH_CLAIM_TIMEOUT_SEC,
+    FILE_IO_MAX_RETRIES,
+    FILE_IO_RETRY_DELAY_BASE,
+    FILE_IO_RETRY_DELAY_MAX,
+    NFS_READ_RETRY_ON_EMPTY,
+)
+from farm_core import FarmManager, RangeClaim
+
+# 이전 방식의 고정 sleep (변경 전 config 값)
+LEGACY_RANDOM_DELAY = (0.01, 0.05)
+LEGACY_SYNC_DELAY = 0.01
+LEGACY_VERIFY_DELAY = 0.02
+
+BENCH_JOB_ID = "bench"
+BENCH_EYE = "left"
+
+
+def _range(range_idx: int, batch: int) -> tuple:
+    """범위 번호 -> (start_frame, end_frame)"""
+    return range_idx * batch, range_idx * batch + batch - 1
+
+
+def _claim_dict(start_frame: int, end_frame: int, worker_id: str, claimed_at: datetime) -> dict:
+    claim = RangeClaim(BENCH_JOB_ID, start_frame, end_frame, BENCH_EYE, worker_id)
+    claim.claimed_at = claimed_at
+    return claim.to_dict()
+
+
+def legacy_json_read(file_path: Path):
+    """변경 전 safe_json_read (빈 파일/부분 쓰기/접근 오류는 지수 대기 후 재시도, 끝내 실패하면 None)"""
+    for attempt in range(FILE_IO_MAX_RETRIES):
+        delay = min(FILE_IO_RETRY_DELAY_BASE * (2 ** attempt), FILE_IO_RETRY_DELAY_MAX)
+        try:
+            if not file_path.exists():
+                return None
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            if not content.strip():
+                if NFS_READ_RETRY_ON_EMPTY and attempt < FILE_IO_MAX_RETRIES - 1:
+                    time.sleep(delay)
+                    continue
+                return None
+            return json.loads(content)
+        except (json.JSONDecodeError, OSError):
+            if attempt < FILE_IO_MAX_RETRIES - 1:
+                time.sleep(delay)
+                continue
+            return None
+    return None
+
+
+def _legacy_claim_file(folder: Path, start_frame: int, end_frame: int) -> Path:
+    """변경 전 범위 클레임 경로 (claims/ 평면)"""
+    return folder / "claims" / f"{BENCH_JOB_ID}_range_{start_frame:06d}_{end_frame:06d}_{BENCH_EYE}.json"
+
+
+def legacy_claim(folder: Path, start_frame: int, end_frame: int, worker_id: str) -> bool:
+    """변경 전 claim_frame_range 경로 (sleep과 검증 읽기 포함, 읽기는 legacy_json_read)"""
+    claim = _claim_dict(start_frame, end_frame, worker_id, datetime.now())
+    claim_file = _legacy_claim_file(folder, start_frame, end_frame)
+    temp_file = claim_file.with_name(
+        f"{BENCH_JOB_ID}_range_{start_frame:06d}_{end_frame:06d}_{BENCH_EYE}.{worker_id}.tmp")
+    if claim_file.exists():
+        existing_data = legacy_json_read(claim_file)
+        if existing_data:
+            try:
+                if not RangeClaim.from_dict(existing_data).is_expired():
+                    return False
+            except (KeyError, TypeError):
+                pass
+        time.sleep(random.uniform(*LEGACY_RANDOM_DELAY))
+        try:
+            with open(temp_file, "w", encoding="utf-8") as tf:
+                json.dump(claim, tf, indent=2)
+            time.sleep(LEGACY_SYNC_DELAY)
+            temp_file.replace(claim_file)
+            time.sleep(LEGACY_VERIFY_DELAY)
+            verify = legacy_json_read(claim_file)
+            return bool(verify) and verify.get("worker_id") == worker_id
+        except OSError:
+            try:
+                temp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return False
+    try:
+        with open(claim_file, "x", encoding="utf-8") as f:
+            json.dump(claim, f, indent=2)
+        time.sleep(LEGACY_SYNC_DELAY)
+        time.sleep(LEGACY_VERIFY_DELAY)
+        verify = legacy_json_read(claim_file)
+        return bool(verify) and verify.get("worker_id") == worker_id
+    except FileExistsError:
+        return False
+    except OSError:
+        return False
+
+
+def _legacy_claimer(folder: Path, worker_id: str, expired: bool):
+    """변경 전 방식은 만료 클레임을 클레임 시점에 덮어쓰므로 사전 작업 없음"""
+    return lambda start_frame, end_frame: legacy_claim(folder, start_frame, end_frame, worker_id)
+
+
+def _current_claimer(folder: Path, worker_id: str, expired: bool):
+    """현재 FarmManager.claim_frame_range (벤치 폴더를 팜 루트로, 프로세스마다 다른 워커 ID)
+
+    만료 상태에서 시작하면 클레임 전에 return_stale_tickets를 먼저 실행 (측정 구간에 포함되도록 첫 클레임 때)
+    """
+    manager = FarmManager(str(folder))
+    manager.worker.worker_id = worker_id
+    pending = [expired]
+
+    def claim(start_frame: int, end_frame: int) -> bool:
+        if pending[0]:
+            pending[0] = False
+            manager.return_stale_tickets()
+        return manager.claim_frame_range(BENCH_JOB_ID, start_frame, end_frame, BENCH_EYE)
+    return claim
+
+
+def _seed_legacy(folder: Path, ranges: int, batch: int, expired: bool):
+    """만료된 범위 클레임으로 채우기 (빈 상태에서 시작하면 할 일 없음)"""
+    (folder / "claims").mkdir(parents=True, exist_ok=True)
+    if not expired:
+        return
+    old = datetime.now() - timedelta(seconds=BATCH_CLAIM_TIMEOUT_SEC * 10)
+    for range_idx in range(ranges):
+        start_frame, end_frame = _range(range_idx, batch)
+        path = _legacy_claim_file(folder, start_frame, end_frame)
+        path.write_text(json.dumps(_claim_dict(start_frame, end_frame, "dead-worker", old)), encoding="utf-8")
+        os.utime(path, (old.timestamp(), old.timestamp()))
+
+
+def _seed_current(folder: Path, ranges: int, batch: int, expired: bool):
+    """제출 시처럼 pending 티켓 생성, 만료 상태면 죽은 워커의 running 폴더에 오래된 mtime으로 둠"""
+    manager = FarmManager(str(folder))
+    manager.ensure_layout()
+    tickets = [(*_range(range_idx, batch), BENCH_EYE) for range_idx in range(ranges)]
+    manager._add_tickets(BENCH_JOB_ID, tickets)
+    if not expired:
+        return
+    old = time.time() - BATCH_CLAIM_TIMEOUT_SEC * 10
+    running = manager._running_dir("dead-worker", BENCH_JOB_ID)
+    running.mkdir(parents=True, exist_ok=True)
+    for start_frame, end_frame, eye in tickets:
+        name = manager._ticket_name(start_frame, end_frame, eye)
+        os.rename(manager._pending_dir(BENCH_JOB_ID) / name, running / name)
+        os.utime(running / name, (old, old))
+
+
+# 프로토콜 -> (프로세스별 클레임 함수 생성, 시작 상태 준비)
+PROTOCOLS = {
+    "legacy": (_legacy_claimer, _seed_legacy),
+    "current": (_current_claimer, _seed_current),
+}
+
+
+def _worker(protocol: str, folder: str, ranges: int, batch: int, expired: bool, worker_id: str,
+            start_event, result_queue):
+    claim = PROTOCOLS[protocol][0](Path(folder), worker_id, expired)
+    order = list(range(ranges))
+    # 같은 순서에서 조금씩 어긋나게 시작 (실제 워커처럼 같은 범위 근처로 몰림)
+    offset = random.randint(0, max(0, ranges // 20))
+    order = order[offset:] + order[:offset]
+    start_event.wait()
+    started = time.perf_counter()
+    won = [range_idx for range_idx in order if claim(*_range(range_idx, batch))]
+    result_queue.put((worker_id, won, len(order), time.perf_counter() - started))
+
+
+def run(protocol: str, root: Path, procs: int, ranges: int, batch: int, expired: bool) -> dict:
+    """프로토콜 하나 측정"""
+    folder = root / f"bench_{protocol}_{os.getpid()}"
+    shutil.rmtree(folder, ignore_errors=True)
+    folder.mkdir(parents=True)
+    PROTOCOLS[protocol][1](folder, ranges, batch, expired)
+
+    ctx = multiprocessing.get_context("spawn")
+    start_event = ctx.Event()
+    result_queue = ctx.Queue()
+    workers = [ctx.Process(target=_worker, args=(protocol, str(folder), ranges, batch, expired, f"w{i:02d}",
+                                                 start_event, result_queue))
+               for i in range(procs)]
+    for p in workers:
+        p.start()
+    time.sleep(0.5)  # 프로세스 기동 대기 (측정 구간 밖)
+    start_event.set()
+    results = [result_queue.get() for _ in workers]
+    for p in workers:
+        p.join()
+    shutil.rmtree(folder, ignore_errors=True)
+
+    owners = {}
+    for worker_id, won, _, _ in results:
+        for range_idx in won:
+            owners.setdefault(range_idx, []).append(worker_id)
+    attempts = sum(r[2] for r in results)
+    elapsed = max(r[3] for r in results)
+    double = sum(1 for o in owners.values() if len(o) > 1)
+    return {
+        "protocol": protocol,
+        "attempts": attempts,
+        "claimed": len(owners),
+        "unclaimed": ranges - len(owners),
+        "double_claims": double,
+        "double_rate": double / ranges,
+        "elapsed": elapsed,
+        "attempts_per_sec": attempts / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="V1 범위 클레임 경합 벤치마크")
+    parser.add_argument("--root", required=True, help="벤치마크용 폴더 (공유 폴더 권장)")
+    parser.add_argument("--procs", type=int, default=8, help="동시 프로세스 수")
+    parser.add_argument("--ranges", type=int, default=300, help="클레임 대상 범위 수")
+    parser.add_argument("--batch", type=int, default=10, help="범위당 프레임 수")
+    parser.add_argument("--expired", action="store_true", help="만료된 클레임이 있는 상태에서 시작")
+    parser.add_argument("--protocol", choices=["both"] + list(PROTOCOLS), default="both")
+    args = parser.parse_args()
+
+    protocols = list(PROTOCOLS) if args.protocol == "both" else [args.protocol]
+    print(f"프로세스 {args.procs}개, 범위 {args.ranges}개 (범위당 {args.batch}프레임), "
+          f"{'만료 클레임에서 시작' if args.expired else '빈 상태에서 시작'}")
+    print(f"{'방식':<8} {'시도/초':>10} {'소요(초)':>9} {'클레임':>7} {'누락':>5} {'이중':>5} {'이중 비율':>9}")
+    for protocol in protocols:
+        r = run(protocol, Path(args.root), args.procs, args.ranges, args.batch, args.expired)
+        print(f"{r['protocol']:<8} {r['attempts_per_sec']:>10,.0f} {r['elapsed']:>9.2f} {r['claimed']:>7} "
+              f"{r['unclaimed']:>5} {r['double_claims']:>5} {r['double_rate']:>9.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 클립 메타데이터 캐시
+braw_cli --info 결과(프레임 수, 해상도, fps, 스테레오)를 farm.db의 clip_metadata 테이블에 저장해
+팜 전체(V1/V2 UI, 제출 도구)가 같은 클립을 다시 조회하지 않도록 공유
+
+- 키: 정규화한 경로, 유효성: 파일 (size, mtime_ns)가 저장된 값과 같을 때만 (클립을 덮어쓰면 다시 조회)
+- 조회 실패(프레임 수 0)는 저장하지 않음 - SDK 없는 PC의 실패가 다른 PC까지 막지 않도록
+- 테이블은 FarmDatabase가 만들고, 이 캐시는 이미 있는 farm.db에만 붙음 (mode=rw - 새 DB 파일을 만들지 않음)
+- DB에 접근할 수 없으면 retry_sec 동안 캐시 없이 조회만 하고 다시 연결 시도
+- 잠금 대기는 busy_timeout_sec까지만 (GUI 스레드에서도 호출 - 다른 연결이 오래 쓰는 중이면 조회로 넘어가고
+  retry_sec 동안 캐시를 건너뜀)
+  (렌더와 무관한 부가 기능이므로 오류를 올리지 않음)
+
+다른 모듈에 의존하지 않음 (V1 절대 import, V2 상대 import, main.py 모두에서 사용)
+"""
+
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.request import pathname2url
+
+
+@dataclass
+class ClipInfo:
+    """클립 메타데이터"""
+    path: str
+    size: int
+    mtime_ns: int
+    frame_count: int
+    width: int = 0
+    height: int = 0
+    fps: float = 0.0
+    stereo: bool = False
+
+    def to_info(self) -> Dict[str, str]:
+        """parse_info 형식 (--info 출력을 읽던 코드에 그대로 전달)"""
+        return {
+            "FRAME_COUNT": str(self.frame_count),
+            "WIDTH": str(self.width),
+            "HEIGHT": str(self.height),
+            "FRAME_RATE": f"{self.fps:g}",
+            "STEREO": "true" if self.stereo else "false",
+        }
+
+
+def normalize_path(clip_path: str) -> str:
+    """캐시 키 (구분자/대소문자 차이를 같은 클립으로 - Windows 기준)"""
+    return os.path.normcase(os.path.normpath(str(clip_path)))
+
+
+def parse_info(stdout: str) -> Dict[str, str]:
+    """--info 출력의 KEY=VALUE 줄 ([DEBUG] 줄 제외)"""
+    info = {}
+    for line in stdout.splitlines():
+        line = line.strip()
+        if "=" in line and not line.startswith("[DEBUG]"):
+            key, value = line.split("=", 1)
+            info[key] = value
+    return info
+
+
+def clip_info_from(clip_path: str, info: Dict[str, str]) -> Optional[ClipInfo]:
+    """parse_info 결과 + 현재 파일 (size, mtime_ns) → ClipInfo (프레임 수가 없거나 파일이 없으면 None)"""
+    try:
+        frame_count = int(info.get("FRAME_COUNT", 0))
+        if frame_count <= 0:
+            return None
+        st = os.stat(clip_path)
+        return ClipInfo(
+            path=str(clip_path),
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            frame_count=frame_count,
+            width=int(info.get("WIDTH", 0) or 0),
+            height=int(info.get("HEIGHT", 0) or 0),
+            fps=float(info.get("FRAME_RATE", 0) or 0),
+            stereo=info.get("STEREO", "").lower() == "true",
+        )
+    except (OSError, ValueError):
+        return None
+
+
+def read_write_uri(db_path) -> str:
+    """이미 있는 DB 파일만 여는 sqlite URI (없으면 만들지 않고 연결 실패)"""
+    url = pathname2url(os.path.abspath(str(db_path)))
+    if url.startswith("//") and not url.startswith("///"):
+        url = "//" + url  # UNC 경로: sqlite는 빈 authority만 받음 (file:////server/share/...)
+    return f"file:{url}?mode=rw"
+
+
+def probe_clip(cli_path, clip_path: str, timeout_sec: float = 10, creationflags: int = 0) -> Optional[ClipInfo]:
+    """braw_cli --info 실행 (실패 시 None)"""
+    try:
+        result = subprocess.run(
+            [str(cli_path), str(clip_path), "--info"],
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            timeout=timeout_sec,
+            creationflags=creationflags
+        )
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return clip_info_from(clip_path, parse_info(result.stdout))
+
+
+class ClipMetadataCache:
+    """farm.db clip_metadata 테이블 (스레드별 연결, 스레드 안전)"""
+
+    def __init__(self, db_path, cli_path=None, timeout_sec: float = 10, creationflags: int = 0,
+                 retry_sec: float = 60, busy_timeout_sec: float = 1.5):
+        self.db_path = Path(db_path) if db_path else None
+        self.cli_path = cli_path
+        self.timeout_sec = timeout_sec
+        self.creationflags = creationflags
+        self.retry_sec = retry_sec
+        self.busy_timeout_sec = busy_timeout_sec
+        self._local = threading.local()
+        self._retry_at = 0.0  # 연결 실패 후 다시 시도할 시각 (time.monotonic)
+
+        # 통계
+        self.hits = 0
+        self.probes = 0
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """스레드별 연결 (DB가 없거나 접근 불가면 None - retry_sec 뒤 다시 시도)"""
+        if self.db_path is None:
+            return None
+        if time.monotonic() < self._retry_at:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                conn = sqlite3.connect(read_write_uri(self.db_path), timeout=self.busy_timeout_sec,
+                                       isolation_level=None, uri=True)
+                conn.execute("PRAGMA journal_mode=DELETE")  # 네트워크 드라이브 호환 (FarmDatabase와 같은 설정)
+                conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_sec * 1000)}")
+            except (sqlite3.Error, OSError):
+                self._retry_at = time.monotonic() + self.retry_sec
+                return None
+            self._local.conn = conn
+        return conn
+
+    def get(self, clip_path: str) -> Optional[ClipInfo]:
+        """저장된 메타데이터 (파일이 바뀌었거나 없으면 None)"""
+        try:
+            st = os.stat(clip_path)
+        except OSError:
+            return None
+        conn = self._connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("""
+                SELECT frame_count, width, height, fps, stereo FROM clip_metadata
+                WHERE path = ? AND size = ? AND mtime_ns = ?
+            """, (normalize_path(clip_path), st.st_size, st.st_mtime_ns)).fetchone()
+        except sqlite3.Error:
+            self._retry_at = time.monotonic() + self.retry_sec  # 잠금 대기 초과 등 - 이어지는 put도 기다리지 않음
+            return None
+        if row is None:
+            return None
+        self.hits += 1
+        return ClipInfo(str(clip_path), st.st_size, st.st_mtime_ns, row[0], row[1], row[2], row[3], bool(row[4]))
+
+    def put(self, info: ClipInfo):
+        """메타데이터 저장 (같은 경로는 덮어씀)"""
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            conn.execute("""
+                INSERT OR REPLACE INTO clip_metadata
+                    (path, size, mtime_ns, frame_count, width, height, fps, stereo, probed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (normalize_path(info.path), info.size, info.mtime_ns, info.frame_count, info.width,
+                  info.height, info.fps, int(info.stereo), datetime.now().isoformat()))
+        except sqlite3.Error:
+            self._retry_at = time.monotonic() + self.retry_sec
+
+    def lookup(self, clip_path: str) -> Optional[ClipInfo]:
+        """캐시에 있으면 그대로, 없으면 --info로 조회해 저장 (실패 시 None)"""
+        info = self.get(clip_path)
+        if info is not None:
+            return info
+        if self.cli_path is None:
+            return None
+        self.probes += 1
+        info = probe_clip(self.cli_path, clip_path, self.timeout_sec, self.creationflags)
+        if info is not None:
+            self.put(info)
+        return info
+
+    def frame_count(self, clip_path: str) -> int:
+        """클립 프레임 수 (실패 시 0)"""
+        info = self.lookup(clip_path)
+        return info.frame_count if info else 0
+
+    def close(self):
+        """이 스레드의 연결 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
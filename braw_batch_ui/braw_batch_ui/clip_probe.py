@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 클립 정보 백그라운드 조회 큐
+파일을 목록에 넣는 즉시 braw_cli --info를 스레드 풀에서 동시에 최대 max_workers개까지 실행
+(--info는 각각 별도 프로세스 - 스레드는 프로세스 종료만 기다리므로 풀 크기 = 동시 프로세스 수 상한)
+
+- 조회는 ClipMetadataCache를 거치므로 팜에서 이미 조회한 클립은 CLI를 실행하지 않음
+- probed/progress 시그널은 풀 스레드에서 발생 → UI 쪽 슬롯은 Qt가 UI 스레드에서 실행
+- cancel(): 시작 전 조회는 취소, 실행 중인 조회는 끝나도 결과를 버림
+- 실패(프레임 수 0)는 결과로 남기지 않음 - 일시적인 타임아웃이면 다시 submit해서 재조회
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from .clip_metadata import ClipMetadataCache
+
+
+class ClipProbeQueue(QObject):
+    """클립 프레임 수 조회 큐"""
+
+    probed = Signal(str, int)  # 클립 경로, 프레임 수 (실패 시 0)
+    progress = Signal(int, int)  # 끝난 수, 전체 수 (마지막 cancel 이후)
+
+    def __init__(self, metadata: ClipMetadataCache, max_workers: int = 4, parent=None):
+        super().__init__(parent)
+        self.metadata = metadata
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="clip_probe")
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}  # 조회 중/대기 중
+        self._results: Dict[str, int] = {}  # 성공한 조회
+        self._generation = 0  # cancel마다 증가 - 이전 세대의 결과는 버림
+        self._done = 0
+        self._total = 0
+
+    def submit(self, clip_path: str):
+        """조회 예약 (이미 예약됐거나 성공했으면 무시)"""
+        with self._lock:
+            if clip_path in self._futures or clip_path in self._results:
+                return
+            self._total += 1
+            self._futures[clip_path] = self._executor.submit(self._probe, clip_path, self._generation)
+            done, total = self._done, self._total
+        self.progress.emit(done, total)
+
+    def _probe(self, clip_path: str, generation: int):
+        """풀 스레드: 조회 후 결과 기록과 시그널"""
+        if generation != self._generation:
+            return
+        frame_count = self.metadata.frame_count(clip_path)
+        with self._lock:
+            if generation != self._generation:
+                return  # 실행 중에 취소됨
+            self._futures.pop(clip_path, None)
+            if frame_count > 0:
+                self._results[clip_path] = frame_count
+            self._done += 1
+            done, total = self._done, self._total
+        self.probed.emit(clip_path, frame_count)
+        self.progress.emit(done, total)
+
+    def result(self, clip_path: str) -> Optional[int]:
+        """성공한 조회의 프레임 수 (아직이거나 실패했으면 None)"""
+        with self._lock:
+            return self._results.get(clip_path)
+
+    def pending(self, clip_paths: Iterable[str] = None) -> List[str]:
+        """아직 끝나지 않은 조회 (clip_paths를 주면 그 중에서만)"""
+        with self._lock:
+            if clip_paths is None:
+                return list(self._futures)
+            return [p for p in clip_paths if p in self._futures]
+
+    def cancel(self):
+        """모든 조회 취소 (끝난 결과도 잊음)"""
+        with self._lock:
+            self._generation += 1
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+            self._results.clear()
+            self._done = self._total = 0
+        self.progress.emit(0, 0)
+
+    def shutdown(self):
+        """종료 (실행 중인 조회는 기다리지 않음)"""
+        with self._lock:
+            self._generation += 1
+            self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 작업별 완료 매니페스트
+프레임·eye마다 .done 파일을 만드는 대신 작업 폴더 하나에 완료 비트맵을 유지
+(완료 확인 = 작은 파일 몇 개 읽기, completed/ 폴더는 작업 수만큼만 늘어남)
+
+저장 구조 (completed/{job_id}/):
+    manifest.json   # 스냅샷: eye별 완료 비트맵(base64, 비트 i = 프레임 i) + 반영된 로그 오프셋
+    {hostname}.log  # 호스트별 완료 기록 (append 전용, 한 줄 = eye<TAB>start<TAB>end)
+    compact.lock    # 스냅샷 재작성 잠금 (내용 = 보유자별 고유 토큰)
+
+로그에는 완료(비트 설정)만 기록하므로 여러 호스트의 로그를 순서와 무관하게 OR로 합칠 수 있다.
+완료 해제(복구/리셋)는 잠금을 잡고 로그를 모두 합친 뒤 스냅샷에서 직접 비트를 지운다.
+"""
+
+import base64
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MANIFEST_FILE_NAME = "manifest.json"
+LOCK_FILE_NAME = "compact.lock"
+MANIFEST_VERSION = 1
+
+LOCK_STALE_SEC = 10.0  # 잠금 보유는 순간적이므로 이보다 오래된 잠금은 죽은 워커의 것으로 간주
+LOCK_WAIT_SEC = 30.0  # 완료 해제가 잠금을 기다리는 최대 시간 (넘으면 해제하지 않고 실패)
+SHARE_CLOCK_INTERVAL_SEC = 1.0  # 잠금 나이 측정용 공유 폴더 시각 조회 간격
+
+
+class CompletionManifest:
+    """작업 하나의 완료 비트맵 (스레드 안전)"""
+
+    def __init__(self, job_dir: Path, ttl_sec: float = 2.0, compact_bytes: int = 16 * 1024):
+        self.job_dir = Path(job_dir)
+        self.ttl_sec = ttl_sec
+        self.compact_bytes = compact_bytes  # 스냅샷 이후 로그가 이만큼 쌓이면 압축 시도
+        self.manifest_file = self.job_dir / MANIFEST_FILE_NAME
+        self.lock_file = self.job_dir / LOCK_FILE_NAME
+        self.log_file = self.job_dir / f"{socket.gethostname()}.log"
+        self.clock_file = self.job_dir / f"clock.{socket.gethostname()}.{os.getpid()}.probe"
+
+        self._lock = threading.RLock()
+        self._bitmaps: Dict[str, bytearray] = {}
+        self._counts: Dict[str, int] = {}
+        self._log_pos: Dict[str, int] = {}
+        self._snapshot_offsets: Dict[str, int] = {}
+        self._snapshot_mtime_ns = None
+        self._loaded_at = 0.0
+        self._lock_token = ""
+
+    # ===== 조회 =====
+
+    def is_completed(self, frame_idx: int, eye: str) -> bool:
+        """프레임 완료 여부"""
+        self.refresh()
+        with self._lock:
+            bitmap = self._bitmaps.get(eye)
+            byte = frame_idx >> 3
+            return bitmap is not None and byte < len(bitmap) and bool(bitmap[byte] & (1 << (frame_idx & 7)))
+
+    def completed_count(self) -> int:
+        """완료된 (프레임, eye) 수"""
+        self.refresh()
+        with self._lock:
+            return sum(self._counts.values())
+
+    def completed_ranges(self) -> Dict[str, List[Tuple[int, int]]]:
+        """eye별 완료 범위 [(start, end), ...] (빈 바이트/꽉 찬 바이트는 통째로 건너뜀)"""
+        self.refresh()
+        with self._lock:
+            bitmaps = {eye: bytes(bitmap) for eye, bitmap in self._bitmaps.items()}
+        result = {}
+        for eye, bitmap in bitmaps.items():
+            ranges = []
+            start = None
+            for byte_idx, byte in enumerate(bitmap):
+                if byte == 0xFF and start is not None:
+                    continue
+                if byte == 0 and start is None:
+                    continue
+                for bit in range(8):
+                    frame_idx = (byte_idx << 3) | bit
+                    if byte & (1 << bit):
+                        if start is None:
+                            start = frame_idx
+                    elif start is not None:
+                        ranges.append((start, frame_idx - 1))
+                        start = None
+            if start is not None:
+                ranges.append((start, (len(bitmap) << 3) - 1))
+            if ranges:
+                result[eye] = ranges
+        return result
+
+    def exists(self) -> bool:
+        """디스크에 매니페스트나 로그가 있는지 (기존 .done 이전 여부 판단용)"""
+        return self.manifest_file.exists() or bool(self._log_sizes())
+
+    # ===== 기록 =====
+
+    def mark_range(self, eye: str, start_frame: int, end_frame: int):
+        """범위 완료 기록 (메모리 반영 + 내 로그에 한 줄 append)"""
+        self.mark_ranges([(eye, start_frame, end_frame)])
+
+    def mark_ranges(self, ranges: Iterable):
+        """여러 범위 완료 기록 [(eye, start, end), ...] - 한 번의 write"""
+        ranges = list(ranges)
+        if not ranges:
+            return
+        data = "".join(f"{eye}\t{start}\t{end}\n" for eye, start, end in ranges).encode("utf-8")
+        with self._lock:
+            for eye, start, end in ranges:
+                self._set_range(eye, start, end)
+            try:
+                self.job_dir.mkdir(parents=True, exist_ok=True)
+                with open(self.log_file, "ab") as f:
+                    f.write(data)
+                    end_pos = f.tell()
+                # 내 기록은 이미 메모리에 반영됨 - 다음 tail에서 건너뜀
+                if self._log_pos.get(self.log_file.name, 0) == end_pos - len(data):
+                    self._log_pos[self.log_file.name] = end_pos
+            except (OSError, IOError):
+                pass
+        self.maybe_compact()
+
+    def clear_frames(self, frames_by_eye: Dict[str, List[int]]) -> int:
+        """완료 해제 (재처리 유도) - 잠금 아래에서 로그를 합친 스냅샷에 반영
+
+        Returns:
+            실제로 완료 상태였다가 해제된 프레임 수
+
+        Raises:
+            TimeoutError: 잠금을 잡지 못함 (아무것도 해제하지 않음)
+            OSError: 스냅샷 저장 실패 또는 저장 전에 잠금을 잃음
+        """
+        with self._lock:
+            if not self._acquire_file_lock(blocking=True):
+                raise TimeoutError(f"완료 기록 잠금 획득 실패: {self.lock_file}")
+            try:
+                self.refresh(force=True)
+                cleared = 0
+                for eye, frames in frames_by_eye.items():
+                    for frame_idx in frames:
+                        cleared += self._clear_bit(eye, frame_idx)
+                if not self._save_snapshot():
+                    self._loaded_at = 0.0  # 메모리에서만 지운 비트는 다음 조회 때 스냅샷에서 복원
+                    raise OSError(f"완료 기록 저장 실패: {self.manifest_file}")
+                return cleared
+            finally:
+                self._release_file_lock()
+
+    def reset(self):
+        """모든 완료 해제 (잠금 획득/저장 실패 시 clear_frames와 같은 예외)"""
+        with self._lock:
+            if not self._acquire_file_lock(blocking=True):
+                raise TimeoutError(f"완료 기록 잠금 획득 실패: {self.lock_file}")
+            try:
+                self.refresh(force=True)
+                self._bitmaps = {}
+                self._counts = {}
+                if not self._save_snapshot():
+                    self._loaded_at = 0.0
+                    raise OSError(f"완료 기록 저장 실패: {self.manifest_file}")
+            finally:
+                self._release_file_lock()
+
+    def maybe_compact(self):
+        """스냅샷 이후 로그가 충분히 쌓였으면 압축 (잠금을 못 잡으면 다음 기회로)"""
+        with self._lock:
+            pending = sum(max(0, size - self._snapshot_offsets.get(name, 0))
+                          for name, size in self._log_sizes().items())
+        if pending >= self.compact_bytes:
+            self.compact(blocking=False)
+
+    def compact(self, blocking: bool = True) -> bool:
+        """모든 로그를 스냅샷에 합쳐 저장 (이후 읽기는 스냅샷 + 짧은 tail)"""
+        with self._lock:
+            if not self._acquire_file_lock(blocking):
+                return False
+            try:
+                self.refresh(force=True)
+                return self._save_snapshot()
+            finally:
+                self._release_file_lock()
+
+    # ===== 갱신 =====
+
+    def refresh(self, force: bool = False):
+        """TTL이 지났으면 스냅샷 변경 + 다른 호스트 로그 반영"""
+        with self._lock:
+            if not force and self._loaded_at and time.time() - self._loaded_at < self.ttl_sec:
+                return
+            try:
+                mtime_ns = self.manifest_file.stat().st_mtime_ns
+            except (OSError, IOError):
+                mtime_ns = None
+            sizes = self._log_sizes()
+
+            # 스냅샷이 바뀌었거나 로그가 줄었으면(작업 삭제/리셋) 처음부터 다시 읽음
+            shrunk = any(sizes.get(name, 0) < pos for name, pos in self._log_pos.items())
+            if mtime_ns != self._snapshot_mtime_ns or shrunk:
+                self._load_snapshot(mtime_ns)
+            self._tail_logs(sizes)
+            self._loaded_at = time.time()
+
+    # ===== 내부 =====
+
+    def _set_range(self, eye: str, start: int, end: int):
+        bitmap = self._bitmaps.setdefault(eye, bytearray())
+        need = (end >> 3) + 1
+        if len(bitmap) < need:
+            bitmap.extend(bytes(need - len(bitmap)))
+        added = 0
+        for frame_idx in range(max(0, start), end + 1):
+            mask = 1 << (frame_idx & 7)
+            if not bitmap[frame_idx >> 3] & mask:
+                bitmap[frame_idx >> 3] |= mask
+                added += 1
+        self._counts[eye] = self._counts.get(eye, 0) + added
+
+    def _clear_bit(self, eye: str, frame_idx: int) -> int:
+        bitmap = self._bitmaps.get(eye)
+        byte = frame_idx >> 3
+        mask = 1 << (frame_idx & 7)
+        if bitmap is None or frame_idx < 0 or byte >= len(bitmap) or not bitmap[byte] & mask:
+            return 0
+        bitmap[byte] &= ~mask & 0xFF
+        self._counts[eye] -= 1
+        return 1
+
+    def _log_sizes(self) -> Dict[str, int]:
+        """호스트 로그 목록과 크기 (작업 폴더만 나열 - 파일 몇 개)"""
+        sizes = {}
+        try:
+            with os.scandir(self.job_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".log"):
+                        sizes[entry.name] = entry.stat().st_size
+        except (OSError, IOError):
+            pass
+        return sizes
+
+    def _tail_logs(self, sizes: Dict[str, int]):
+        """반영된 오프셋 이후의 로그 줄만 읽어 OR"""
+        for name, size in sizes.items():
+            pos = self._log_pos.get(name, 0)
+            if size <= pos:
+                continue
+            try:
+                with open(self.job_dir / name, "rb") as f:
+                    f.seek(pos)
+                    data = f.read(size - pos)
+            except (OSError, IOError):
+                continue
+            # 마지막 줄이 쓰는 중일 수 있으므로 완전한 줄까지만 반영
+            complete = data.rfind(b"\n") + 1
+            for line in data[:complete].decode("utf-8", errors="replace").splitlines():
+                parts = line.split("\t")
+                if len(parts) != 3:
+                    continue
+                try:
+                    self._set_range(parts[0], int(parts[1]), int(parts[2]))
+                except ValueError:
+                    continue
+            self._log_pos[name] = pos + complete
+
+    def _load_snapshot(self, mtime_ns: Optional[int]):
+        """manifest.json 로드 (없으면 빈 상태에서 로그 전체 반영)"""
+        self._bitmaps = {}
+        self._counts = {}
+        self._log_pos = {}
+        self._snapshot_offsets = {}
+        self._snapshot_mtime_ns = mtime_ns
+        if mtime_ns is None:
+            return
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, IOError, json.JSONDecodeError):
+            self._snapshot_mtime_ns = None  # 쓰는 중 - 다음 refresh에서 재시도
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            return
+        for eye, encoded in data.get("bitmaps", {}).items():
+            bitmap = bytearray(base64.b64decode(encoded))
+            self._bitmaps[eye] = bitmap
+            self._counts[eye] = int.from_bytes(bitmap, "little").bit_count()
+        self._snapshot_offsets = dict(data.get("log_offsets", {}))
+        self._log_pos = dict(self._snapshot_offsets)
+
+    def _save_snapshot(self) -> bool:
+        """현재 상태(반영된 로그 오프셋 포함)를 임시 파일에 쓰고 원자적 교체
+
+        교체 직전에 잠금이 아직 내 것인지 확인 (오래된 잠금으로 판정돼 빼앗겼으면 쓰지 않음)
+        """
+        offsets = dict(self._log_pos)
+        data = {
+            "version": MANIFEST_VERSION,
+            "compacted_at": time.time(),
+            "log_offsets": offsets,
+            "bitmaps": {eye: base64.b64encode(bytes(b)).decode("ascii") for eye, b in self._bitmaps.items()},
+        }
+        try:
+            self.job_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = self.job_dir / f"{MANIFEST_FILE_NAME}.{socket.gethostname()}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            if not self._owns_file_lock():
+                temp_file.unlink(missing_ok=True)
+                return False
+            temp_file.replace(self.manifest_file)
+            self._snapshot_mtime_ns = self.manifest_file.stat().st_mtime_ns
+            self._snapshot_offsets = offsets
+            return True
+        except (OSError, IOError):
+            return False
+
+    def _acquire_file_lock(self, blocking: bool) -> bool:
+        """compact.lock 배타 생성 - 내용은 이번 보유자만의 토큰 (오래된 잠금은 치우고 재시도)"""
+        token = f"{socket.gethostname()}.{os.getpid()}.{threading.get_ident()}.{uuid.uuid4().hex}"
+        deadline = time.monotonic() + LOCK_WAIT_SEC
+        share_now, share_checked = None, 0.0
+        while True:
+            try:
+                self.job_dir.mkdir(parents=True, exist_ok=True)
+                with open(self.lock_file, "x", encoding="utf-8") as f:
+                    f.write(token)
+                self._lock_token = token
+                return True
+            except FileExistsError:
+                # 나이는 공유 폴더 시각끼리 비교 (호스트 간 시계 차이와 무관)
+                if time.monotonic() - share_checked >= SHARE_CLOCK_INTERVAL_SEC:
+                    share_now, share_checked = self._share_time(), time.monotonic()
+                if share_now is not None and self._remove_stale_lock(share_now):
+                    share_checked = 0.0
+                    continue
+            except (OSError, IOError):
+                return False
+            if not blocking or time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+
+    def _share_time(self) -> Optional[float]:
+        """공유 폴더 기준 현재 시각 (프로브 파일을 써서 그 mtime을 읽음)"""
+        try:
+            with open(self.clock_file, "w", encoding="utf-8") as f:
+                f.write(str(time.time()))
+            return self.clock_file.stat().st_mtime
+        except (OSError, IOError):
+            return None
+        finally:
+            try:
+                self.clock_file.unlink(missing_ok=True)
+            except (OSError, IOError):
+                pass
+
+    def _remove_stale_lock(self, share_now: float) -> bool:
+        """LOCK_STALE_SEC보다 오래된 잠금 제거
+
+        다른 대기자가 먼저 치우고 새 잠금을 만들었을 수 있으므로 고유 이름으로 rename한 뒤
+        옮겨진 파일의 토큰이 오래됐다고 본 그 잠금일 때만 지우고, 아니면 제자리로 되돌린다.
+        """
+        try:
+            if share_now - self.lock_file.stat().st_mtime <= LOCK_STALE_SEC:
+                return False
+            stale_token = self.lock_file.read_text(encoding="utf-8")
+        except (OSError, IOError):
+            return False
+        tomb = self.job_dir / f"{LOCK_FILE_NAME}.{socket.gethostname()}.{os.getpid()}.{uuid.uuid4().hex}.stale"
+        try:
+            os.rename(self.lock_file, tomb)
+        except (OSError, IOError):
+            return False  # 다른 대기자가 먼저 치움
+        try:
+            if tomb.read_text(encoding="utf-8") != stale_token:
+                try:
+                    os.link(tomb, self.lock_file)  # 새 잠금을 옮긴 경우 - 덮어쓰지 않고 복원
+                except (OSError, IOError):
+                    pass
+            tomb.unlink(missing_ok=True)
+        except (OSError, IOError):
+            pass
+        return True
+
+    def _owns_file_lock(self) -> bool:
+        try:
+            return bool(self._lock_token) and self.lock_file.read_text(encoding="utf-8") == self._lock_token
+        except (OSError, IOError):
+            return False
+
+    def _release_file_lock(self):
+        """내 토큰이 든 잠금만 삭제 (빼앗겨 다른 보유자가 만든 잠금은 그대로 둠)"""
+        try:
+            if self._owns_file_lock():
+                self.lock_file.unlink(missing_ok=True)
+        except (OSError, IOError):
+            pass
+        self._lock_token = ""
+
+
+# ===== 프로세스 전역 레지스트리 =====
+
+_manifests: Dict[str, CompletionManifest] = {}
+_manifests_lock = threading.Lock()
+
+
+def get_completion_manifest(job_dir: Path, ttl_sec: float = 2.0,
+                            compact_bytes: int = 16 * 1024) -> CompletionManifest:
+    """작업 폴더별 CompletionManifest 싱글톤"""
+    key = os.path.normcase(os.path.abspath(str(job_dir)))
+    with _manifests_lock:
+        manifest = _manifests.get(key)
+        if manifest is None:
+            manifest = CompletionManifest(Path(job_dir), ttl_sec, compact_bytes)
+            _manifests[key] = manifest
+        return manifest
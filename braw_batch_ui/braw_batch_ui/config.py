@@ -21,25 +21,66 @@ SUBPROCESS_TIMEOUT_ACES_SEC = 90  # ACES 색공간 변환 시 타임아웃
 # CLAIM_TIMEOUT_SEC > SUBPROCESS_TIMEOUT_ACES_SEC + 여유시간(30초)
 CLAIM_TIMEOUT_SEC = 120  # 프레임 클레임 타임아웃 (90초 → 120초)
 CLIP_INFO_TIMEOUT_SEC = 10  # 클립 정보 조회 타임아웃
+CLIP_PROBE_WORKERS = 4  # 동시에 실행하는 클립 정보 조회(--info) 프로세스 수
+CLIP_METADATA_RETRY_SEC = 60  # farm.db 클립 메타데이터 캐시 연결 실패 후 재시도 간격
+CLIP_METADATA_BUSY_TIMEOUT_SEC = 1.5  # 클립 메타데이터 캐시의 DB 잠금 대기 (GUI 스레드에서도 호출 - 넘으면 캐시 없이 조회)
 
 # 로그 관련
 LOG_MAX_LINES = 5000  # 로그 위젯 최대 라인 수
+LOG_RING_RECORDS = 50000  # 메모리에 두는 최근 로그 기록 수 (검색/레벨 변경 시 다시 그리는 원본)
+LOG_PENDING_MAX = 5000  # 위젯 표시 대기 최대 기록 수 (넘치면 표시만 생략 - 파일/검색에는 남음)
+LOG_FLUSH_INTERVAL_MS = 200  # 로그 위젯 갱신 주기
+LOG_FLUSH_MAX_RECORDS = 500  # 한 번 갱신에 추가하는 최대 기록 수 (초당 표시 한도 = 이 값 * 1000 / 주기)
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024  # 워커 로그 파일 회전 크기 (로컬 디스크)
+LOG_FILE_BACKUP_COUNT = 5  # 회전 보관 파일 수
+LOG_SEARCH_MAX_RESULTS = 2000  # 로그 검색 최대 표시 줄 수
 
 # 파일 검증
-MIN_FILE_SIZE_RATIO = 0.7  # 평균 대비 최소 파일 크기 비율 (70%)
+MIN_FILE_SIZE_RATIO = 0.7  # 기준 크기(이동 중앙값) 대비 최소 파일 크기 비율 (70%)
+OUTLIER_WINDOW_FRAMES = 31  # 이동 중앙값 윈도우 (실패 배치 10프레임이 연속돼도 기준이 흔들리지 않도록)
+OUTLIER_MAD_THRESHOLD = 5.0  # 기준 대비 잔차가 MAD의 몇 배를 넘어야 손상으로 볼지
+SEQ_INDEX_TTL_SEC = 5.0  # 출력 폴더 시퀀스 인덱스 재확인 간격 (다른 워커 기록 반영 주기)
+COMPLETION_MANIFEST_TTL_SEC = 2.0  # 작업별 완료 매니페스트 재확인 간격 (다른 워커 완료 반영 주기)
+COMPLETION_COMPACT_BYTES = 16 * 1024  # 스냅샷 이후 완료 로그가 이만큼 쌓이면 스냅샷으로 압축
+DIR_SNAPSHOT_TTL_SEC = 3.0  # claims/, completed/ 목록 캐시 재확인 간격 (다른 워커 클레임 반영 주기)
+JOB_CACHE_TTL_SEC = 1.0  # jobs/ 폴더 재확인 간격 (바뀐 작업 파일만 다시 파싱)
+EVENT_JOURNAL_MAX_BYTES = 4 * 1024 * 1024  # 워커 이벤트 저널 파일 최대 크기 (넘으면 새 파일)
+STATUS_FULL_SYNC_SEC = 60.0  # 상태 스레드 전체 동기화 간격 (그 사이에는 이벤트 저널 변화만 반영)
+FARM_LAYOUT_VERSION = 3  # 팜 폴더 구조 버전 (2: claims/<job_id>/, completed/<job_id>/, 3: tickets/ 범위 티켓 큐)
+
+# 이미지 QC (선택 단계 - numpy 필요, EXR은 OpenEXR 필요)
+QC_SUBSAMPLE_STEP = 8  # 서브샘플 격자 간격 (픽셀) - 8이면 1/64만 분석
+QC_BLACK_LEVEL = 0.002  # 이 값 이하 픽셀은 검정으로 간주
+QC_BLACK_RATIO = 0.995  # 검정 픽셀 비율이 이 이상이면 검은 프레임
+QC_CLIPPED_RATIO = 0.5  # 모든 채널이 클립된 픽셀 비율이 이 이상이면 클리핑 프레임
+QC_EXR_CLIP_LEVEL = 65504.0  # EXR half 최대값 (이 이상은 클립/오버플로)
+QC_FLAT_STDDEV = 1e-4  # 채널 표준편차가 모두 이 이하이면 단색 프레임
+QC_PROCESS_WORKERS = 2  # QC 프로세스 수 (렌더 슬롯 CPU를 크게 뺏지 않도록)
+QC_MAX_PENDING = 500  # 대기 중 QC가 이보다 많으면 새 프레임은 건너뜀 (렌더 속도 우선)
+QC_MAX_RERENDERS = 1  # QC 이상으로 프레임을 다시 렌더하는 최대 횟수 (렌더 실패 retry_count와 별도)
+
+# SBS 조립 (L/R 출력을 이어 붙여 SBS 생성 - numpy 필요, EXR은 OpenEXR 필요)
+SBS_ASSEMBLY_WORKERS = 2  # 조립 프로세스 수 (디스크 I/O 위주라 적게)
+SBS_ASSEMBLY_MAX_RETRIES = 2  # 조립이 이 횟수만큼 실패한 SBS 프레임은 CLI 디코딩으로 처리
+
+# V2 UI 상태 갱신
+UI_STATUS_POLL_SEC = 1.0  # 작업/워커 변경 확인 간격 (PRAGMA data_version만 읽음 - 바뀌었을 때만 조회, UI가 이전 결과를 그리는 중이면 건너뜀)
+UI_STATUS_FULL_REFRESH_SEC = 30.0  # 변경이 없어도 다시 조회하는 간격 (경과 시간, 워커 오프라인 판정 갱신)
+UI_JOB_PAGE_SIZE = 200  # 작업 목록 한 페이지 작업 수 (이 수만큼만 DB에서 읽고 진행률 집계)
+STATUS_PUBLISH_INTERVAL_SEC = 3.0  # 현황 스냅샷 발행 최소 간격 (변경이 있을 때만 다시 집계)
+STATUS_PUBLISHER_LEASE_TTL_SEC = 30.0  # 발행 담당 리스 만료 시간 (발행자가 꺼지면 다른 UI가 넘겨받음)
+STATUS_SNAPSHOT_STALE_SEC = 90.0  # 스냅샷이 이보다 오래되면 읽지 않고 DB 직접 조회
+
+# V1 → V2 이전 (v1_import)
+V1_IMPORT_BATCH_ROWS = 200_000  # 트랜잭션 하나에 넣는 프레임 행 수 (작업 경계에서만 나눔 - 더 큰 작업은 단독 트랜잭션)
 
 # ===== 15대 동시 운영 최적화 설정 =====
 
 # 파일 I/O 재시도 설정
 FILE_IO_MAX_RETRIES = 3  # 파일 읽기/쓰기 최대 재시도 횟수
-FILE_IO_RETRY_DELAY_BASE = 0.1  # 재시도 기본 딜레이 (초)
+FILE_IO_RETRY_DELAY_BASE = 0.1  # 재시도 기본 딜레이 (초, 공유 폴더 왕복 시간을 측정하기 전까지만 사용)
 FILE_IO_RETRY_DELAY_MAX = 1.0  # 재시도 최대 딜레이 (초)
 
-# 클레임 충돌 방지 설정
-CLAIM_RANDOM_DELAY_MIN = 0.01  # 클레임 시 최소 랜덤 딜레이 (초)
-CLAIM_RANDOM_DELAY_MAX = 0.05  # 클레임 시 최대 랜덤 딜레이 (초)
-CLAIM_VERIFY_DELAY = 0.02  # 클레임 검증 딜레이 (초)
-
 # 작업 분산 설정 (15대가 같은 프레임으로 몰리지 않도록)
 FRAME_SEARCH_RANDOM_START = False  # 프레임 검색 시 순차 시작 (True: 랜덤 분산)
 FRAME_SEARCH_BATCH_SIZE = 50  # 한 번에 검색할 프레임 범위
@@ -47,6 +88,12 @@ FRAME_SEARCH_BATCH_SIZE = 50  # 한 번에 검색할 프레임 범위
 # 범위 기반 배치 처리 설정 (새 CLI 인터페이스)
 BATCH_FRAME_SIZE = 10  # 한 번에 처리할 프레임 수 (5프레임 단위 - 12워커 시 60프레임/1초)
 BATCH_CLAIM_TIMEOUT_SEC = 600  # 배치 클레임 타임아웃 (12워커 동시 실행 시 I/O 경쟁 고려, 10분)
+WORKER_SLOT_WAIT_SEC = 1.0  # V1 워커가 범위 완료를 기다리는 최대 시간 (이후 빈 슬롯/중지 요청 재확인)
+WORKER_JOB_SCAN_INTERVAL_SEC = 5.0  # V1 워커 미완료 작업 목록 재확인 간격
+JOB_PRIORITY_DEFAULT = 50  # 작업 우선순위 기본값 (높을수록 먼저 - 높은 우선순위 작업에 남은 범위가 있으면 낮은 작업은 클레임 안함)
+JOB_WEIGHT_DEFAULT = 1.0  # 같은 우선순위 작업 간 워커 배분 비율 기본값 (실행 중 범위 수 / 가중치가 낮은 작업 우선)
+JANITOR_INTERVAL_SEC = 30.0  # 클레임 만료 정리 주기 (리스를 가진 워커 한 대만 실행)
+JANITOR_LEASE_TTL_SEC = 120.0  # 정리 담당 리스 만료 시간 (담당 워커가 죽으면 이후 다른 워커가 넘겨받음)
 
 # 프레임 처리 타임아웃 설정
 FRAME_BASE_TIMEOUT_SEC = 300  # 기본 타임아웃 (5분)
@@ -54,7 +101,6 @@ FRAME_PER_FRAME_TIMEOUT_SEC = 60  # 프레임당 추가 타임아웃 (1분)
 FRAME_SBS_MULTIPLIER = 2  # SBS 처리 시 타임아웃 배수
 
 # 네트워크 파일시스템 안정성
-NFS_WRITE_SYNC_DELAY = 0.01  # 쓰기 후 동기화 대기 (초)
 NFS_READ_RETRY_ON_EMPTY = True  # 빈 파일 읽기 시 재시도
 
 
@@ -98,6 +144,12 @@ class FarmSettings:
         self.seqchecker_auto_scan = False  # 작업 완료 후 자동 스캔 (수동 스캔만 사용)
         self.seqchecker_auto_rerender = False  # 오류 프레임 자동 재렌더 잡 생성
 
+        # 이미지 QC 설정
+        self.qc_enabled = False  # 렌더 완료 후 이미지 QC 및 이상 프레임 재렌더
+
+        # SBS 조립 설정
+        self.sbs_assembly_enabled = True  # L/R 완료 프레임은 디코딩 대신 조립으로 SBS 생성
+
         # 설정 파일 경로 (로컬 - 내 문서)
         # Windows: C:\Users\사용자명\Documents\BRAW Farm\config.json
         # 다른 OS: ~/Documents/BRAW Farm/config.json
@@ -142,6 +194,10 @@ class FarmSettings:
                         self.seqchecker_path = data.get("seqchecker_path", self.seqchecker_path)
                         self.seqchecker_auto_scan = data.get("seqchecker_auto_scan", self.seqchecker_auto_scan)
                         self.seqchecker_auto_rerender = data.get("seqchecker_auto_rerender", self.seqchecker_auto_rerender)
+                        # 이미지 QC 설정
+                        self.qc_enabled = data.get("qc_enabled", self.qc_enabled)
+                        # SBS 조립 설정
+                        self.sbs_assembly_enabled = data.get("sbs_assembly_enabled", self.sbs_assembly_enabled)
                 except (json.JSONDecodeError, OSError) as e:
                     print(f"설정 로드 실패: {e}")
 
@@ -177,7 +233,9 @@ class FarmSettings:
                     "batch_frame_size": self.batch_frame_size,
                     "seqchecker_path": self.seqchecker_path,
                     "seqchecker_auto_scan": self.seqchecker_auto_scan,
-                    "seqchecker_auto_rerender": self.seqchecker_auto_rerender
+                    "seqchecker_auto_rerender": self.seqchecker_auto_rerender,
+                    "qc_enabled": self.qc_enabled,
+                    "sbs_assembly_enabled": self.sbs_assembly_enabled
                 }
 
                 with open(self.config_file, 'w', encoding='utf-8') as f:
@@ -211,7 +269,9 @@ class FarmSettings:
             "batch_frame_size": self.batch_frame_size,
             "seqchecker_path": self.seqchecker_path,
             "seqchecker_auto_scan": self.seqchecker_auto_scan,
-            "seqchecker_auto_rerender": self.seqchecker_auto_rerender
+            "seqchecker_auto_rerender": self.seqchecker_auto_rerender,
+            "qc_enabled": self.qc_enabled,
+            "sbs_assembly_enabled": self.sbs_assembly_enabled
         }
 
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 디렉토리 스냅샷 캐시
+claims/, completed/ 같은 공유 폴더를 os.scandir 한 번으로 읽어 이름 → mtime을 메모리에 두고,
+짧은 TTL 동안 모든 존재 확인을 캐시에서 응답 (파일별 exists()/stat() 네트워크 호출 대체)
+
+이 워커가 만들거나 지운 파일은 즉시 반영(write-through)하고,
+다른 워커의 변경은 다음 scandir(최대 TTL 후)에 반영된다.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class DirectorySnapshot:
+    """폴더 하나의 이름 목록 캐시 (스레드 안전)"""
+
+    def __init__(self, folder: Path, ttl_sec: float = 3.0):
+        self.folder = Path(folder)
+        self.ttl_sec = ttl_sec
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, float] = {}  # 이름 -> mtime
+        self._dirs = set()  # 하위 폴더 이름
+        self._loaded_at = 0.0
+
+        # 통계
+        self.scandir_passes = 0
+        self.lookups = 0
+        self.stat_calls_avoided = 0
+
+    # ===== 조회 =====
+
+    def exists(self, name: str) -> bool:
+        """파일 존재 여부 (캐시 응답)"""
+        scanned = self.refresh()
+        with self._lock:
+            self.lookups += 1
+            if not scanned:
+                self.stat_calls_avoided += 1
+            return name in self._entries
+
+    def mtime(self, name: str) -> Optional[float]:
+        """파일 mtime (없으면 None) - scandir 항목 정보라 Windows/SMB에서는 추가 호출 없음"""
+        scanned = self.refresh()
+        with self._lock:
+            self.lookups += 1
+            if not scanned:
+                self.stat_calls_avoided += 1
+            return self._entries.get(name)
+
+    def names(self, prefix: str = "", suffix: str = "") -> List[str]:
+        """접두어/접미어가 맞는 이름 목록 (glob 대체)"""
+        self.refresh()
+        with self._lock:
+            return [n for n in self._entries if n.startswith(prefix) and n.endswith(suffix)]
+
+    def dirs(self) -> List[str]:
+        """하위 폴더 이름 목록"""
+        self.refresh()
+        with self._lock:
+            return list(self._dirs)
+
+    # ===== 쓰기 반영 =====
+
+    def add(self, name: str, mtime: float = None, is_dir: bool = False):
+        """이 워커가 만든 파일/폴더 반영"""
+        with self._lock:
+            self._entries[name] = time.time() if mtime is None else mtime
+            if is_dir:
+                self._dirs.add(name)
+
+    def discard(self, name: str):
+        """이 워커가 지운 파일 반영"""
+        with self._lock:
+            self._entries.pop(name, None)
+            self._dirs.discard(name)
+
+    # ===== 갱신 =====
+
+    def refresh(self, force: bool = False) -> bool:
+        """TTL이 지났으면 scandir로 다시 읽기 (다시 읽었으면 True)"""
+        with self._lock:
+            if not force and self._loaded_at and time.time() - self._loaded_at < self.ttl_sec:
+                return False
+            entries = {}
+            dirs = set()
+            try:
+                with os.scandir(self.folder) as it:
+                    for entry in it:
+                        try:
+                            entries[entry.name] = entry.stat().st_mtime
+                            if entry.is_dir():
+                                dirs.add(entry.name)
+                        except (OSError, IOError):
+                            continue  # 나열 직후 삭제됨
+            except FileNotFoundError:
+                pass  # 아직 없는 폴더 (작업별 클레임 폴더 등) - 빈 목록
+            except (OSError, IOError):
+                return False  # 네트워크 오류 - 이전 목록 유지, 다음 호출에서 재시도
+            self._entries = entries
+            self._dirs = dirs
+            self._loaded_at = time.time()
+            self.scandir_passes += 1
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "scandir_passes": self.scandir_passes,
+                "lookups": self.lookups,
+                "stat_calls_avoided": self.stat_calls_avoided,
+            }
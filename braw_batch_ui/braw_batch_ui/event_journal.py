@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 워커 이벤트 저널
+워커마다 events/ 아래 자기 파일에만 이벤트를 한 줄씩 append (claimed, completed, failed, heartbeat ...)
+상태 표시 쪽은 파일별 읽은 위치를 기억해 새로 붙은 줄만 읽는다 (갱신 비용 = 새 이벤트 수)
+
+파일 이름: {worker_id}.{시작 시각}.log
+- 워커가 시작할 때마다, 또는 max_bytes를 넘으면 새 파일로 넘어감 (기존 파일은 자르지 않음)
+- keep_sec보다 오래 쓰지 않은 자기 이전 파일은 새 파일로 넘어갈 때 삭제
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# 이벤트 종류
+EVENT_HEARTBEAT = "heartbeat"
+EVENT_CLAIMED = "claimed"
+EVENT_COMPLETED = "completed"
+EVENT_FAILED = "failed"
+EVENT_RELEASED = "released"
+EVENT_RESET = "reset"  # 작업 완료 기록 초기화/부분 삭제 (리셋, 재처리 예약)
+
+JOURNAL_SUFFIX = ".log"
+
+
+class EventJournal:
+    """이 워커의 이벤트 저널 (쓰기 전용, 스레드 안전)"""
+
+    def __init__(self, folder: Path, worker_id: str, max_bytes: int = 4 * 1024 * 1024,
+                 keep_sec: float = 600.0):
+        self.folder = Path(folder)
+        self.worker_id = worker_id
+        self.max_bytes = max_bytes
+        self.keep_sec = keep_sec
+
+        self._lock = threading.Lock()
+        self._path = None
+        self._size = 0
+
+    def _open_new_file(self):
+        """새 저널 파일로 넘어가고 오래된 이전 파일 정리"""
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self._path = self.folder / f"{self.worker_id}.{time.time_ns()}{JOURNAL_SUFFIX}"
+        self._size = 0
+        prefix = f"{self.worker_id}."
+        now = time.time()
+        try:
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    if not entry.name.startswith(prefix) or entry.name == self._path.name:
+                        continue
+                    try:
+                        if now - entry.stat().st_mtime > self.keep_sec:
+                            os.unlink(entry.path)
+                    except (OSError, IOError):
+                        pass
+        except (OSError, IOError):
+            pass
+
+    def append(self, event: str, **fields: Any):
+        """이벤트 한 줄 append (네트워크 오류는 무시 - 저널은 표시용)"""
+        record = {"ts": round(time.time(), 3), "w": self.worker_id, "ev": event}
+        record.update(fields)
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            try:
+                if self._path is None or self._size + len(line) > self.max_bytes:
+                    self._open_new_file()
+                fd = os.open(self._path, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+                try:
+                    os.write(fd, line)
+                finally:
+                    os.close(fd)
+                self._size += len(line)
+            except (OSError, IOError):
+                pass
+
+
+class JournalTailer:
+    """모든 워커 저널의 새 줄 읽기 (상태 스레드 전용)
+
+    처음 poll()은 기존 내용을 건너뛰고 현재 끝 위치만 기억 (시작 시 상태는 전체 동기화로 채움)
+    """
+
+    def __init__(self, folder: Path):
+        self.folder = Path(folder)
+        self._offsets: Dict[str, int] = {}  # 파일 이름 -> 읽은 위치 (완전한 줄까지)
+        self._started = False
+
+    def poll(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """새 이벤트 읽기
+
+        Returns:
+            (이벤트 목록, 전체 동기화 필요 여부) - 파일이 줄어들었거나 처음 호출이면 True
+        """
+        sizes = {}
+        try:
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    if entry.name.endswith(JOURNAL_SUFFIX):
+                        try:
+                            sizes[entry.name] = entry.stat().st_size
+                        except (OSError, IOError):
+                            continue
+        except FileNotFoundError:
+            pass
+        except (OSError, IOError):
+            return [], False  # 네트워크 오류 - 다음 호출에서 재시도
+
+        if not self._started:
+            self._offsets = sizes
+            self._started = True
+            return [], True
+
+        events = []
+        resync = False
+        offsets = {}
+        for name, size in sizes.items():
+            offset = self._offsets.get(name, 0)  # 새로 생긴 파일은 처음부터
+            if size < offset:
+                resync = True  # 잘리거나 다시 만들어짐
+                offsets[name] = size
+                continue
+            if size > offset:
+                offset += self._read_lines(self.folder / name, offset, size, events)
+            offsets[name] = offset
+        self._offsets = offsets  # 사라진 파일은 잊음
+        return events, resync
+
+    @staticmethod
+    def _read_lines(path: Path, offset: int, size: int, events: List[Dict[str, Any]]) -> int:
+        """offset부터 완전한 줄만 파싱해 events에 추가 (읽은 바이트 수 반환, 마지막 미완성 줄은 다음에)"""
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read(size - offset)
+        except (OSError, IOError):
+            return 0
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                events.append(json.loads(line))
+            except (ValueError, UnicodeDecodeError):
+                continue  # 손상된 줄 무시
+        return end
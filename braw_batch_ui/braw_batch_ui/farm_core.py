@@ -5,11 +5,13 @@ BRAW Render Farm Core
 """
 
 import json
+import os
 import random
+import shutil
 import socket
 import time
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Any
 from datetime import datetime
 import threading
 import psutil
@@ -20,56 +22,99 @@ from config import (
     WORKER_TIMEOUT_SEC,
     CLAIM_TIMEOUT_SEC,
     MIN_FILE_SIZE_RATIO,
+    OUTLIER_WINDOW_FRAMES,
+    OUTLIER_MAD_THRESHOLD,
+    SEQ_INDEX_TTL_SEC,
+    COMPLETION_MANIFEST_TTL_SEC,
+    COMPLETION_COMPACT_BYTES,
+    DIR_SNAPSHOT_TTL_SEC,
+    JOB_CACHE_TTL_SEC,
+    EVENT_JOURNAL_MAX_BYTES,
+    FARM_LAYOUT_VERSION,
     FILE_IO_MAX_RETRIES,
     FILE_IO_RETRY_DELAY_BASE,
     FILE_IO_RETRY_DELAY_MAX,
-    CLAIM_RANDOM_DELAY_MIN,
-    CLAIM_RANDOM_DELAY_MAX,
-    CLAIM_VERIFY_DELAY,
     FRAME_SEARCH_RANDOM_START,
-    FRAME_SEARCH_BATCH_SIZE,
-    NFS_WRITE_SYNC_DELAY,
     NFS_READ_RETRY_ON_EMPTY,
     BATCH_FRAME_SIZE,
     BATCH_CLAIM_TIMEOUT_SEC,
+    JANITOR_INTERVAL_SEC,
+    JANITOR_LEASE_TTL_SEC,
+    JOB_PRIORITY_DEFAULT,
+    JOB_WEIGHT_DEFAULT,
+)
+from size_outliers import detect_grouped_outliers
+from seq_index import get_sequence_index, SequenceIndex, STATUS_GONE
+from completion_manifest import get_completion_manifest, CompletionManifest
+from dir_snapshot import DirectorySnapshot
+from lease import FileLease
+from job_cache import JobFileCache
+from event_journal import (
+    EventJournal, EVENT_HEARTBEAT, EVENT_CLAIMED, EVENT_COMPLETED, EVENT_FAILED, EVENT_RELEASED, EVENT_RESET,
+)
+from render_audit import (
+    AuditLog, load_audit_dir, build_duplicate_report, render_target, frames_to_ranges,
+    CAUSE_REPAIR, CAUSE_RESET,
 )
 
 
 # ===== 15대 동시 운영을 위한 유틸리티 함수 =====
 
+class ShareLatency:
+    """공유 폴더 파일 작업 왕복 시간 추정 (EWMA) - 고정 sleep 대신 재시도 대기 시간을 측정값에서 계산"""
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.ewma = 0.0  # 초 (아직 측정 전이면 0)
+        self.samples = 0
+
+    def record(self, seconds: float):
+        """측정값 반영"""
+        self.ewma = seconds if self.samples == 0 else self.ewma + self.alpha * (seconds - self.ewma)
+        self.samples += 1
+
+    def retry_delay(self, attempt: int) -> float:
+        """재시도 대기 시간 - 왕복 시간의 2배에서 시작해 지수 증가 (+지터, 상한 FILE_IO_RETRY_DELAY_MAX)"""
+        base = 2 * self.ewma if self.samples else FILE_IO_RETRY_DELAY_BASE
+        delay = min(base * (2 ** attempt), FILE_IO_RETRY_DELAY_MAX)
+        return delay * random.uniform(0.5, 1.0)
+
+
+share_latency = ShareLatency()
+
+
 def safe_json_read(file_path: Path, default=None) -> Optional[Dict]:
     """안전한 JSON 읽기 (재시도 + 네트워크 파일시스템 대응)"""
     for attempt in range(FILE_IO_MAX_RETRIES):
         try:
-            if not file_path.exists():
-                return default
-
+            started = time.perf_counter()
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
+            share_latency.record(time.perf_counter() - started)
 
             # 빈 파일 처리 (네트워크 지연으로 인한 부분 쓰기)
             if not content.strip():
                 if NFS_READ_RETRY_ON_EMPTY and attempt < FILE_IO_MAX_RETRIES - 1:
-                    delay = min(FILE_IO_RETRY_DELAY_BASE * (2 ** attempt), FILE_IO_RETRY_DELAY_MAX)
-                    time.sleep(delay)
+                    time.sleep(share_latency.retry_delay(attempt))
                     continue
                 return default
 
             return json.loads(content)
 
+        except FileNotFoundError:
+            return default
+
         except json.JSONDecodeError:
             # JSON 손상 - 재시도
             if attempt < FILE_IO_MAX_RETRIES - 1:
-                delay = min(FILE_IO_RETRY_DELAY_BASE * (2 ** attempt), FILE_IO_RETRY_DELAY_MAX)
-                time.sleep(delay)
+                time.sleep(share_latency.retry_delay(attempt))
                 continue
             return default
 
         except (OSError, IOError) as e:
             # 파일 접근 오류 - 재시도
             if attempt < FILE_IO_MAX_RETRIES - 1:
-                delay = min(FILE_IO_RETRY_DELAY_BASE * (2 ** attempt), FILE_IO_RETRY_DELAY_MAX)
-                time.sleep(delay)
+                time.sleep(share_latency.retry_delay(attempt))
                 continue
             return default
 
@@ -77,31 +122,26 @@ def safe_json_read(file_path: Path, default=None) -> Optional[Dict]:
 
 
 def safe_json_write(file_path: Path, data: Dict, use_temp: bool = True) -> bool:
-    """안전한 JSON 쓰기 (원자적 교체 + 재시도)"""
+    """안전한 JSON 쓰기 (원자적 교체 + 재시도, 성공 경로에는 sleep 없음)"""
     for attempt in range(FILE_IO_MAX_RETRIES):
         try:
+            started = time.perf_counter()
             if use_temp:
-                # 임시 파일로 쓰고 원자적 교체
+                # 임시 파일로 쓰고 원자적 교체 (교체 전에 내용이 다 쓰여 있으므로 동기화 대기 불필요)
                 temp_file = file_path.with_suffix(f'.{socket.gethostname()}.tmp')
                 with open(temp_file, 'w', encoding='utf-8') as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
-
-                # 네트워크 파일시스템 동기화 대기
-                time.sleep(NFS_WRITE_SYNC_DELAY)
-
                 temp_file.replace(file_path)
             else:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
-
-                time.sleep(NFS_WRITE_SYNC_DELAY)
+            share_latency.record(time.perf_counter() - started)
 
             return True
 
         except (OSError, IOError) as e:
             if attempt < FILE_IO_MAX_RETRIES - 1:
-                delay = min(FILE_IO_RETRY_DELAY_BASE * (2 ** attempt), FILE_IO_RETRY_DELAY_MAX)
-                time.sleep(delay)
+                time.sleep(share_latency.retry_delay(attempt))
                 continue
 
             # 임시 파일 정리
@@ -124,7 +164,13 @@ class FarmConfig:
         self.jobs_dir = self.farm_root / "jobs"
         self.claims_dir = self.farm_root / "claims"
         self.workers_dir = self.farm_root / "workers"
-        self.completed_dir = self.farm_root / "completed"
+        self.completed_dir = self.farm_root / "completed"  # 작업별 완료 매니페스트 폴더 + .verified/.verifying
+        self.audit_dir = self.farm_root / "audit"  # 워커별 범위 실행/리셋 감사 로그 (JSONL)
+        self.trash_dir = self.farm_root / "trash"  # 삭제/리셋된 작업 폴더 (rename 후 백그라운드 삭제)
+        self.tickets_dir = self.farm_root / "tickets"  # 범위 티켓 큐 (pending/, running/, done/, seeded/)
+        self.layout_file = self.farm_root / "layout.json"  # 폴더 구조 버전 (v2: claims/<job_id>/, v3: tickets/)
+        self.janitor_lease_file = self.farm_root / "janitor.lease"  # 클레임 만료 정리 담당 워커 리스
+        self.events_dir = self.farm_root / "events"  # 워커별 이벤트 저널 (상태 스레드가 새 줄만 읽음)
 
         # 디렉토리 생성
         for d in [self.jobs_dir, self.claims_dir, self.workers_dir, self.completed_dir]:
@@ -214,6 +260,8 @@ class RenderJob:
         self.use_stmap = False  # STMAP 왜곡 보정 사용 여부
         self.stmap_path = ""  # STMAP EXR 파일 경로
         self.status = RenderJob.STATUS_ACTIVE  # 작업 상태
+        self.priority = JOB_PRIORITY_DEFAULT  # 우선순위 (높을수록 먼저)
+        self.weight = JOB_WEIGHT_DEFAULT  # 같은 우선순위 작업 간 워커 배분 비율
         self.created_at = datetime.now()
         self.created_by = socket.gethostname()
 
@@ -233,6 +281,8 @@ class RenderJob:
             "use_stmap": self.use_stmap,
             "stmap_path": self.stmap_path,
             "status": self.status,
+            "priority": self.priority,
+            "weight": self.weight,
             "created_at": self.created_at.isoformat(),
             "created_by": self.created_by
         }
@@ -253,6 +303,8 @@ class RenderJob:
         job.use_stmap = data.get("use_stmap", False)  # 기본값 False
         job.stmap_path = data.get("stmap_path", "")
         job.status = data.get("status", RenderJob.STATUS_ACTIVE)  # 기본값 active
+        job.priority = int(data.get("priority", JOB_PRIORITY_DEFAULT))
+        job.weight = float(data.get("weight", JOB_WEIGHT_DEFAULT))
         job.created_at = datetime.fromisoformat(data["created_at"])
         job.created_by = data["created_by"]
         return job
@@ -352,10 +404,35 @@ class FarmManager:
         self.is_running = False
         self.network_connected = True
         self.last_job_id = None  # 마지막 작업 ID 저장
+        self.audit = AuditLog(self.config.audit_dir, self.worker.worker_id)
+        self._migrated_jobs = set()  # .done → 완료 매니페스트 이전을 확인한 작업
+
+        # claims/, completed/ 존재 확인은 scandir 스냅샷에서 응답 (파일별 exists() 대체)
+        # claims/ 최상위: 작업별 클레임 폴더 목록 + 구버전(v1) 평면 클레임 파일
+        self.claims_snapshot = DirectorySnapshot(self.config.claims_dir, DIR_SNAPSHOT_TTL_SEC)
+        self._snapshots: Dict[str, DirectorySnapshot] = {}  # 작업별 클레임/티켓 폴더 스냅샷 (경로 -> 스냅샷)
+        self._snapshots_lock = threading.Lock()
+        self._held_tickets = set()  # 이 워커가 처리 중인 running 티켓 경로 (하트비트마다 mtime 갱신)
+        self._held_tickets_lock = threading.Lock()
+        self.completed_snapshot = DirectorySnapshot(self.config.completed_dir, DIR_SNAPSHOT_TTL_SEC)
+        self.completion_lookups = 0  # 완료 매니페스트(메모리 비트맵)로 응답한 프레임 완료 확인 수
+
+        # jobs/*.json 파싱 캐시 (바뀐 파일만 다시 읽음)
+        self.job_cache = JobFileCache(self.config.jobs_dir, self._parse_job_file, ttl_sec=JOB_CACHE_TTL_SEC)
+
+        # 이 워커의 이벤트 저널 (claimed/completed/failed/heartbeat ...)
+        self.events = EventJournal(self.config.events_dir, self.worker.worker_id, EVENT_JOURNAL_MAX_BYTES)
+
+        # 클레임 만료 정리는 리스를 가진 워커 한 대만 주기적으로 실행
+        self.janitor_lease = FileLease(self.config.janitor_lease_file, self.worker.worker_id, JANITOR_LEASE_TTL_SEC)
+        self._janitor_checked_at = 0.0
+        self.janitor_runs = 0
 
     def start(self):
         """워커 시작"""
         self.is_running = True
+        self.ensure_layout()
+        self.purge_trash()
         self.register_worker()
         self.start_heartbeat()
 
@@ -364,6 +441,7 @@ class FarmManager:
         self.is_running = False
         if self.heartbeat_thread:
             self.heartbeat_thread.join(timeout=2)
+        self.janitor_lease.release()
         self.worker.status = "offline"
         self.update_worker()
 
@@ -385,8 +463,10 @@ class FarmManager:
             self.worker.last_heartbeat = datetime.now()
             self.worker.cpu_usage = cpu_usage
             worker_file = self.config.workers_dir / f"{self.worker.worker_id}.json"
+            info = self.worker.to_dict()
             # safe_json_write로 안정적인 파일 쓰기
-            safe_json_write(worker_file, self.worker.to_dict(), use_temp=True)
+            safe_json_write(worker_file, info, use_temp=True)
+        self.events.append(EVENT_HEARTBEAT, info=info)
 
     def increment_frames_completed(self):
         """프레임 완료 카운트 증가 (스레드 안전)"""
@@ -417,6 +497,7 @@ class FarmManager:
         def heartbeat_loop():
             while self.is_running:
                 self.update_worker()
+                self.touch_held_tickets()
                 time.sleep(HEARTBEAT_INTERVAL_SEC)
 
         self.heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
@@ -445,28 +526,42 @@ class FarmManager:
                   self.config.workers_dir, self.config.completed_dir]:
             d.mkdir(parents=True, exist_ok=True)
 
+        # 범위 티켓을 먼저 발행 (작업 파일이 보이는 순간 워커가 바로 클레임할 수 있도록)
+        self.seed_tickets(job)
+
         job_file = self.config.jobs_dir / f"{job.job_id}.json"
         safe_json_write(job_file, job.to_dict(), use_temp=True)
+        self.job_cache.invalidate(job_file.name)
+
+    @staticmethod
+    def _parse_job_file(job_file: Path) -> Optional[Tuple[Dict, RenderJob]]:
+        """작업 파일 읽기 + 파싱 (작업 캐시용, 실패 시 None)"""
+        data = safe_json_read(job_file)
+        if not data:
+            return None
+        try:
+            return data, RenderJob.from_dict(data)
+        except (KeyError, TypeError, ValueError):
+            return None  # 손상된 데이터 무시
+
+    @property
+    def jobs_generation(self) -> int:
+        """작업 목록 세대 번호 (작업 파일 추가/변경/삭제 시 증가)"""
+        self.job_cache.refresh()
+        return self.job_cache.generation
 
     def load_job(self, job_id: str) -> Optional[Dict]:
-        """작업 정보 로드 (dict로 반환, 15대 동시 운영 최적화)"""
-        job_file = self.config.jobs_dir / f"{job_id}.json"
-        return safe_json_read(job_file)
+        """작업 정보 로드 (dict로 반환, 작업 캐시에서 응답)"""
+        cached = self.job_cache.get(f"{job_id}.json")
+        return dict(cached[0]) if cached else None
+
+    def get_all_jobs(self) -> List[RenderJob]:
+        """모든 작업 목록 (excluded 포함)"""
+        return [job for _, job in self.job_cache.values()]
 
     def get_pending_jobs(self) -> List[RenderJob]:
         """대기중인 작업 목록 (excluded 상태 제외)"""
-        jobs = []
-        for job_file in self.config.jobs_dir.glob("*.json"):
-            data = safe_json_read(job_file)
-            if data:
-                try:
-                    job = RenderJob.from_dict(data)
-                    # excluded 상태 작업은 제외
-                    if job.status != RenderJob.STATUS_EXCLUDED:
-                        jobs.append(job)
-                except (KeyError, TypeError, ValueError):
-                    pass  # 손상된 데이터 무시
-        return jobs
+        return [job for job in self.get_all_jobs() if job.status != RenderJob.STATUS_EXCLUDED]
 
     def get_all_jobs_with_status(self) -> List[Tuple[RenderJob, str, int, int]]:
         """모든 작업 목록 + 상태 정보 (실시간 동기화용)
@@ -475,116 +570,219 @@ class FarmManager:
             List of (RenderJob, status, completed, total) tuples
             status: 'pending', 'in_progress', 'completed'
         """
-        result = []
-        for job_file in self.config.jobs_dir.glob("*.json"):
-            data = safe_json_read(job_file)
-            if data:
-                try:
-                    job = RenderJob.from_dict(data)
-                    progress = self.get_job_progress(job.job_id)
-                    total = job.get_total_tasks()
-                    completed = progress.get('completed', 0)
-
-                    # 상태 결정 (excluded 상태 우선)
-                    if job.status == RenderJob.STATUS_EXCLUDED:
-                        status = 'excluded'
-                    elif completed >= total and total > 0:
-                        status = 'completed'
-                    elif completed > 0:
-                        status = 'in_progress'
-                    else:
-                        status = 'pending'
-
-                    result.append((job, status, completed, total))
-                except (KeyError, TypeError, ValueError):
-                    pass
+        result = [self.get_job_status(job) for _, job in self.job_cache.values()]
+        return self.sort_jobs_with_status(result)
+
+    def get_job_status(self, job: RenderJob) -> Tuple[RenderJob, str, int, int]:
+        """작업 하나의 (RenderJob, status, completed, total)"""
+        progress = self.get_job_progress(job.job_id)
+        total = job.get_total_tasks()
+        completed = progress.get('completed', 0)
+
+        # 상태 결정 (excluded 상태 우선)
+        if job.status == RenderJob.STATUS_EXCLUDED:
+            status = 'excluded'
+        elif completed >= total and total > 0:
+            status = 'completed'
+        elif completed > 0:
+            status = 'in_progress'
+        else:
+            status = 'pending'
 
-        # 정렬: in_progress > pending > completed > excluded, 그 다음 job_id 기준
+        return (job, status, completed, total)
+
+    @staticmethod
+    def sort_jobs_with_status(result: List[Tuple[RenderJob, str, int, int]]) -> List[Tuple[RenderJob, str, int, int]]:
+        """정렬: in_progress > pending > completed > excluded, 그 다음 job_id 기준"""
         status_order = {'in_progress': 0, 'pending': 1, 'completed': 2, 'excluded': 3}
         result.sort(key=lambda x: (status_order.get(x[1], 3), x[0].job_id))
         return result
 
-    def claim_frame(self, job_id: str, frame_idx: int, eye: str) -> bool:
-        """프레임 클레임 시도 (atomic, 레이스 컨디션 방지 - 15대 동시 운영 최적화)"""
-        claim = FrameClaim(job_id, frame_idx, eye, self.worker.worker_id)
-        claim_file = self.config.claims_dir / f"{job_id}_{frame_idx:06d}_{eye}.json"
-        temp_file = self.config.claims_dir / f"{job_id}_{frame_idx:06d}_{eye}.{self.worker.worker_id}.tmp"
+    # ===== 팜 폴더 구조 (v2: claims/<job_id>/, completed/<job_id>/) =====
 
-        # 이미 완료된 프레임인지 확인
-        if self.is_frame_completed(job_id, frame_idx, eye):
-            return False
+    def ensure_layout(self):
+        """v1 평면 구조를 작업별 폴더로 온라인 이전 (여러 워커가 동시에 해도 안전)"""
+        layout = safe_json_read(self.config.layout_file) or {}
+        if layout.get("version", 1) >= FARM_LAYOUT_VERSION:
+            return
 
-        # 기존 클레임 확인 (safe_json_read 사용)
-        if claim_file.exists():
-            existing_data = safe_json_read(claim_file)
-            if existing_data:
-                try:
-                    existing = FrameClaim.from_dict(existing_data)
-                    # 타임아웃되지 않았으면 실패
-                    if not existing.is_expired():
-                        return False
-                except (KeyError, TypeError):
-                    pass  # 손상된 데이터 - 아래에서 덮어쓰기 시도
-
-            # 만료된 claim 또는 손상된 파일 - 덮어쓰기로 원자적 교체 시도
-            # 15대 동시 운영 시 충돌 방지를 위한 랜덤 지연
-            time.sleep(random.uniform(CLAIM_RANDOM_DELAY_MIN, CLAIM_RANDOM_DELAY_MAX))
-
-            # 임시 파일 생성 후 rename (원자적)
+        # 긴 job_id부터 매칭 (job_id가 다른 job_id의 접두어일 수 있음)
+        job_ids = sorted((f.stem for f in self.config.jobs_dir.glob("*.json")), key=len, reverse=True)
+
+        # 평면 클레임 claims/{job_id}_{name} → claims/{job_id}/{name}
+        self.claims_snapshot.refresh(force=True)
+        for name in self.claims_snapshot.names(suffix=".json"):
+            job_id = next((j for j in job_ids if name.startswith(f"{j}_")), None)
+            if job_id is None:
+                continue
             try:
-                with open(temp_file, 'w', encoding='utf-8') as tf:
-                    json.dump(claim.to_dict(), tf, indent=2)
-                time.sleep(NFS_WRITE_SYNC_DELAY)
-                temp_file.replace(claim_file)  # 원자적 교체
-
-                # 클레임 성공 후 검증 (다른 워커가 덮어쓰지 않았는지)
-                time.sleep(CLAIM_VERIFY_DELAY)
-                verify_data = safe_json_read(claim_file)
-                if not verify_data or verify_data.get('worker_id') != self.worker.worker_id:
-                    return False  # 다른 워커가 덮어씀
-                return True
+                os.replace(self.config.claims_dir / name, self._ensure_claims_dir(job_id) / name[len(job_id) + 1:])
+                self.claims_snapshot.discard(name)
             except (OSError, IOError):
-                try:
-                    temp_file.unlink(missing_ok=True)
-                except:
-                    pass
-                return False
-
-        # 새 클레임 시도 (x 모드로 atomic)
+                pass  # 다른 워커가 먼저 옮김
+
+        # 평면 .done → 완료 매니페스트 (작업별 첫 접근 시 이전)
+        for job_id in job_ids:
+            self._completion(job_id)
+
+        safe_json_write(self.config.layout_file, {
+            "version": FARM_LAYOUT_VERSION,
+            "migrated_at": datetime.now().isoformat(),
+            "migrated_by": self.worker.worker_id,
+        })
+
+    def _move_to_trash(self, folder: Path) -> bool:
+        """폴더를 trash/로 rename 후 백그라운드 삭제 (폴더가 없어도 True, rename 실패 시 False)"""
+        target = self.config.trash_dir / (
+            f"{folder.parent.name}.{folder.name}.{self.worker.worker_id}.{int(time.time() * 1000)}"
+        )
         try:
-            with open(claim_file, 'x', encoding='utf-8') as f:
-                json.dump(claim.to_dict(), f, indent=2)
-
-            # 네트워크 파일시스템 동기화 대기
-            time.sleep(NFS_WRITE_SYNC_DELAY)
-
-            # 클레임 성공 후 검증 (15대 동시 접근 시 네트워크 파일시스템 지연 대응)
-            time.sleep(CLAIM_VERIFY_DELAY)
-            verify_data = safe_json_read(claim_file)
-            if not verify_data or verify_data.get('worker_id') != self.worker.worker_id:
-                return False  # 다른 워커가 덮어씀
+            self.config.trash_dir.mkdir(parents=True, exist_ok=True)
+            folder.rename(target)
+        except FileNotFoundError:
             return True
-        except FileExistsError:
-            # 다른 워커가 먼저 클레임
-            return False
         except (OSError, IOError):
-            return False
+            return False  # SMB에서 다른 워커가 폴더 안 파일을 열고 있는 경우 등
+        threading.Thread(target=shutil.rmtree, args=(target,), kwargs={"ignore_errors": True}, daemon=True).start()
+        return True
 
-    def release_claim(self, job_id: str, frame_idx: int, eye: str):
-        """클레임 해제"""
-        claim_file = self.config.claims_dir / f"{job_id}_{frame_idx:06d}_{eye}.json"
+    def purge_trash(self):
+        """이전 실행에서 삭제하다 남은 trash/ 항목 백그라운드 삭제"""
+        def purge_loop():
+            try:
+                for entry in list(self.config.trash_dir.iterdir()):
+                    shutil.rmtree(entry, ignore_errors=True)
+            except (OSError, IOError):
+                pass
+
+        threading.Thread(target=purge_loop, daemon=True).start()
+
+    @staticmethod
+    def _frame_claim_name(frame_idx: int, eye: str) -> str:
+        return f"{frame_idx:06d}_{eye}.json"
+
+    def _snapshot(self, folder: Path) -> DirectorySnapshot:
+        """폴더별 스냅샷 (처음 접근 시 생성)"""
+        key = str(folder)
+        with self._snapshots_lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                snapshot = DirectorySnapshot(folder, DIR_SNAPSHOT_TTL_SEC)
+                self._snapshots[key] = snapshot
+            return snapshot
+
+    def _drop_snapshot(self, folder: Path):
+        """삭제한 폴더의 스냅샷 버림"""
+        with self._snapshots_lock:
+            self._snapshots.pop(str(folder), None)
+
+    def _claims_snapshot(self, job_id: str) -> DirectorySnapshot:
+        """작업별 클레임 폴더 스냅샷"""
+        return self._snapshot(self.config.claims_dir / job_id)
+
+    def _ensure_claims_dir(self, job_id: str) -> Path:
+        """작업별 클레임 폴더 생성 (다른 워커가 비운 폴더를 지웠을 수 있으므로 매번 확인)"""
+        folder = self.config.claims_dir / job_id
+        folder.mkdir(parents=True, exist_ok=True)
+        self.claims_snapshot.add(job_id, is_dir=True)
+        return folder
+
+    def _remove_claim(self, job_id: str, name: str):
+        """클레임 파일 삭제 (작업별 폴더 + 구버전 평면 파일)"""
+        self._claims_snapshot(job_id).discard(name)
         try:
             # missing_ok=True: 파일이 없어도 에러 안남
-            claim_file.unlink(missing_ok=True)
-        except Exception as e:
+            (self.config.claims_dir / job_id / name).unlink(missing_ok=True)
+        except Exception:
             # 권한 문제나 다른 에러도 무시 (다른 워커가 삭제했을 수 있음)
             pass
+        legacy_name = f"{job_id}_{name}"
+        if self.claims_snapshot.exists(legacy_name):
+            self.claims_snapshot.discard(legacy_name)
+            try:
+                (self.config.claims_dir / legacy_name).unlink(missing_ok=True)
+            except Exception:
+                pass
+
+    def _drop_job_claims(self, job_id: str):
+        """작업의 모든 클레임 해제 (폴더 rename 한 번, 실패 시 파일별 삭제)"""
+        snapshot = self._claims_snapshot(job_id)
+        if not self._move_to_trash(self.config.claims_dir / job_id):
+            snapshot.refresh(force=True)
+            for name in snapshot.names():
+                try:
+                    (self.config.claims_dir / job_id / name).unlink(missing_ok=True)
+                except (OSError, IOError):
+                    pass
+        self._drop_snapshot(self.config.claims_dir / job_id)
+        self.claims_snapshot.discard(job_id)
+
+        # 구버전 평면 클레임
+        for name in self.claims_snapshot.names(f"{job_id}_", ".json"):
+            try:
+                (self.config.claims_dir / name).unlink(missing_ok=True)
+            except (OSError, IOError):
+                pass
+            self.claims_snapshot.discard(name)
+
+    def _drop_job_completion(self, job_id: str):
+        """작업의 완료 기록 초기화 (매니페스트 폴더 rename 한 번, 실패 시 매니페스트 리셋)"""
+        manifest = self._completion(job_id)
+        if self._move_to_trash(self.config.completed_dir / job_id):
+            manifest.refresh(force=True)  # 폴더가 사라졌으므로 빈 상태로 다시 읽힘
+        else:
+            manifest.reset()
+
+        # 이전 안 된 구버전 .done 파일
+        for name in self.completed_snapshot.names(f"{job_id}_", ".done"):
+            try:
+                (self.config.completed_dir / name).unlink(missing_ok=True)
+            except (OSError, IOError):
+                pass
+            self.completed_snapshot.discard(name)
+
+    def release_claim(self, job_id: str, frame_idx: int, eye: str):
+        """클레임 해제"""
+        self._remove_claim(job_id, self._frame_claim_name(frame_idx, eye))
+
+    def _completion(self, job_id: str) -> CompletionManifest:
+        """작업별 완료 매니페스트 (처음 접근 시 기존 .done 파일을 한 번 이전)"""
+        manifest = get_completion_manifest(
+            self.config.completed_dir / job_id, COMPLETION_MANIFEST_TTL_SEC, COMPLETION_COMPACT_BYTES
+        )
+        if job_id not in self._migrated_jobs:
+            self._migrated_jobs.add(job_id)
+            if not manifest.exists():
+                self._migrate_done_files(job_id, manifest)
+        return manifest
+
+    def _migrate_done_files(self, job_id: str, manifest: CompletionManifest):
+        """구버전 .done 파일 → 매니페스트 (여러 워커가 동시에 해도 OR 병합이라 안전)"""
+        prefix = f"{job_id}_"
+        done_files = [self.config.completed_dir / name
+                      for name in self.completed_snapshot.names(prefix, ".done")]
+        ranges = []
+        for done_file in done_files:
+            frame_part, _, eye = done_file.stem[len(prefix):].partition("_")
+            try:
+                frame_idx = int(frame_part)
+            except ValueError:
+                continue  # 다른 작업(job_id가 이 작업의 접두어인 경우)의 파일
+            ranges.append((eye, frame_idx, frame_idx))
+        if not ranges:
+            return
+        manifest.mark_ranges(ranges)
+        manifest.compact()
+        for done_file in done_files:
+            try:
+                done_file.unlink(missing_ok=True)
+            except (OSError, IOError):
+                pass
 
     def mark_completed(self, job_id: str, frame_idx: int, eye: str):
         """프레임 완료 표시 - 항상 클레임 해제"""
-        completed_file = self.config.completed_dir / f"{job_id}_{frame_idx:06d}_{eye}.done"
-        with open(completed_file, 'w') as f:
-            f.write(self.worker.worker_id)
+        self._completion(job_id).mark_range(eye, frame_idx, frame_idx)
+        self.events.append(EVENT_COMPLETED, job=job_id, s=frame_idx, e=frame_idx, eye=eye)
 
         # 클레임 해제
         self.release_claim(job_id, frame_idx, eye)
@@ -592,7 +790,7 @@ class FarmManager:
     def mark_completed_if_file_exists(self, job: 'RenderJob', frame_idx: int, eye: str) -> bool:
         """파일이 실제로 존재할 때만 완료 표시, 아니면 False 반환"""
         output_file = self.get_output_file_path(job, frame_idx, eye)
-        if output_file.exists():
+        if self.output_file_exists(output_file):
             self.mark_completed(job.job_id, frame_idx, eye)
             return True
         else:
@@ -601,18 +799,20 @@ class FarmManager:
             return False
 
     def is_frame_completed(self, job_id: str, frame_idx: int, eye: str, job: 'RenderJob' = None) -> bool:
-        """프레임 완료 여부 확인 (.done 파일 기준)
+        """프레임 완료 여부 확인 (완료 매니페스트 기준)
 
-        .done 파일이 있으면 완료로 취급 (네트워크 지연으로 출력 파일이 안 보일 수 있음)
-        232개 워커 동시 접근 시 중복 작업 방지를 위해 .done 파일만 신뢰
+        완료 기록이 있으면 완료로 취급 (네트워크 지연으로 출력 파일이 안 보일 수 있음)
+        232개 워커 동시 접근 시 중복 작업 방지를 위해 완료 기록만 신뢰
         """
-        completed_file = self.config.completed_dir / f"{job_id}_{frame_idx:06d}_{eye}.done"
-        return completed_file.exists()
+        self.completion_lookups += 1
+        return self._completion(job_id).is_completed(frame_idx, eye)
 
     def get_job_progress(self, job_id: str) -> Dict[str, int]:
         """작업 진행률"""
-        completed = len(list(self.config.completed_dir.glob(f"{job_id}_*.done")))
-        claimed = len(list(self.config.claims_dir.glob(f"{job_id}_*.json")))
+        completed = self._completion(job_id).completed_count()
+        claimed = (len(self._running_tickets(job_id))
+                   + len(self._claims_snapshot(job_id).names(suffix=".json"))
+                   + len(self.claims_snapshot.names(f"{job_id}_", ".json")))  # + 구버전 평면 클레임
 
         return {
             "completed": completed,
@@ -622,8 +822,7 @@ class FarmManager:
 
     def is_job_verified(self, job_id: str) -> bool:
         """작업이 이미 검증 완료되었는지 확인"""
-        verified_file = self.config.completed_dir / f"{job_id}.verified"
-        return verified_file.exists()
+        return self.completed_snapshot.exists(f"{job_id}.verified")
 
     def claim_verification(self, job_id: str) -> bool:
         """검증 작업 클레임 (한 워커만 검증하도록)"""
@@ -641,6 +840,7 @@ class FarmManager:
                     "started_at": datetime.now().isoformat(),
                     "worker_id": self.worker.worker_id
                 }, f, indent=2)
+            self.completed_snapshot.add(verifying_file.name)
             return True
         except FileExistsError:
             return False
@@ -648,15 +848,16 @@ class FarmManager:
     def release_verification_claim(self, job_id: str):
         """검증 클레임 해제"""
         verifying_file = self.config.completed_dir / f"{job_id}.verifying"
+        self.completed_snapshot.discard(verifying_file.name)
         try:
             verifying_file.unlink(missing_ok=True)
         except (OSError, IOError):
             pass
 
     def is_job_complete(self, job: 'RenderJob') -> bool:
-        """작업의 모든 프레임이 완료됐는지 확인 (.done 파일 기준 - 빠른 체크)"""
+        """작업의 모든 프레임이 완료됐는지 확인 (완료 매니페스트 기준 - 빠른 체크)"""
         expected_count = (job.end_frame - job.start_frame + 1) * len(job.eyes)
-        completed_count = len(list(self.config.completed_dir.glob(f"{job.job_id}_*.done")))
+        completed_count = self._completion(job.job_id).completed_count()
         return completed_count >= expected_count
 
     def mark_job_verified(self, job_id: str, avg_size: float, total_files: int):
@@ -670,9 +871,10 @@ class FarmManager:
                 "total_files": total_files,
                 "verified_by": self.worker.worker_id
             }, f, indent=2)
+        self.completed_snapshot.add(verified_file.name)
 
     def verify_job_output_files(self, job: 'RenderJob') -> Dict[str, any]:
-        """실제 출력 파일 검증 - 미싱/손상 프레임 탐지 (평균 크기 기반)"""
+        """실제 출력 파일 검증 - 미싱/손상 프레임 탐지 (eye/폴더별 이동 중앙값 기반)"""
 
         # 이미 검증 완료된 작업이면 스킵
         if self.is_job_verified(job.job_id):
@@ -691,74 +893,61 @@ class FarmManager:
                 "progress_percent": 100.0
             }
 
-        output_dir = Path(job.output_dir)
-        clip_basename = Path(job.clip_path).stem
-        ext = ".exr" if job.format == "exr" else ".ppm"
-
-        # 1차 스캔: 파일 존재 여부와 크기 수집
-        file_info = []
+        # 1차 스캔: 파일 존재 여부와 크기 수집 ((eye, 폴더)별 그룹)
+        # 출력 폴더마다 scandir 한 번으로 인덱스 재구성 - 파일별 stat 없음
+        groups = {}
+        paths = {}
         missing_files = []
+        indexes = {}
 
         for frame_idx in range(job.start_frame, job.end_frame + 1):
             for eye in job.eyes:
-                frame_num = f"{frame_idx:06d}"
-
-                if eye == "sbs":
-                    # SBS 모드: SBS 폴더에 저장
-                    expected_path = output_dir / "SBS" / f"{clip_basename}_{frame_num}{ext}"
-                elif job.separate_folders:
-                    folder = "L" if eye == "left" else "R"
-                    expected_path = output_dir / folder / f"{clip_basename}_{frame_num}{ext}"
-                else:
-                    suffix = "_L" if eye == "left" else "_R"
-                    expected_path = output_dir / f"{clip_basename}{suffix}_{frame_num}{ext}"
-
-                if expected_path.exists():
-                    file_size = expected_path.stat().st_size
-                    file_info.append({
-                        "path": expected_path,
-                        "frame": frame_idx,
-                        "eye": eye,
-                        "size": file_size
-                    })
-                else:
+                expected_path = self.get_output_file_path(job, frame_idx, eye)
+                index = indexes.get(expected_path.parent)
+                if index is None:
+                    index = self._output_index(expected_path)
+                    index.rebuild()
+                    indexes[expected_path.parent] = index
+
+                file_size = index.size(expected_path.name)
+                if file_size is None:
                     missing_files.append({
                         "path": expected_path,
                         "frame": frame_idx,
                         "eye": eye,
                         "reason": "not_found"
                     })
+                    continue
+
+                key = (eye, str(expected_path.parent))
+                groups.setdefault(key, []).append((frame_idx, file_size))
+                paths[(eye, frame_idx)] = expected_path
 
-        # 2차 검사: 평균 크기 계산 및 이상치 탐지
+        # 2차 검사: 그룹별 이동 중앙값/MAD로 이상치 탐지 (L/R/SBS 크기 차이, 장면 전환 반영)
+        outliers = detect_grouped_outliers(
+            groups, OUTLIER_WINDOW_FRAMES, MIN_FILE_SIZE_RATIO, OUTLIER_MAD_THRESHOLD
+        )
         corrupted_files = []
-        existing_files = []
-
-        if file_info:
-            # 평균 파일 크기 계산
-            sizes = [f["size"] for f in file_info]
-            avg_size = sum(sizes) / len(sizes)
-            # 평균의 MIN_FILE_SIZE_RATIO 미만이면 손상으로 간주
-            min_acceptable_size = avg_size * MIN_FILE_SIZE_RATIO
-
-            for f in file_info:
-                if f["size"] < min_acceptable_size:
-                    corrupted_files.append({
-                        "path": f["path"],
-                        "frame": f["frame"],
-                        "eye": f["eye"],
-                        "size": f["size"],
-                        "avg_size": avg_size,
-                        "reason": "too_small"
-                    })
-                else:
-                    existing_files.append(f["path"])
-        else:
-            avg_size = 0
+        for (eye, _folder), entries in outliers.items():
+            for frame_idx, file_size, ref_size in entries:
+                corrupted_files.append({
+                    "path": paths[(eye, frame_idx)],
+                    "frame": frame_idx,
+                    "eye": eye,
+                    "size": file_size,
+                    "ref_size": ref_size,
+                    "reason": "too_small"
+                })
+        corrupted_files.sort(key=lambda f: (f["frame"], f["eye"]))
+
+        total_found = sum(len(entries) for entries in groups.values())
+        total_size = sum(size for entries in groups.values() for _, size in entries)
+        avg_size = total_size / total_found if total_found else 0
 
         # 손상된 파일도 문제 파일로 합산
         all_problem_files = missing_files + corrupted_files
-        total_expected = len(file_info) + len(missing_files)
-        total_existing = len(existing_files)
+        total_expected = total_found + len(missing_files)
+        total_existing = total_found - len(corrupted_files)
         total_missing = len(missing_files)
         total_corrupted = len(corrupted_files)
         is_complete = len(all_problem_files) == 0
@@ -782,9 +971,9 @@ class FarmManager:
         }
 
     def repair_missing_frames(self, job: 'RenderJob') -> int:
-        """미싱/손상 프레임의 .done 파일 삭제하여 재처리 유도"""
+        """미싱/손상 프레임의 완료 기록 해제하여 재처리 유도"""
         verify_result = self.verify_job_output_files(job)
-        repaired_count = 0
+        problem_frames = {}  # eye -> [frame_idx, ...]
 
         # 미싱 + 손상 파일 모두 처리
         for problem in verify_result["problem_files"]:
@@ -795,40 +984,76 @@ class FarmManager:
             if problem.get("reason") == "too_small":
                 try:
                     problem["path"].unlink()
+                    self._output_index(problem["path"]).mark(problem["path"].name, STATUS_GONE)
                 except (OSError, IOError):
                     pass
 
-            # .done 파일 삭제 (재처리 유도)
-            done_file = self.config.completed_dir / f"{job.job_id}_{frame_idx:06d}_{eye}.done"
-            if done_file.exists():
-                try:
-                    done_file.unlink()
-                    repaired_count += 1
-                except (OSError, IOError):
-                    pass
+            problem_frames.setdefault(eye, []).append(frame_idx)
 
             # claim 파일도 삭제 (다시 클레임 가능하게)
-            claim_file = self.config.claims_dir / f"{job.job_id}_{frame_idx:06d}_{eye}.json"
-            if claim_file.exists():
+            self._remove_claim(job.job_id, self._frame_claim_name(frame_idx, eye))
+
+        # 완료 기록 해제 (재처리 유도) - 매니페스트 재작성 한 번 + 해당 범위 티켓 재발행
+        repaired_count = 0
+        if problem_frames:
+            repaired_count = self._completion(job.job_id).clear_frames(problem_frames)
+            self._add_tickets(job.job_id, [
+                (start, end, eye)
+                for eye, frames in problem_frames.items()
+                for start, end in frames_to_ranges(frames)
+            ])
+
+        target = render_target(job.output_dir, job.clip_path)
+        for eye, frames in problem_frames.items():
+            self.audit.log_reset(job.job_id, target, eye, frames, CAUSE_REPAIR, time.time())
+        if problem_frames:
+            self.events.append(EVENT_RESET, job=job.job_id)
+
+        return repaired_count
+
+    def _claim_files(self) -> List[Tuple[DirectorySnapshot, Path, str]]:
+        """모든 클레임 파일 [(스냅샷, 폴더, 이름), ...] (작업별 폴더 + 구버전 평면 파일)"""
+        files = []
+        for job_id in self.claims_snapshot.dirs():
+            snapshot = self._claims_snapshot(job_id)
+            files.extend((snapshot, self.config.claims_dir / job_id, name)
+                         for name in snapshot.names(suffix=".json"))
+        files.extend((self.claims_snapshot, self.config.claims_dir, name)
+                     for name in self.claims_snapshot.names(suffix=".json"))
+        return files
+
+    def _sweep_expired_claims(self, range_claims: bool):
+        """만료된 클레임 정리 (클레임 파일은 한 번만 쓰므로 스냅샷 mtime = claimed_at, JSON은 읽지 않음)"""
+        timeout = BATCH_CLAIM_TIMEOUT_SEC if range_claims else CLAIM_TIMEOUT_SEC
+        now = time.time()
+        for snapshot, folder, name in self._claim_files():
+            if ("range_" in name) != range_claims:
+                continue
+            claim_mtime = snapshot.mtime(name)
+            if claim_mtime is None or now - claim_mtime < timeout:
+                continue
+            try:
+                # missing_ok=True: 다른 워커가 이미 삭제했을 수 있음
+                (folder / name).unlink(missing_ok=True)
+                snapshot.discard(name)
+            except (OSError, IOError):
+                pass  # 삭제 중 에러 무시 (다음 정리 때 재시도)
+
+        # 오래 비어 있는 작업별 클레임 폴더 정리 (비어 있지 않으면 rmdir이 실패하므로 안전)
+        if not range_claims:
+            for job_id in self.claims_snapshot.dirs():
+                dir_mtime = self.claims_snapshot.mtime(job_id)
+                if self._claims_snapshot(job_id).names() or dir_mtime is None or now - dir_mtime < timeout:
+                    continue
                 try:
-                    claim_file.unlink()
+                    os.rmdir(self.config.claims_dir / job_id)
+                    self.claims_snapshot.discard(job_id)
                 except (OSError, IOError):
                     pass
 
-        return repaired_count
-
     def cleanup_expired_claims(self):
         """만료된 클레임 정리"""
-        for claim_file in self.config.claims_dir.glob("*.json"):
-            try:
-                with open(claim_file, 'r', encoding='utf-8') as f:
-                    claim = FrameClaim.from_dict(json.load(f))
-                    if claim.is_expired():
-                        # missing_ok=True: 다른 워커가 이미 삭제했을 수 있음
-                        claim_file.unlink(missing_ok=True)
-            except Exception as e:
-                # 파일 읽기/삭제 중 에러 무시 (다른 워커가 처리중일 수 있음)
-                pass
+        self._sweep_expired_claims(range_claims=False)
 
     def get_output_file_path(self, job: RenderJob, frame_idx: int, eye: str) -> Path:
         """출력 파일 경로 계산"""
@@ -836,129 +1061,260 @@ class FarmManager:
         clip_basename = Path(job.clip_path).stem
         ext = ".exr" if job.format == "exr" else ".ppm"
 
-        if job.separate_folders:
+        if eye == "sbs":
+            # SBS는 항상 SBS 폴더
+            return output_dir / "SBS" / f"{clip_basename}_{frame_idx:06d}{ext}"
+        elif job.separate_folders:
             folder = "L" if eye == "left" else "R"
             return output_dir / folder / f"{clip_basename}_{frame_idx:06d}{ext}"
         else:
             suffix = "_L" if eye == "left" else "_R"
             return output_dir / f"{clip_basename}{suffix}_{frame_idx:06d}{ext}"
 
+    def _output_index(self, output_file: Path) -> SequenceIndex:
+        """출력 파일이 속한 폴더의 시퀀스 인덱스"""
+        return get_sequence_index(output_file.parent, SEQ_INDEX_TTL_SEC)
+
+    def output_file_exists(self, output_file: Path) -> bool:
+        """출력 파일 존재 여부 (시퀀스 인덱스 조회 - 파일별 stat 없음)"""
+        return self._output_index(output_file).exists(output_file.name)
+
+    def record_output_files(self, output_files: List[Path]) -> Dict[Path, bool]:
+        """방금 렌더한 출력 파일을 확인하고 시퀀스 인덱스에 증분 기록
+
+        Returns:
+            {경로: 존재 여부}
+        """
+        by_folder = {}
+        for output_file in output_files:
+            by_folder.setdefault(output_file.parent, []).append(output_file)
+
+        result = {}
+        for folder, files in by_folder.items():
+            probed = get_sequence_index(folder, SEQ_INDEX_TTL_SEC).probe(f.name for f in files)
+            for f in files:
+                result[f] = probed.get(f.name) is not None
+        return result
+
     def is_frame_really_complete(self, job: RenderJob, frame_idx: int, eye: str) -> bool:
-        """프레임이 진짜 완료됐는지 확인 (.done 파일 + 실제 출력 파일 존재)"""
-        # .done 파일 확인
+        """프레임이 진짜 완료됐는지 확인 (완료 기록 + 실제 출력 파일 존재)"""
+        # 완료 기록 확인
         if not self.is_frame_completed(job.job_id, frame_idx, eye):
             return False
 
-        # 실제 출력 파일 존재 확인
+        # 실제 출력 파일 존재 확인 (시퀀스 인덱스)
         output_file = self.get_output_file_path(job, frame_idx, eye)
-        if not output_file.exists():
-            # .done 파일만 있고 실제 파일이 없으면 .done 삭제 (재처리 유도)
-            done_file = self.config.completed_dir / f"{job.job_id}_{frame_idx:06d}_{eye}.done"
-            try:
-                done_file.unlink(missing_ok=True)
-            except (OSError, IOError):
-                pass
+        if not self.output_file_exists(output_file):
+            # 완료 기록만 있고 실제 파일이 없으면 기록 해제 + 티켓 재발행 (재처리 유도)
+            self._completion(job.job_id).clear_frames({eye: [frame_idx]})
+            self._add_tickets(job.job_id, [(frame_idx, frame_idx, eye)])
             return False
 
         return True
 
-    def find_next_frame(self, job: RenderJob) -> Optional[Tuple[int, str]]:
-        """다음 처리할 프레임 찾기 (15대 동시 운영 최적화: 랜덤 시작점으로 분산)"""
-        total_frames = job.end_frame - job.start_frame + 1
+    # ===== 범위 티켓 큐 (tickets/pending/<job_id>/ → running/<worker_id>/<job_id>/ → done/<job_id>/) =====
+    # 제출 시 범위마다 빈 티켓 파일을 만들고, 워커는 티켓을 자기 running 폴더로 rename해서 클레임한다.
+    # rename은 원자적이라 정확히 한 워커만 성공하므로 JSON 쓰기/대기/재확인이 필요 없다.
 
-        if FRAME_SEARCH_RANDOM_START and total_frames > FRAME_SEARCH_BATCH_SIZE:
-            # 15대가 같은 프레임에 몰리지 않도록 랜덤 시작점 사용
-            random_offset = random.randint(0, total_frames - 1)
-        else:
-            random_offset = 0
+    @staticmethod
+    def _ticket_name(start_frame: int, end_frame: int, eye: str) -> str:
+        return f"range_{start_frame:06d}_{end_frame:06d}_{eye}.ticket"
 
-        # 랜덤 시작점부터 검색하고, 끝까지 가면 처음부터 다시
-        for i in range(total_frames):
-            frame_idx = job.start_frame + ((random_offset + i) % total_frames)
-            for eye in job.eyes:
-                # 빠른 체크: .done 파일만 확인 (네트워크 부하 감소)
-                if not self.is_frame_completed(job.job_id, frame_idx, eye):
-                    if self.claim_frame(job.job_id, frame_idx, eye):
-                        return (frame_idx, eye)
-        return None
+    @staticmethod
+    def _parse_ticket_name(name: str) -> Optional[Tuple[int, int, str]]:
+        """티켓 파일명 → (start, end, eye)"""
+        parts = name[:-len(".ticket")].split("_") if name.endswith(".ticket") else []
+        if len(parts) != 4 or parts[0] != "range":
+            return None
+        try:
+            return int(parts[1]), int(parts[2]), parts[3]
+        except ValueError:
+            return None
 
-    # ===== 100프레임 범위 기반 배치 처리 메서드 =====
+    def _pending_dir(self, job_id: str) -> Path:
+        return self.config.tickets_dir / "pending" / job_id
 
-    def claim_frame_range(self, job_id: str, start_frame: int, end_frame: int, eye: str) -> bool:
-        """프레임 범위 클레임 시도 (atomic, 100프레임 배치용)"""
-        claim = RangeClaim(job_id, start_frame, end_frame, eye, self.worker.worker_id)
-        claim_file = self.config.claims_dir / f"{job_id}_range_{start_frame:06d}_{end_frame:06d}_{eye}.json"
-        temp_file = self.config.claims_dir / f"{job_id}_range_{start_frame:06d}_{end_frame:06d}_{eye}.{self.worker.worker_id}.tmp"
-
-        # 이미 진행 중인 범위 클레임이 있는지 확인
-        if claim_file.exists():
-            existing_data = safe_json_read(claim_file)
-            if existing_data:
-                try:
-                    existing = RangeClaim.from_dict(existing_data)
-                    if not existing.is_expired():
-                        return False
-                except (KeyError, TypeError):
-                    pass
+    def _running_dir(self, worker_id: str, job_id: str) -> Path:
+        return self.config.tickets_dir / "running" / worker_id / job_id
+
+    def _done_dir(self, job_id: str) -> Path:
+        return self.config.tickets_dir / "done" / job_id
+
+    def _seeded_marker(self, job_id: str) -> Path:
+        return self.config.tickets_dir / "seeded" / job_id
 
-            # 만료된 클레임 덮어쓰기
-            time.sleep(random.uniform(CLAIM_RANDOM_DELAY_MIN, CLAIM_RANDOM_DELAY_MAX))
+    def _move_ticket(self, source: Path, target: Path) -> bool:
+        """티켓 rename (대상 폴더가 없으면 만들고 한 번 재시도). 원본이 없으면 False"""
+        for attempt in range(2):
             try:
-                with open(temp_file, 'w', encoding='utf-8') as tf:
-                    json.dump(claim.to_dict(), tf, indent=2)
-                time.sleep(NFS_WRITE_SYNC_DELAY)
-                temp_file.replace(claim_file)
-
-                time.sleep(CLAIM_VERIFY_DELAY)
-                verify_data = safe_json_read(claim_file)
-                if not verify_data or verify_data.get('worker_id') != self.worker.worker_id:
-                    return False
+                os.rename(source, target)
+                return True
+            except FileNotFoundError:
+                if attempt or target.parent.exists():
+                    return False  # 다른 워커가 먼저 옮김
+                target.parent.mkdir(parents=True, exist_ok=True)
+            except FileExistsError:
+                # 같은 티켓이 대상에 이미 있음 (복구 티켓 중복) - 원본만 정리
+                source.unlink(missing_ok=True)
                 return True
             except (OSError, IOError):
-                try:
-                    temp_file.unlink(missing_ok=True)
-                except:
-                    pass
                 return False
+        return False
+
+    def _incomplete_ranges(self, job: RenderJob, batch_size: int) -> List[Tuple[int, int, str]]:
+        """완료되지 않은 프레임이 있는 범위 목록 (batch_size 단위)"""
+        manifest = self._completion(job.job_id)
+        ranges = []
+        for eye in job.eyes:
+            for range_start in range(job.start_frame, job.end_frame + 1, batch_size):
+                range_end = min(range_start + batch_size - 1, job.end_frame)
+                if any(not manifest.is_completed(f, eye) for f in range(range_start, range_end + 1)):
+                    ranges.append((range_start, range_end, eye))
+        return ranges
+
+    def _add_tickets(self, job_id: str, ranges: List[Tuple[int, int, str]]):
+        """pending 티켓 생성 (이미 있으면 건너뜀)"""
+        if not ranges:
+            return
+        pending_dir = self._pending_dir(job_id)
+        pending_dir.mkdir(parents=True, exist_ok=True)
+        snapshot = self._snapshot(pending_dir)
+        for start_frame, end_frame, eye in ranges:
+            name = self._ticket_name(start_frame, end_frame, eye)
+            try:
+                with open(pending_dir / name, 'x'):
+                    pass
+            except FileExistsError:
+                pass
+            except (OSError, IOError):
+                continue
+            snapshot.add(name)
 
-        # 새 클레임 시도
+    def seed_tickets(self, job: RenderJob, batch_size: int = None) -> bool:
+        """작업의 범위 티켓 생성 (seeded 표시를 배타 생성한 한 워커만 수행)"""
+        if batch_size is None:
+            batch_size = settings.batch_frame_size
+        marker = self._seeded_marker(job.job_id)
         try:
-            with open(claim_file, 'x', encoding='utf-8') as f:
-                json.dump(claim.to_dict(), f, indent=2)
-            time.sleep(NFS_WRITE_SYNC_DELAY)
-            time.sleep(CLAIM_VERIFY_DELAY)
-            verify_data = safe_json_read(claim_file)
-            if not verify_data or verify_data.get('worker_id') != self.worker.worker_id:
-                return False
-            return True
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            with open(marker, 'x', encoding='utf-8') as f:
+                json.dump({
+                    "batch_size": batch_size,
+                    "seeded_at": datetime.now().isoformat(),
+                    "seeded_by": self.worker.worker_id,
+                }, f)
         except FileExistsError:
+            self._snapshot(marker.parent).add(job.job_id)
             return False
         except (OSError, IOError):
             return False
+        self._snapshot(marker.parent).add(job.job_id)
+        self._add_tickets(job.job_id, self._incomplete_ranges(job, batch_size))
+        return True
+
+    def _running_tickets(self, job_id: str, force: bool = False) -> List[Tuple[str, Path, str]]:
+        """작업의 실행 중 티켓 [(worker_id, 폴더, 이름), ...] (모든 워커)"""
+        running_root = self.config.tickets_dir / "running"
+        tickets = []
+        root_snapshot = self._snapshot(running_root)
+        root_snapshot.refresh(force)
+        for worker_id in root_snapshot.dirs():
+            worker_snapshot = self._snapshot(running_root / worker_id)
+            worker_snapshot.refresh(force)
+            if not worker_snapshot.exists(job_id):
+                continue
+            folder = running_root / worker_id / job_id
+            job_snapshot = self._snapshot(folder)
+            job_snapshot.refresh(force)
+            tickets.extend((worker_id, folder, name) for name in job_snapshot.names(suffix=".ticket"))
+        return tickets
+
+    def order_jobs_for_claim(self, jobs: List[RenderJob], local_running: Dict[str, int] = None) -> List[RenderJob]:
+        """다음 범위를 가져올 작업 순서 (우선순위 높은 순 → 같은 우선순위는 가중치 대비 실행 중 범위가 적은 순)
+
+        모든 워커가 같은 작업으로 몰리지 않고 가중치 비율대로 나뉘도록 함 (클레임 충돌/소스 읽기 집중 감소)
+        local_running: 이 워커가 진행 중인 작업별 범위 수 (다른 워커 수는 running/ 스냅샷에서 셈)
+        """
+        local_running = local_running or {}
+        me = self.worker.worker_id
+
+        def share(job: RenderJob) -> float:
+            others = sum(1 for worker_id, _, _ in self._running_tickets(job.job_id) if worker_id != me)
+            return (others + local_running.get(job.job_id, 0)) / max(job.weight, 0.01)
+
+        # 같은 몫이면 무작위 (여러 워커가 동시에 같은 작업을 고르지 않도록)
+        return sorted(jobs, key=lambda job: (-job.priority, share(job), random.random()))
 
-    def release_range_claim(self, job_id: str, start_frame: int, end_frame: int, eye: str):
-        """범위 클레임 해제"""
-        claim_file = self.config.claims_dir / f"{job_id}_range_{start_frame:06d}_{end_frame:06d}_{eye}.json"
+    def claim_frame_range(self, job_id: str, start_frame: int, end_frame: int, eye: str) -> bool:
+        """범위 티켓 클레임 (pending → running/<worker_id>/ rename 한 번)"""
+        name = self._ticket_name(start_frame, end_frame, eye)
+        pending_snapshot = self._snapshot(self._pending_dir(job_id))
+        target = self._running_dir(self.worker.worker_id, job_id) / name
+        if not self._move_ticket(self._pending_dir(job_id) / name, target):
+            pending_snapshot.discard(name)  # 다른 워커가 가져감
+            return False
+        pending_snapshot.discard(name)
         try:
-            claim_file.unlink(missing_ok=True)
-        except Exception:
-            pass
+            os.utime(target)  # rename은 mtime을 유지하므로 클레임 시각을 기록 (만료 판정용)
+        except (OSError, IOError):
+            # 옛 mtime 그대로면 곧바로 만료로 보여 다른 워커가 가져감 - 클레임하지 않고 되돌림
+            self._move_ticket(target, self._pending_dir(job_id) / name)
+            return False
+        with self._held_tickets_lock:
+            self._held_tickets.add(target)
+        self._snapshot(target.parent).add(name)
+        self.events.append(EVENT_CLAIMED, job=job_id, s=start_frame, e=end_frame, eye=eye)
+        return True
+
+    def release_range_claim(self, job_id: str, start_frame: int, end_frame: int, eye: str, failed: bool = False):
+        """범위 티켓 반환 (running → pending, 렌더 실패로 반환하면 failed=True)"""
+        name = self._ticket_name(start_frame, end_frame, eye)
+        source = self._running_dir(self.worker.worker_id, job_id) / name
+        self._drop_held_ticket(source)
+        self._snapshot(source.parent).discard(name)
+        if self._move_ticket(source, self._pending_dir(job_id) / name):
+            self._snapshot(self._pending_dir(job_id)).add(name)
+        self.events.append(EVENT_FAILED if failed else EVENT_RELEASED,
+                           job=job_id, s=start_frame, e=end_frame, eye=eye)
 
     def mark_range_completed(self, job_id: str, start_frame: int, end_frame: int, eye: str):
-        """범위 내 모든 프레임 완료 표시"""
-        for frame_idx in range(start_frame, end_frame + 1):
-            completed_file = self.config.completed_dir / f"{job_id}_{frame_idx:06d}_{eye}.done"
+        """범위 내 모든 프레임 완료 표시 (완료 로그에 한 줄 append 후 티켓을 done으로 rename)"""
+        self._completion(job_id).mark_range(eye, start_frame, end_frame)
+        self.events.append(EVENT_COMPLETED, job=job_id, s=start_frame, e=end_frame, eye=eye)
+
+        name = self._ticket_name(start_frame, end_frame, eye)
+        source = self._running_dir(self.worker.worker_id, job_id) / name
+        self._drop_held_ticket(source)
+        self._snapshot(source.parent).discard(name)
+        self._move_ticket(source, self._done_dir(job_id) / name)
+
+    def _drop_held_ticket(self, ticket: Path):
+        with self._held_tickets_lock:
+            self._held_tickets.discard(ticket)
+
+    def touch_held_tickets(self) -> int:
+        """처리 중인 running 티켓의 mtime 갱신 (배치가 BATCH_CLAIM_TIMEOUT_SEC보다 오래 걸려도 만료되지 않도록)
+
+        Returns:
+            갱신한 티켓 수 (이미 다른 워커가 반환한 티켓은 목록에서 뺌)
+        """
+        with self._held_tickets_lock:
+            tickets = list(self._held_tickets)
+        touched = 0
+        for ticket in tickets:
             try:
-                with open(completed_file, 'w') as f:
-                    f.write(self.worker.worker_id)
+                os.utime(ticket)
+                touched += 1
+            except FileNotFoundError:
+                self._drop_held_ticket(ticket)
             except (OSError, IOError):
-                pass
-
-        # 범위 클레임 해제
-        self.release_range_claim(job_id, start_frame, end_frame, eye)
+                pass  # 일시적인 공유 폴더 오류 - 다음 하트비트에서 다시 시도
+        return touched
 
     def find_next_frame_range(self, job: RenderJob, batch_size: int = None) -> Optional[Tuple[int, int, str]]:
-        """다음 처리할 프레임 범위 찾기 (100프레임 배치)
+        """다음 처리할 프레임 범위 찾기 (pending 티켓 클레임)
+
+        티켓이 없는 작업(이전 버전에서 제출)은 처음 찾는 워커가 티켓을 만든다.
 
         Returns:
             (start_frame, end_frame, eye) 또는 None
@@ -966,50 +1322,138 @@ class FarmManager:
         if batch_size is None:
             batch_size = settings.batch_frame_size
 
-        total_frames = job.end_frame - job.start_frame + 1
-
-        # 100프레임 단위로 범위 분할
-        num_batches = (total_frames + batch_size - 1) // batch_size
+        pending_snapshot = self._snapshot(self._pending_dir(job.job_id))
+        names = sorted(pending_snapshot.names(suffix=".ticket"))
+        if not names:
+            if not self._snapshot(self._seeded_marker(job.job_id).parent).exists(job.job_id):
+                self.seed_tickets(job, batch_size)
+            elif not self._running_tickets(job.job_id, force=True):
+                # 티켓이 모두 사라졌는데 미완료 범위가 있음 (복구로 완료 해제 등) - 다시 발행
+                self._completion(job.job_id).refresh(force=True)
+                self._add_tickets(job.job_id, self._incomplete_ranges(job, batch_size))
+            names = sorted(pending_snapshot.names(suffix=".ticket"))
 
         # 랜덤 시작점으로 워커들이 분산되도록
-        if FRAME_SEARCH_RANDOM_START and num_batches > 1:
-            start_batch = random.randint(0, num_batches - 1)
-        else:
-            start_batch = 0
-
-        for i in range(num_batches):
-            batch_idx = (start_batch + i) % num_batches
-            range_start = job.start_frame + batch_idx * batch_size
-            range_end = min(range_start + batch_size - 1, job.end_frame)
+        if FRAME_SEARCH_RANDOM_START and len(names) > 1:
+            offset = random.randint(0, len(names) - 1)
+            names = names[offset:] + names[:offset]
+
+        manifest = self._completion(job.job_id)
+        for name in names:
+            parsed = self._parse_ticket_name(name)
+            if parsed is None:
+                continue
+            range_start, range_end, eye = parsed
 
-            for eye in job.eyes:
-                # 이 범위가 이미 완료됐는지 체크 (실제 파일 존재 여부까지 확인)
-                all_completed = True
-                for frame_idx in range(range_start, range_end + 1):
-                    if not self.is_frame_completed(job.job_id, frame_idx, eye, job):
-                        all_completed = False
-                        break
-
-                if all_completed:
-                    continue
+            # 이미 완료된 범위(복구 티켓 중복 등)는 클레임 없이 done으로 정리
+            if all(manifest.is_completed(f, eye) for f in range(range_start, range_end + 1)):
+                pending_snapshot.discard(name)
+                self._move_ticket(self._pending_dir(job.job_id) / name, self._done_dir(job.job_id) / name)
+                continue
 
-                # 범위 클레임 시도
-                if self.claim_frame_range(job.job_id, range_start, range_end, eye):
-                    return (range_start, range_end, eye)
+            if self.claim_frame_range(job.job_id, range_start, range_end, eye):
+                return (range_start, range_end, eye)
 
         return None
 
+    def return_stale_tickets(self) -> int:
+        """만료됐거나 죽은 워커의 실행 중 티켓을 pending으로 반환
+
+        Returns:
+            반환한 티켓 수
+        """
+        # 하트비트 목록을 못 읽었으면(네트워크 오류 등) 죽은 워커 판정은 하지 않음
+        alive = {w.worker_id for w in self.get_active_workers()}
+        running_root = self.config.tickets_dir / "running"
+        now = time.time()
+        returned = 0
+        for worker_id in self._snapshot(running_root).dirs():
+            dead = bool(alive) and worker_id not in alive and worker_id != self.worker.worker_id
+            for job_id in self._snapshot(running_root / worker_id).dirs():
+                folder = running_root / worker_id / job_id
+                snapshot = self._snapshot(folder)
+                for name in snapshot.names(suffix=".ticket"):
+                    claimed_at = snapshot.mtime(name)  # 클레임 시각 또는 보유 워커의 마지막 하트비트
+                    if not dead and claimed_at is not None and now - claimed_at < BATCH_CLAIM_TIMEOUT_SEC:
+                        continue
+                    snapshot.discard(name)
+                    if self._move_ticket(folder / name, self._pending_dir(job_id) / name):
+                        self._snapshot(self._pending_dir(job_id)).add(name)
+                        returned += 1
+        return returned
+
+    def _drop_job_tickets(self, job_id: str):
+        """작업의 모든 티켓 폴더 삭제 (rename + 백그라운드 삭제) - 다음 탐색 시 다시 발행"""
+        running_root = self.config.tickets_dir / "running"
+        folders = [self._pending_dir(job_id), self._done_dir(job_id)]
+        folders += [running_root / w / job_id for w in self._snapshot(running_root).dirs()]
+        for folder in folders:
+            self._move_to_trash(folder)
+            self._drop_snapshot(folder)
+        marker = self._seeded_marker(job_id)
+        try:
+            marker.unlink(missing_ok=True)
+        except (OSError, IOError):
+            pass
+        self._snapshot(marker.parent).discard(job_id)
+
     def cleanup_expired_range_claims(self):
-        """만료된 범위 클레임 정리"""
-        for claim_file in self.config.claims_dir.glob("*_range_*.json"):
-            try:
-                data = safe_json_read(claim_file)
-                if data:
-                    claim = RangeClaim.from_dict(data)
-                    if claim.is_expired():
-                        claim_file.unlink(missing_ok=True)
-            except Exception:
-                pass
+        """만료된 범위 티켓 반환 (+ 이전 버전의 JSON 범위 클레임 정리)"""
+        self.return_stale_tickets()
+        self._sweep_expired_claims(range_claims=True)
+
+    def run_janitor(self) -> bool:
+        """정리 담당 워커면 JANITOR_INTERVAL_SEC마다 만료 클레임/티켓 정리
+
+        다른 워커가 살아 있는 리스를 가지고 있으면 리스 파일 stat 한 번으로 끝남
+
+        Returns:
+            이번 호출에서 정리를 실행했으면 True
+        """
+        now = time.time()
+        if now - self._janitor_checked_at < JANITOR_INTERVAL_SEC:
+            return False
+        self._janitor_checked_at = now
+        if not self.janitor_lease.acquire():
+            return False
+        self.cleanup_expired_claims()
+        self.cleanup_expired_range_claims()
+        self.janitor_runs += 1
+        return True
+
+    # ===== 중복 렌더 감사 =====
+
+    def record_range_run(self, job: RenderJob, start_frame: int, end_frame: int, eye: str,
+                         started_at: float, finished_at: float, outcome: str):
+        """범위 실행 기록"""
+        self.audit.log_run(
+            job.job_id, render_target(job.output_dir, job.clip_path), eye,
+            start_frame, end_frame, started_at, finished_at, outcome
+        )
+
+    def get_duplicate_report(self, job_ids: List[str] = None) -> Dict[str, Any]:
+        """중복 렌더 리포트 (job_ids가 없으면 전체, 클레임 만료 판정은 범위 클레임 타임아웃 기준)"""
+        runs, resets = load_audit_dir(self.config.audit_dir)
+        if job_ids:
+            targets = set()
+            for job_id in job_ids:
+                job_data = self.load_job(job_id)
+                if job_data:
+                    targets.add(render_target(job_data["output_dir"], job_data["clip_path"]))
+            runs = [r for r in runs if r["target"] in targets]
+            resets = [r for r in resets if r["target"] in targets]
+        return build_duplicate_report(runs, resets, BATCH_CLAIM_TIMEOUT_SEC)
+
+    def get_io_stats(self) -> Dict[str, int]:
+        """스냅샷/매니페스트로 대체한 네트워크 stat 호출 통계"""
+        with self._snapshots_lock:
+            snapshots = [self.claims_snapshot, self.completed_snapshot] + list(self._snapshots.values())
+        stats = [snapshot.stats() for snapshot in snapshots]
+        return {
+            "scandir_passes": sum(s["scandir_passes"] for s in stats),
+            "lookups": sum(s["lookups"] for s in stats) + self.completion_lookups,
+            "stat_calls_avoided": sum(s["stat_calls_avoided"] for s in stats) + self.completion_lookups,
+        }
 
     def check_network_connection(self) -> bool:
         """네트워크 연결 확인"""
@@ -1027,29 +1471,28 @@ class FarmManager:
         if not self.last_job_id:
             return None
 
-        try:
-            job_file = self.config.jobs_dir / f"{self.last_job_id}.json"
-            if job_file.exists():
-                with open(job_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return RenderJob.from_dict(data)
-        except (json.JSONDecodeError, KeyError, OSError, IOError):
-            pass
-        return None
+        cached = self.job_cache.get(f"{self.last_job_id}.json")
+        return cached[1] if cached else None
 
     def release_my_claims(self):
-        """내 워커의 모든 클레임 해제 (네트워크 복구 시)"""
-        try:
-            for claim_file in self.config.claims_dir.glob("*.json"):
-                try:
-                    with open(claim_file, 'r', encoding='utf-8') as f:
-                        claim = FrameClaim.from_dict(json.load(f))
-                        if claim.worker_id == self.worker.worker_id:
-                            claim_file.unlink(missing_ok=True)
-                except (json.JSONDecodeError, KeyError, OSError, IOError):
-                    pass
-        except (OSError, IOError):
-            pass
+        """내 워커의 모든 클레임 해제 (네트워크 복구 시) - 실행 중 티켓은 pending으로 반환"""
+        my_root = self.config.tickets_dir / "running" / self.worker.worker_id
+        for job_id in self._snapshot(my_root).dirs():
+            snapshot = self._snapshot(my_root / job_id)
+            for name in snapshot.names(suffix=".ticket"):
+                parsed = self._parse_ticket_name(name)
+                if parsed:
+                    self.release_range_claim(job_id, *parsed)
+
+        for snapshot, folder, name in self._claim_files():
+            try:
+                with open(folder / name, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("worker_id") == self.worker.worker_id:
+                    (folder / name).unlink(missing_ok=True)
+                    snapshot.discard(name)
+            except (json.JSONDecodeError, AttributeError, OSError, IOError):
+                pass
 
     def delete_job(self, job_id: str):
         """작업 삭제"""
@@ -1057,27 +1500,36 @@ class FarmManager:
             # 작업 파일 삭제
             job_file = self.config.jobs_dir / f"{job_id}.json"
             job_file.unlink(missing_ok=True)
+            self.job_cache.invalidate(job_file.name)
 
-            # 관련 클레임 삭제
-            for claim_file in self.config.claims_dir.glob(f"{job_id}_*.json"):
-                claim_file.unlink(missing_ok=True)
+            # 관련 티켓/클레임/완료 기록 삭제 (폴더 rename + 백그라운드 삭제)
+            self._drop_job_tickets(job_id)
+            self._drop_job_claims(job_id)
+            self._drop_job_completion(job_id)
 
-            # 관련 완료 파일 삭제
-            for done_file in self.config.completed_dir.glob(f"{job_id}_*.done"):
-                done_file.unlink(missing_ok=True)
+            # 검증 표시
+            for suffix in (".verified", ".verifying"):
+                (self.config.completed_dir / f"{job_id}{suffix}").unlink(missing_ok=True)
+                self.completed_snapshot.discard(f"{job_id}{suffix}")
         except Exception as e:
             pass
 
     def reset_job(self, job_id: str):
         """작업 리셋 (클레임 및 완료 정보 초기화, EXR 파일은 유지)"""
+        job_data = self.load_job(job_id)
+        if job_data:
+            self.audit.log_reset(
+                job_id, render_target(job_data["output_dir"], job_data["clip_path"]), "",
+                list(range(job_data["start_frame"], job_data["end_frame"] + 1)), CAUSE_RESET, time.time()
+            )
         try:
-            # 클레임 삭제 (일반 클레임 + 범위 클레임)
-            for claim_file in self.config.claims_dir.glob(f"{job_id}_*.json"):
-                claim_file.unlink(missing_ok=True)
+            # 티켓/클레임 삭제 - 폴더 rename + 백그라운드 삭제 (티켓은 다음 탐색 시 다시 발행)
+            self._drop_job_tickets(job_id)
+            self._drop_job_claims(job_id)
 
-            # 완료 파일 삭제 (.done 파일)
-            for done_file in self.config.completed_dir.glob(f"{job_id}_*.done"):
-                done_file.unlink(missing_ok=True)
+            # 완료 기록 초기화 (매니페스트 폴더 + 이전 안 된 구버전 .done 파일)
+            self._drop_job_completion(job_id)
+            self.events.append(EVENT_RESET, job=job_id)
         except Exception as e:
             pass
 
@@ -1089,6 +1541,25 @@ class FarmManager:
         """작업을 활성 상태로 복원"""
         self._set_job_status(job_id, RenderJob.STATUS_ACTIVE)
 
+    def set_job_priority(self, job_id: str, priority: int, weight: float):
+        """작업 우선순위/가중치 변경"""
+        try:
+            job_file = self.config.jobs_dir / f"{job_id}.json"
+            if not job_file.exists():
+                return
+
+            with open(job_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            data["priority"] = int(priority)
+            data["weight"] = float(weight)
+
+            with open(job_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.job_cache.invalidate(job_file.name)
+        except Exception as e:
+            pass
+
     def _set_job_status(self, job_id: str, status: str):
         """작업 상태 변경"""
         try:
@@ -1103,11 +1574,11 @@ class FarmManager:
 
             with open(job_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+            self.job_cache.invalidate(job_file.name)
 
             # 제외 시 클레임만 해제 (빠름)
             if status == RenderJob.STATUS_EXCLUDED:
-                for claim_file in self.config.claims_dir.glob(f"{job_id}_*.json"):
-                    claim_file.unlink(missing_ok=True)
+                self._drop_job_claims(job_id)
         except Exception as e:
             pass
 
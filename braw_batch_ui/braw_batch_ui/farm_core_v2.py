@@ -10,14 +10,16 @@ import socket
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Any
 from dataclasses import dataclass
 
-from .config import settings, CLAIM_TIMEOUT_SEC, HEARTBEAT_INTERVAL_SEC
+from .config import settings, CLAIM_TIMEOUT_SEC, HEARTBEAT_INTERVAL_SEC, SEQ_INDEX_TTL_SEC
 from .farm_db import (
     FarmDatabase, init_database, get_database, get_default_db_path,
-    Pool, Job, Worker, JobStatus, FrameStatus
+    Pool, Job, Worker, JobStatus, FrameStatus, JobPage, FrameRuns
 )
+from .seq_index import get_sequence_index, STATUS_BAD
+from .render_audit import render_target, build_duplicate_report
 
 
 def get_local_ip() -> str:
@@ -165,6 +167,10 @@ class FarmManagerV2:
         """모든 작업 + 상태"""
         return self.db.get_all_jobs(include_excluded)
 
+    def query_jobs(self, **filters) -> JobPage:
+        """작업 목록 한 페이지 (필터/정렬/페이지 - FarmDatabase.query_jobs 참고)"""
+        return self.db.query_jobs(**filters)
+
     def set_job_status(self, job_id: str, status: str):
         """작업 상태 변경"""
         status_map = {
@@ -214,6 +220,10 @@ class FarmManagerV2:
         """작업별 눈(eye) 진행률 조회"""
         return self.db.get_job_eye_progress(job_id)
 
+    def get_frame_runs(self, job_id: str) -> Optional[FrameRuns]:
+        """작업의 eye별 프레임 상태 구간 (히트맵용)"""
+        return self.db.get_frame_runs(job_id)
+
     def get_active_workers(self) -> List[Worker]:
         """활성 워커 목록"""
         return self.db.get_active_workers()
@@ -225,16 +235,30 @@ class FarmManagerV2:
 
     # ===== Frame 처리 (워커용) =====
 
-    def claim_frames(self, batch_size: int = None) -> Optional[Tuple[str, int, int, str]]:
+    def claim_frames(self, batch_size: int = None, defer_sbs: bool = False) -> Optional[Tuple[str, int, int, str]]:
         """프레임 범위 클레임
 
+        Args:
+            defer_sbs: L/R도 렌더하는 작업의 SBS 프레임은 조립으로 미룸 (이 워커가 조립 가능할 때만)
+
         Returns:
             (job_id, start_frame, end_frame, eye) 또는 None
         """
         if batch_size is None:
             batch_size = settings.batch_frame_size
 
-        return self.db.claim_frames(self.current_pool_id, self.worker_id, batch_size)
+        return self.db.claim_frames(self.current_pool_id, self.worker_id, batch_size, defer_sbs)
+
+    def claim_sbs_assembly(self, batch_size: int = None) -> Optional[Tuple[str, int, int]]:
+        """L/R 완료된 SBS 프레임 범위 클레임 (조립용)
+
+        Returns:
+            (job_id, start_frame, end_frame) 또는 None
+        """
+        if batch_size is None:
+            batch_size = settings.batch_frame_size
+
+        return self.db.claim_sbs_assembly(self.current_pool_id, self.worker_id, batch_size)
 
     def complete_frames(self, job_id: str, start_frame: int, end_frame: int, eye: str):
         """프레임 범위 완료"""
@@ -244,6 +268,46 @@ class FarmManagerV2:
         """프레임 범위 클레임 해제 (실패 시)"""
         self.db.release_frames(job_id, start_frame, end_frame, eye, self.worker_id)
 
+    # ===== 이미지 QC =====
+
+    def record_qc_results(self, results: List[Tuple[str, int, str, Dict]]):
+        """QC 결과 기록"""
+        self.db.record_qc_results(results, self.worker_id)
+
+    def flag_frames_for_rerender(self, job: Job, eye: str, frame_indices: List[int]) -> int:
+        """이상 프레임 재렌더 예약 (실제로 되돌린 프레임만 시퀀스 인덱스에 손상 표시) → 되돌린 프레임 수"""
+        reset = self.db.flag_frames_for_rerender(job.job_id, eye, frame_indices)
+        for frame_idx in reset:
+            output_file = self.get_output_file_path(job, frame_idx, eye)
+            get_sequence_index(output_file.parent, SEQ_INDEX_TTL_SEC).mark(output_file.name, STATUS_BAD)
+        return len(reset)
+
+    # ===== 중복 렌더 감사 =====
+
+    def record_range_run(self, job: Job, start_frame: int, end_frame: int, eye: str,
+                         started_at: float, finished_at: float, outcome: str):
+        """범위 실행 기록 (감사 실패는 무시)"""
+        try:
+            self.db.record_range_run(
+                job.job_id, render_target(job.output_dir, job.clip_path), eye,
+                start_frame, end_frame, self.worker_id, started_at, finished_at, outcome
+            )
+        except Exception:
+            pass
+
+    def record_frame_resets(self, job_id: str, eye: str, ranges: List[Tuple[int, int]], cause: str):
+        """프레임 리셋 기록 (eye '' = 모든 eye)"""
+        self.db.record_frame_resets(job_id, eye, ranges, cause)
+
+    def get_duplicate_report(self, job_ids: List[str] = None) -> Dict[str, Any]:
+        """중복 렌더 리포트 (job_ids가 없으면 전체)"""
+        targets = None
+        if job_ids:
+            jobs = [self.get_job(job_id) for job_id in job_ids]
+            targets = sorted({render_target(j.output_dir, j.clip_path) for j in jobs if j})
+        runs, resets = self.db.get_audit_records(targets)
+        return build_duplicate_report(runs, resets, CLAIM_TIMEOUT_SEC)
+
     # ===== Worker 관리 =====
 
     def get_workers_by_pool(self, pool_id: str = None) -> List[Worker]:
@@ -288,6 +352,27 @@ class FarmManagerV2:
             suffix = "_L" if eye == "left" else "_R"
             return output_dir / f"{clip_basename}{suffix}_{frame_idx:06d}{ext}"
 
+    def output_file_exists(self, output_file: Path) -> bool:
+        """출력 파일 존재 여부 (시퀀스 인덱스 조회 - 파일별 stat 없음)"""
+        return get_sequence_index(output_file.parent, SEQ_INDEX_TTL_SEC).exists(output_file.name)
+
+    def record_output_files(self, output_files: List[Path]) -> Dict[Path, bool]:
+        """방금 렌더한 출력 파일을 확인하고 시퀀스 인덱스에 증분 기록
+
+        Returns:
+            {경로: 존재 여부}
+        """
+        by_folder = {}
+        for output_file in output_files:
+            by_folder.setdefault(output_file.parent, []).append(output_file)
+
+        result = {}
+        for folder, files in by_folder.items():
+            probed = get_sequence_index(folder, SEQ_INDEX_TTL_SEC).probe(f.name for f in files)
+            for f in files:
+                result[f] = probed.get(f.name) is not None
+        return result
+
     def close(self):
         """리소스 정리"""
         self.update_heartbeat("offline")
@@ -10,6 +10,8 @@ import threading
 import socket
 import json
 import os
+import re
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Tuple, Any
@@ -17,7 +19,8 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 
-from .config import CLAIM_TIMEOUT_SEC, WORKER_TIMEOUT_SEC
+from .config import CLAIM_TIMEOUT_SEC, WORKER_TIMEOUT_SEC, SBS_ASSEMBLY_MAX_RETRIES, QC_MAX_RERENDERS
+from .render_audit import render_target, frames_to_ranges, CAUSE_RERENDER, CAUSE_RESET
 
 
 class JobStatus(Enum):
@@ -75,6 +78,54 @@ class Job:
         return (self.end_frame - self.start_frame + 1) * len(self.eyes)
 
 
+@dataclass
+class JobPage:
+    """작업 목록 한 페이지 (query_jobs 결과)"""
+    rows: List[Tuple[Job, str, int, int]]  # (작업, 상태, 완료 프레임, 전체 프레임)
+    eye_progress: Dict[str, Dict[str, Dict[str, int]]]  # 작업 ID -> eye -> 상태별 프레임 수
+    total: int  # 필터에 맞는 전체 작업 수
+    status_counts: Dict[str, int]  # 상태 필터를 뺀 나머지 필터 기준 jobs.status별 작업 수
+    offset: int = 0
+    limit: int = 0
+
+
+@dataclass
+class FrameRuns:
+    """작업 한 개의 프레임 상태 구간 (get_frame_runs 결과)"""
+    job_id: str
+    start_frame: int
+    end_frame: int
+    eyes: List[str]
+    runs: Dict[str, List[Tuple[int, int, str, str]]]  # eye -> [(시작 프레임, 끝 프레임, 상태, 워커 ID)] 시작 순
+
+
+# query_jobs 정렬 키 -> 컬럼 (허용 목록)
+JOB_SORT_COLUMNS = {
+    "job_id": "job_id",
+    "clip_name": "clip_name COLLATE NOCASE",
+    "start_frame": "start_frame",
+    "pool_id": "pool_id",
+    "status": "status",
+    "priority": "priority",
+    "created_at": "created_at",
+}
+
+
+# farm_state 카운터 -> (테이블, 트리거 이벤트) - 프레임은 상태 변경만 (삽입/삭제는 jobs 변경과 같은 트랜잭션)
+STATE_VERSION_TRIGGERS = [
+    ("jobs", "jobs", ["INSERT", "UPDATE", "DELETE"]),
+    ("jobs", "frames", ["UPDATE OF status"]),
+    ("workers", "workers", ["INSERT", "UPDATE", "DELETE"]),
+]
+
+
+def clip_name_of(clip_path: str) -> str:
+    """클립 경로의 파일 이름 (확장자 제외, / 와 \\ 구분자 모두 처리)"""
+    name = re.split(r"[\\/]", clip_path)[-1]
+    stem, dot, _ = name.rpartition(".")
+    return stem if dot and stem else name
+
+
 @dataclass
 class Worker:
     """워커 정보"""
@@ -178,6 +229,7 @@ class FarmDatabase:
                 claimed_at TEXT,
                 completed_at TEXT,
                 retry_count INTEGER DEFAULT 0,
+                qc_rerenders INTEGER DEFAULT 0,
                 FOREIGN KEY (job_id) REFERENCES jobs(job_id),
                 UNIQUE(job_id, frame_idx, eye)
             )
@@ -198,13 +250,99 @@ class FarmDatabase:
             )
         """)
 
+        # 이미지 QC 결과 테이블 (프레임별 최신 결과)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS frame_qc (
+                job_id TEXT NOT NULL,
+                frame_idx INTEGER NOT NULL,
+                eye TEXT NOT NULL,
+                status TEXT NOT NULL,
+                issues TEXT DEFAULT '',
+                stats TEXT DEFAULT '{}',
+                worker_id TEXT DEFAULT '',
+                checked_at TEXT NOT NULL,
+                PRIMARY KEY (job_id, frame_idx, eye)
+            )
+        """)
+
+        # 클립 메타데이터 캐시 테이블 (braw_cli --info 결과 공유, ClipMetadataCache가 읽고 씀)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS clip_metadata (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                frame_count INTEGER NOT NULL,
+                width INTEGER DEFAULT 0,
+                height INTEGER DEFAULT 0,
+                fps REAL DEFAULT 0,
+                stereo INTEGER DEFAULT 0,
+                probed_at TEXT NOT NULL
+            )
+        """)
+
+        # 범위 실행 감사 테이블 (중복 렌더 집계용, 시간은 epoch 초)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS range_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL,
+                target TEXT NOT NULL,
+                eye TEXT NOT NULL,
+                start_frame INTEGER NOT NULL,
+                end_frame INTEGER NOT NULL,
+                worker_id TEXT NOT NULL,
+                started_at REAL NOT NULL,
+                finished_at REAL NOT NULL,
+                outcome TEXT NOT NULL
+            )
+        """)
+
+        # 프레임 리셋 감사 테이블 (재렌더/리셋으로 완료 프레임을 되돌린 기록, eye '' = 모든 eye)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS frame_resets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL,
+                target TEXT NOT NULL,
+                eye TEXT NOT NULL,
+                start_frame INTEGER NOT NULL,
+                end_frame INTEGER NOT NULL,
+                cause TEXT NOT NULL,
+                at REAL NOT NULL
+            )
+        """)
+
         # 인덱스 생성
         conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_pool ON jobs(pool_id)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_frames_job ON frames(job_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_frames_progress ON frames(job_id, eye, status)")  # 진행률 집계용 커버링 인덱스
         conn.execute("CREATE INDEX IF NOT EXISTS idx_frames_status ON frames(status)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_frames_fingerprint ON frames(job_id, status, claimed_at, completed_at)")  # get_frame_fingerprint 커버링 인덱스
         conn.execute("CREATE INDEX IF NOT EXISTS idx_frames_worker ON frames(worker_id)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_workers_pool ON workers(pool_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_range_runs_target ON range_runs(target)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_frame_resets_target ON frame_resets(target)")
+
+        self._migrate_clip_name(conn)
+        self._migrate_qc_rerenders(conn)
+
+        # 변경 카운터 (UI가 바뀐 것이 있을 때만 다시 조회하도록 트리거가 증가시킴)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS farm_state (
+                key TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        for key, table, events in STATE_VERSION_TRIGGERS:
+            conn.execute("INSERT OR IGNORE INTO farm_state (key, version) VALUES (?, 0)", (key,))
+            for event in events:
+                name = f"trg_{table}_{event.split()[0].lower()}_version"
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {table}
+                    BEGIN
+                        UPDATE farm_state SET version = version + 1 WHERE key = '{key}';
+                    END
+                """)
 
         # 기본 풀 생성
         conn.execute("""
@@ -213,6 +351,41 @@ class FarmDatabase:
         """, (datetime.now().isoformat(),))
 
 
+    def get_data_version(self) -> int:
+        """이 스레드 연결 기준 DB 변경 번호 (다른 연결이 커밋하면 바뀜 - 테이블을 읽지 않는 가벼운 확인)"""
+        conn = self._get_connection()
+        return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get_state_versions(self) -> Dict[str, int]:
+        """farm_state 변경 카운터 (jobs: 작업/프레임 상태, workers: 워커)"""
+        conn = self._get_connection()
+        return {r['key']: r['version'] for r in conn.execute("SELECT key, version FROM farm_state").fetchall()}
+
+    def _migrate_clip_name(self, conn: sqlite3.Connection):
+        """jobs.clip_name 컬럼(클립 이름 검색용) 추가 및 빈 값 채우기"""
+        columns = {r['name'] for r in conn.execute("PRAGMA table_info(jobs)").fetchall()}
+        if 'clip_name' not in columns:
+            try:
+                conn.execute("ALTER TABLE jobs ADD COLUMN clip_name TEXT")
+            except sqlite3.OperationalError:
+                pass  # 다른 프로세스가 먼저 추가함
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_clip_name ON jobs(clip_name COLLATE NOCASE)")
+
+        # 이전 버전 클라이언트가 넣은 작업은 clip_name이 비어 있음
+        missing = conn.execute("SELECT job_id, clip_path FROM jobs WHERE clip_name IS NULL").fetchall()
+        if missing:
+            conn.executemany("UPDATE jobs SET clip_name = ? WHERE job_id = ?",
+                             [(clip_name_of(r['clip_path']), r['job_id']) for r in missing])
+
+    def _migrate_qc_rerenders(self, conn: sqlite3.Connection):
+        """frames.qc_rerenders 컬럼(QC 재렌더 횟수 - 렌더 실패 retry_count와 별도) 추가"""
+        columns = {r['name'] for r in conn.execute("PRAGMA table_info(frames)").fetchall()}
+        if 'qc_rerenders' not in columns:
+            try:
+                conn.execute("ALTER TABLE frames ADD COLUMN qc_rerenders INTEGER DEFAULT 0")
+            except sqlite3.OperationalError:
+                pass  # 다른 프로세스가 먼저 추가함
+
     # ===== Pool 관리 =====
 
     def create_pool(self, pool: Pool) -> bool:
@@ -263,14 +436,15 @@ class FarmDatabase:
                     INSERT INTO jobs (job_id, pool_id, clip_path, output_dir, start_frame, end_frame,
                                      eyes, format, separate_folders, use_aces, color_input_space,
                                      color_output_space, use_stmap, stmap_path, status, priority,
-                                     created_at, created_by)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                     created_at, created_by, clip_name)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (job.job_id, job.pool_id, job.clip_path, job.output_dir,
                       job.start_frame, job.end_frame, json.dumps(job.eyes),
                       job.format, int(job.separate_folders), int(job.use_aces),
                       job.color_input_space, job.color_output_space,
                       int(job.use_stmap), job.stmap_path, job.status.value,
-                      job.priority, job.created_at.isoformat(), job.created_by))
+                      job.priority, job.created_at.isoformat(), job.created_by,
+                      clip_name_of(job.clip_path)))
 
                 # 프레임 레코드 생성
                 frames_data = []
@@ -293,7 +467,12 @@ class FarmDatabase:
         row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
         if not row:
             return None
-        return self._row_to_job(row)
+        return self.row_to_job(row)
+
+    def get_job_ids(self) -> set:
+        """등록된 모든 작업 ID"""
+        conn = self._get_connection()
+        return {r['job_id'] for r in conn.execute("SELECT job_id FROM jobs").fetchall()}
 
     def get_jobs_by_pool(self, pool_id: str, include_excluded: bool = False) -> List[Job]:
         """풀별 작업 목록"""
@@ -308,7 +487,7 @@ class FarmDatabase:
                 "SELECT * FROM jobs WHERE pool_id = ? AND status != 'excluded' ORDER BY priority DESC, created_at",
                 (pool_id,)
             ).fetchall()
-        return [self._row_to_job(r) for r in rows]
+        return [self.row_to_job(r) for r in rows]
 
     def get_all_jobs(self, include_excluded: bool = True) -> List[Tuple[Job, str, int, int]]:
         """모든 작업 + 상태 정보"""
@@ -325,33 +504,131 @@ class FarmDatabase:
 
         result = []
         for row in jobs_rows:
-            job = self._row_to_job(row)
+            job = self.row_to_job(row)
 
             # 진행률 조회
             stats = conn.execute("""
                 SELECT status, COUNT(*) as cnt FROM frames
                 WHERE job_id = ? GROUP BY status
             """, (job.job_id,)).fetchall()
+            counts = {s['status']: s['cnt'] for s in stats}
+            result.append(self._job_with_status(job, counts))
 
-            total = sum(s['cnt'] for s in stats)
-            completed = sum(s['cnt'] for s in stats if s['status'] == 'completed')
-            claimed = sum(s['cnt'] for s in stats if s['status'] == 'claimed')
+        return result
 
-            # 상태 결정 (claimed도 진행중으로 간주)
-            if job.status == JobStatus.EXCLUDED:
-                status = 'excluded'
-            elif job.status == JobStatus.PAUSED:
-                status = 'paused'
-            elif completed >= total and total > 0:
-                status = 'completed'
-            elif completed > 0 or claimed > 0:
-                status = 'in_progress'
-            else:
-                status = 'pending'
+    @staticmethod
+    def _job_with_status(job: Job, counts: Dict[str, int]) -> Tuple[Job, str, int, int]:
+        """프레임 상태별 개수로 표시 상태 결정 → (작업, 상태, 완료, 전체)"""
+        total = sum(counts.values())
+        completed = counts.get('completed', 0)
+        claimed = counts.get('claimed', 0)
+
+        # 상태 결정 (claimed도 진행중으로 간주)
+        if job.status == JobStatus.EXCLUDED:
+            status = 'excluded'
+        elif job.status == JobStatus.PAUSED:
+            status = 'paused'
+        elif completed >= total and total > 0:
+            status = 'completed'
+        elif completed > 0 or claimed > 0:
+            status = 'in_progress'
+        else:
+            status = 'pending'
+        return (job, status, completed, total)
+
+    def query_jobs(self, statuses: List[str] = None, pool_id: str = None, search: str = "",
+                   sort_by: str = "created_at", descending: bool = True,
+                   limit: int = 200, offset: int = 0) -> JobPage:
+        """작업 목록 한 페이지 조회 (필터/정렬/페이지는 DB에서, 진행률은 해당 페이지 작업만 집계)
+
+        Args:
+            statuses: jobs.status 값 목록 (None이면 전체)
+            pool_id: 풀 필터
+            search: 클립 이름 앞부분 (대소문자 무시, idx_jobs_clip_name 사용 - '*'는 임의 문자열)
+            sort_by: JOB_SORT_COLUMNS 키
+        """
+        conn = self._get_connection()
 
-            result.append((job, status, completed, total))
+        where, params = [], []
+        if pool_id:
+            where.append("pool_id = ?")
+            params.append(pool_id)
+        if search:
+            pattern = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_").replace("*", "%") + "%"
+            where.append("clip_name LIKE ? ESCAPE '\\'")
+            params.append(pattern)
+
+        # 상태별 개수 (상태 필터 제외)
+        base_sql = f"WHERE {' AND '.join(where)}" if where else ""
+        status_counts = {r['status']: r['cnt'] for r in conn.execute(
+            f"SELECT status, COUNT(*) as cnt FROM jobs {base_sql} GROUP BY status", params
+        ).fetchall()}
+
+        if statuses is not None:
+            where.append(f"status IN ({','.join('?' * len(statuses))})")
+            params += list(statuses)
+            total = sum(status_counts.get(st, 0) for st in statuses)
+        else:
+            total = sum(status_counts.values())
+
+        order = JOB_SORT_COLUMNS.get(sort_by, "created_at")
+        direction = "DESC" if descending else "ASC"
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+        jobs_rows = conn.execute(
+            f"SELECT * FROM jobs {where_sql} ORDER BY {order} {direction}, job_id {direction} LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+        jobs = [self.row_to_job(r) for r in jobs_rows]
+
+        # 페이지 작업의 eye/상태별 프레임 수 (쿼리 한 번)
+        eye_progress: Dict[str, Dict[str, Dict[str, int]]] = {job.job_id: {} for job in jobs}
+        if jobs:
+            job_ids = list(eye_progress)
+            self.add_eye_counts(eye_progress, conn.execute(f"""
+                SELECT job_id, eye, status, COUNT(*) as cnt FROM frames
+                WHERE job_id IN ({','.join('?' * len(job_ids))})
+                GROUP BY job_id, eye, status
+            """, job_ids).fetchall())
+
+        return JobPage(self.jobs_with_status(jobs, eye_progress), eye_progress, total, status_counts, offset, limit)
+
+    @staticmethod
+    def add_eye_counts(eye_progress: Dict[str, Dict[str, Dict[str, int]]], rows):
+        """(job_id, eye, status, cnt) 행을 작업 ID -> eye -> 상태별 개수로 누적"""
+        for job_id, eye, status, cnt in rows:
+            eyes = eye_progress.setdefault(job_id, {})
+            if eye not in eyes:
+                eyes[eye] = {'pending': 0, 'claimed': 0, 'completed': 0, 'failed': 0, 'total': 0}
+            eyes[eye][status] = cnt
+            eyes[eye]['total'] += cnt
+
+    @classmethod
+    def jobs_with_status(cls, jobs: List[Job],
+                         eye_progress: Dict[str, Dict[str, Dict[str, int]]]) -> List[Tuple[Job, str, int, int]]:
+        """eye별 진행률로 (작업, 상태, 완료, 전체) 목록 생성"""
+        rows = []
+        for job in jobs:
+            counts: Dict[str, int] = {}
+            for eye_counts in eye_progress.get(job.job_id, {}).values():
+                for st, cnt in eye_counts.items():
+                    if st != 'total':
+                        counts[st] = counts.get(st, 0) + cnt
+            rows.append(cls._job_with_status(job, counts))
+        return rows
+
+    def get_job_records(self) -> List[Dict[str, Any]]:
+        """모든 작업의 원본 컬럼 값 (상태 스냅샷 발행용)"""
+        conn = self._get_connection()
+        return [dict(r) for r in conn.execute("SELECT * FROM jobs").fetchall()]
 
-        return result
+    def get_all_eye_progress(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """모든 작업의 eye/상태별 프레임 수 (GROUP BY 한 번)"""
+        conn = self._get_connection()
+        eye_progress: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self.add_eye_counts(eye_progress, conn.execute("""
+            SELECT job_id, eye, status, COUNT(*) as cnt FROM frames GROUP BY job_id, eye, status
+        """).fetchall())
+        return eye_progress
 
     def set_job_status(self, job_id: str, status: JobStatus):
         """작업 상태 변경"""
@@ -374,20 +651,27 @@ class FarmDatabase:
         """작업 삭제"""
         with self.transaction() as conn:
             conn.execute("DELETE FROM frames WHERE job_id = ?", (job_id,))
+            conn.execute("DELETE FROM frame_qc WHERE job_id = ?", (job_id,))
             conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
 
     def reset_job(self, job_id: str):
         """작업 리셋 (모든 프레임 pending으로)"""
         with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT start_frame, end_frame FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row:
+                self._log_frame_resets(conn, job_id, "", [(row['start_frame'], row['end_frame'])], CAUSE_RESET)
             conn.execute("""
                 UPDATE frames SET status = 'pending', worker_id = NULL,
-                       claimed_at = NULL, completed_at = NULL, retry_count = 0
+                       claimed_at = NULL, completed_at = NULL, retry_count = 0, qc_rerenders = 0
                 WHERE job_id = ?
             """, (job_id,))
             conn.execute("UPDATE jobs SET status = 'pending' WHERE job_id = ?", (job_id,))
 
-    def _row_to_job(self, row: sqlite3.Row) -> Job:
-        """Row를 Job 객체로 변환"""
+    @staticmethod
+    def row_to_job(row) -> Job:
+        """Row(또는 같은 키의 dict)를 Job 객체로 변환"""
         return Job(
             job_id=row['job_id'],
             pool_id=row['pool_id'],
@@ -423,14 +707,38 @@ class FarmDatabase:
         """, (pool_id,)).fetchone()
         return result['cnt'] if result else 0
 
-    def claim_frames(self, pool_id: str, worker_id: str, batch_size: int = 10) -> Optional[Tuple[str, int, int, str]]:
+    # SBS 프레임 f의 L/R 프레임 행이 모두 있는지 (= SBS 조립 대상이 될 수 있는지)
+    _SBS_HAS_LR = """
+        EXISTS (SELECT 1 FROM frames l WHERE l.job_id = f.job_id AND l.frame_idx = f.frame_idx AND l.eye = 'left')
+        AND EXISTS (SELECT 1 FROM frames r WHERE r.job_id = f.job_id AND r.frame_idx = f.frame_idx AND r.eye = 'right')
+    """
+
+    # SBS 프레임 f의 L/R이 모두 완료됐는지 (= 지금 조립 가능)
+    _SBS_LR_COMPLETED = """
+        EXISTS (SELECT 1 FROM frames l WHERE l.job_id = f.job_id AND l.frame_idx = f.frame_idx
+                AND l.eye = 'left' AND l.status = 'completed')
+        AND EXISTS (SELECT 1 FROM frames r WHERE r.job_id = f.job_id AND r.frame_idx = f.frame_idx
+                    AND r.eye = 'right' AND r.status = 'completed')
+    """
+
+    def claim_frames(self, pool_id: str, worker_id: str, batch_size: int = 10,
+                     defer_sbs: bool = False) -> Optional[Tuple[str, int, int, str]]:
         """프레임 범위 클레임 (원자적 처리)
 
+        Args:
+            defer_sbs: L/R도 렌더하는 작업의 SBS 프레임은 디코딩하지 않고 조립으로 미룸
+                       (조립이 SBS_ASSEMBLY_MAX_RETRIES번 실패한 프레임은 다시 디코딩 대상)
+
         Returns:
             (job_id, start_frame, end_frame, eye) 또는 None
         """
         now = datetime.now().isoformat()
         timeout = (datetime.now() - timedelta(seconds=CLAIM_TIMEOUT_SEC)).isoformat()
+        sbs_filter = ""
+        sbs_params = []
+        if defer_sbs:
+            sbs_filter = f"AND (f.eye != 'sbs' OR f.retry_count >= ? OR NOT ({self._SBS_HAS_LR}))"
+            sbs_params = [SBS_ASSEMBLY_MAX_RETRIES]
 
         with self.transaction() as conn:
             # 만료된 클레임 정리
@@ -440,15 +748,15 @@ class FarmDatabase:
             """, (timeout,))
 
             # 해당 풀의 대기 중인 작업에서 프레임 찾기
-            row = conn.execute("""
+            row = conn.execute(f"""
                 SELECT f.job_id, f.frame_idx, f.eye, j.priority
                 FROM frames f
                 JOIN jobs j ON f.job_id = j.job_id
                 WHERE j.pool_id = ? AND j.status NOT IN ('excluded', 'paused', 'completed')
-                  AND f.status = 'pending'
+                  AND f.status = 'pending' {sbs_filter}
                 ORDER BY j.priority DESC, j.created_at, f.frame_idx, f.eye
                 LIMIT 1
-            """, (pool_id,)).fetchone()
+            """, [pool_id] + sbs_params).fetchone()
 
             if not row:
                 return None
@@ -458,13 +766,13 @@ class FarmDatabase:
             eye = row['eye']
 
             # 연속된 프레임 범위 클레임
-            frames_to_claim = conn.execute("""
-                SELECT frame_idx FROM frames
-                WHERE job_id = ? AND eye = ? AND status = 'pending'
-                  AND frame_idx >= ?
-                ORDER BY frame_idx
+            frames_to_claim = conn.execute(f"""
+                SELECT f.frame_idx FROM frames f
+                WHERE f.job_id = ? AND f.eye = ? AND f.status = 'pending'
+                  AND f.frame_idx >= ? {sbs_filter}
+                ORDER BY f.frame_idx
                 LIMIT ?
-            """, (job_id, eye, start_frame, batch_size)).fetchall()
+            """, [job_id, eye, start_frame] + sbs_params + [batch_size]).fetchall()
 
             if not frames_to_claim:
                 return None
@@ -487,6 +795,57 @@ class FarmDatabase:
 
             return (job_id, start_frame, end_frame, eye)
 
+    def claim_sbs_assembly(self, pool_id: str, worker_id: str,
+                           batch_size: int = 10) -> Optional[Tuple[str, int, int]]:
+        """L/R이 모두 완료된 SBS 프레임의 연속 범위 클레임 (조립용, 원자적 처리)
+
+        Returns:
+            (job_id, start_frame, end_frame) 또는 None
+        """
+        now = datetime.now().isoformat()
+
+        with self.transaction() as conn:
+            row = conn.execute(f"""
+                SELECT f.job_id, f.frame_idx
+                FROM frames f
+                JOIN jobs j ON f.job_id = j.job_id
+                WHERE j.pool_id = ? AND j.status NOT IN ('excluded', 'paused', 'completed')
+                  AND f.eye = 'sbs' AND f.status = 'pending' AND f.retry_count < ?
+                  AND {self._SBS_LR_COMPLETED}
+                ORDER BY j.priority DESC, j.created_at, f.frame_idx
+                LIMIT 1
+            """, (pool_id, SBS_ASSEMBLY_MAX_RETRIES)).fetchone()
+
+            if not row:
+                return None
+
+            job_id = row['job_id']
+            start_frame = row['frame_idx']
+
+            candidates = conn.execute(f"""
+                SELECT f.frame_idx FROM frames f
+                WHERE f.job_id = ? AND f.eye = 'sbs' AND f.status = 'pending'
+                  AND f.frame_idx >= ? AND f.retry_count < ?
+                  AND {self._SBS_LR_COMPLETED}
+                ORDER BY f.frame_idx
+                LIMIT ?
+            """, (job_id, start_frame, SBS_ASSEMBLY_MAX_RETRIES, batch_size)).fetchall()
+
+            # 완료 처리가 범위(BETWEEN) 단위이므로 연속 구간만 클레임
+            frame_indices = [start_frame]
+            for r in candidates[1:]:
+                if r['frame_idx'] != frame_indices[-1] + 1:
+                    break
+                frame_indices.append(r['frame_idx'])
+            end_frame = frame_indices[-1]
+
+            conn.execute("""
+                UPDATE frames SET status = 'claimed', worker_id = ?, claimed_at = ?
+                WHERE job_id = ? AND eye = 'sbs' AND frame_idx BETWEEN ? AND ?
+            """, (worker_id, now, job_id, start_frame, end_frame))
+
+            return (job_id, start_frame, end_frame)
+
     def complete_frames(self, job_id: str, start_frame: int, end_frame: int, eye: str, worker_id: str):
         """프레임 범위 완료 처리"""
         now = datetime.now().isoformat()
@@ -558,6 +917,45 @@ class FarmDatabase:
             result[eye]['total'] = sum(v for k, v in result[eye].items() if k != 'total')
         return result
 
+    def get_frame_fingerprint(self, job_id: str) -> Tuple:
+        """작업 프레임 상태의 변경 지문 (상태별 수 + 최근 클레임/완료 시각)
+
+        get_frame_runs 재조회 여부 판단용 - 커버링 인덱스만 훑으므로 구간 self-join보다 훨씬 가벼움
+        (진행 수가 같은 재클레임도 claimed_at이 바뀌어 잡힘)
+        """
+        conn = self._get_connection()
+        rows = conn.execute("""
+            SELECT status, COUNT(*), MAX(claimed_at), MAX(completed_at) FROM frames
+            WHERE job_id = ? GROUP BY status ORDER BY status
+        """, (job_id,)).fetchall()
+        return tuple(tuple(r) for r in rows)
+
+    def get_frame_runs(self, job_id: str) -> Optional[FrameRuns]:
+        """작업의 eye별 프레임 상태 구간 (상태/워커가 같은 연속 프레임을 한 구간으로)
+
+        직전 프레임과 상태/워커가 다른 프레임(구간 시작)만 SQL에서 골라 가져오므로 행 수 = 구간 수
+        (구간 끝 = 다음 구간 시작 - 1, 마지막 구간은 작업 끝 프레임)
+        """
+        conn = self._get_connection()
+        job = conn.execute("SELECT start_frame, end_frame, eyes FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if not job:
+            return None
+        starts = conn.execute("""
+            SELECT f.eye, f.frame_idx, f.status, IFNULL(f.worker_id, '') AS worker_id
+            FROM frames f
+            LEFT JOIN frames p ON p.job_id = f.job_id AND p.frame_idx = f.frame_idx - 1 AND p.eye = f.eye
+            WHERE f.job_id = ?
+              AND (p.id IS NULL OR p.status IS NOT f.status OR p.worker_id IS NOT f.worker_id)
+            ORDER BY f.eye, f.frame_idx
+        """, (job_id,)).fetchall()
+
+        runs: Dict[str, List[Tuple[int, int, str, str]]] = {}
+        for i, r in enumerate(starts):
+            nxt = starts[i + 1] if i + 1 < len(starts) else None
+            end = nxt['frame_idx'] - 1 if nxt is not None and nxt['eye'] == r['eye'] else job['end_frame']
+            runs.setdefault(r['eye'], []).append((r['frame_idx'], end, r['status'], r['worker_id']))
+        return FrameRuns(job_id, job['start_frame'], job['end_frame'], json.loads(job['eyes']), runs)
+
     def get_active_workers(self) -> List[Worker]:
         """모든 워커 목록 (오프라인 포함, 24시간 이내)"""
         conn = self._get_connection()
@@ -720,6 +1118,115 @@ class FarmDatabase:
                     WHERE worker_id = ?
                 """, (w['worker_id'],))
 
+    # ===== 이미지 QC =====
+
+    def record_qc_results(self, results: List[Tuple[str, int, str, Dict[str, Any]]], worker_id: str):
+        """QC 결과 일괄 기록
+
+        Args:
+            results: [(job_id, frame_idx, eye, analyze_frame 결과), ...]
+        """
+        if not results:
+            return
+        now = datetime.now().isoformat()
+        rows = [
+            (job_id, frame_idx, eye, r['status'], ','.join(r['issues']),
+             json.dumps(r['stats']), worker_id, now)
+            for job_id, frame_idx, eye, r in results
+        ]
+        with self.transaction() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO frame_qc
+                    (job_id, frame_idx, eye, status, issues, stats, worker_id, checked_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
+    def flag_frames_for_rerender(self, job_id: str, eye: str, frame_indices: List[int]) -> List[int]:
+        """이상 프레임을 pending으로 되돌려 재렌더 (완료된 작업도 다시 진행 중으로) → 되돌린 프레임 번호
+
+        QC 재렌더가 QC_MAX_RERENDERS에 닿은 프레임은 되돌리지 않음 - 원본 자체가 검은/평탄한 프레임이면
+        완료 상태로 두고 QC 결과만 남김 (렌더 실패 retry_count는 건드리지 않음)
+        """
+        if not frame_indices:
+            return []
+        placeholders = ','.join('?' * len(frame_indices))
+        with self.transaction() as conn:
+            rows = conn.execute(f"""
+                SELECT id, frame_idx FROM frames
+                WHERE job_id = ? AND eye = ? AND status = 'completed' AND qc_rerenders < ?
+                  AND frame_idx IN ({placeholders})
+            """, [job_id, eye, QC_MAX_RERENDERS] + list(frame_indices)).fetchall()
+            if not rows:
+                return []
+            conn.executemany("""
+                UPDATE frames SET status = 'pending', worker_id = NULL, claimed_at = NULL,
+                       completed_at = NULL, qc_rerenders = qc_rerenders + 1
+                WHERE id = ?
+            """, [(r['id'],) for r in rows])
+            conn.execute("""
+                UPDATE jobs SET status = 'in_progress'
+                WHERE job_id = ? AND status = 'completed'
+            """, (job_id,))
+            reset = sorted(r['frame_idx'] for r in rows)
+            self._log_frame_resets(conn, job_id, eye, frames_to_ranges(reset), CAUSE_RERENDER)
+            return reset
+
+    def get_qc_summary(self, job_id: str) -> Dict[str, int]:
+        """작업의 QC 결과 요약 {status: count}"""
+        conn = self._get_connection()
+        rows = conn.execute("""
+            SELECT status, COUNT(*) as cnt FROM frame_qc
+            WHERE job_id = ? GROUP BY status
+        """, (job_id,)).fetchall()
+        return {r['status']: r['cnt'] for r in rows}
+
+    # ===== 중복 렌더 감사 =====
+
+    def _log_frame_resets(self, conn: sqlite3.Connection, job_id: str, eye: str,
+                          ranges: List[Tuple[int, int]], cause: str):
+        """프레임 리셋 기록 (호출자 트랜잭션 안에서)"""
+        row = conn.execute("SELECT output_dir, clip_path FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if not row or not ranges:
+            return
+        target = render_target(row['output_dir'], row['clip_path'])
+        now = time.time()
+        conn.executemany("""
+            INSERT INTO frame_resets (job_id, target, eye, start_frame, end_frame, cause, at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [(job_id, target, eye, start, end, cause, now) for start, end in ranges])
+
+    def record_frame_resets(self, job_id: str, eye: str, ranges: List[Tuple[int, int]], cause: str):
+        """프레임 리셋 기록 (재렌더 작업 생성 등 DB 밖에서 되돌린 경우)"""
+        with self.transaction() as conn:
+            self._log_frame_resets(conn, job_id, eye, ranges, cause)
+
+    def record_range_run(self, job_id: str, target: str, eye: str, start_frame: int, end_frame: int,
+                         worker_id: str, started_at: float, finished_at: float, outcome: str):
+        """범위 실행 기록"""
+        conn = self._get_connection()
+        conn.execute("""
+            INSERT INTO range_runs
+                (job_id, target, eye, start_frame, end_frame, worker_id, started_at, finished_at, outcome)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (job_id, target, eye, start_frame, end_frame, worker_id, started_at, finished_at, outcome))
+
+    def get_audit_records(self, targets: List[str] = None) -> Tuple[List[Dict], List[Dict]]:
+        """감사 기록 조회 → (runs, resets). targets가 없으면 전체"""
+        conn = self._get_connection()
+        where, params = "", []
+        if targets:
+            where = f"WHERE target IN ({','.join('?' * len(targets))})"
+            params = list(targets)
+        runs = conn.execute(f"""
+            SELECT job_id, target, eye, start_frame, end_frame, worker_id, started_at, finished_at, outcome
+            FROM range_runs {where}
+        """, params).fetchall()
+        resets = conn.execute(f"""
+            SELECT job_id, target, eye, start_frame, end_frame, cause, at
+            FROM frame_resets {where}
+        """, params).fetchall()
+        return [dict(r) for r in runs], [dict(r) for r in resets]
+
     def close(self):
         """연결 종료"""
         if hasattr(self._local, 'conn') and self._local.conn:
@@ -14,7 +14,7 @@ import json
 import threading
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import time
 
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
@@ -27,14 +27,33 @@ from PySide6.QtCore import Qt, QTimer, Signal, QThread, QUrl
 from PySide6.QtGui import QFont, QColor, QAction, QDesktopServices, QIcon
 
 from farm_core import FarmManager, RenderJob, WorkerInfo
+from render_audit import RUN_OK, RUN_FAILED, format_report
+from event_journal import JournalTailer, EVENT_HEARTBEAT
+from log_sink import LogSink, LogView, LOG_DEBUG
+from clip_metadata import ClipMetadataCache, parse_info, clip_info_from
 from config import (
     settings,
+    WORKER_TIMEOUT_SEC,
+    STATUS_FULL_SYNC_SEC,
     SUBPROCESS_TIMEOUT_DEFAULT_SEC,
     SUBPROCESS_TIMEOUT_ACES_SEC,
     CLIP_INFO_TIMEOUT_SEC,
+    CLIP_METADATA_RETRY_SEC,
+    CLIP_METADATA_BUSY_TIMEOUT_SEC,
     LOG_MAX_LINES,
+    LOG_RING_RECORDS,
+    LOG_PENDING_MAX,
+    LOG_FLUSH_INTERVAL_MS,
+    LOG_FLUSH_MAX_RECORDS,
+    LOG_FILE_MAX_BYTES,
+    LOG_FILE_BACKUP_COUNT,
+    LOG_SEARCH_MAX_RESULTS,
     BATCH_FRAME_SIZE,
     BATCH_CLAIM_TIMEOUT_SEC,
+    WORKER_SLOT_WAIT_SEC,
+    WORKER_JOB_SCAN_INTERVAL_SEC,
+    JOB_PRIORITY_DEFAULT,
+    JOB_WEIGHT_DEFAULT,
 )
 
 
@@ -381,7 +400,11 @@ class SettingsDialog(QDialog):
 
 
 class StatusUpdateThread(QThread):
-    """상태 업데이트 스레드 (UI 블로킹 방지, 실시간 동기화)"""
+    """상태 업데이트 스레드 (UI 블로킹 방지, 실시간 동기화)
+
+    시작 시(와 STATUS_FULL_SYNC_SEC마다) 전체 동기화 후에는 워커 이벤트 저널의 새 줄만 읽어
+    워커 목록과 변화가 있는 작업의 진행률만 다시 계산 (갱신 비용 = 새 이벤트 수)
+    """
     workers_signal = Signal(list)
     jobs_signal = Signal(list)  # List of (RenderJob, status, completed, total)
 
@@ -390,14 +413,67 @@ class StatusUpdateThread(QThread):
         self.farm_manager = farm_manager
         self.is_running = False
         self._last_job_ids = set()  # 마지막으로 확인한 작업 ID 캐시
+        self._last_jobs_key = None  # 마지막으로 보낸 작업 목록 (세대 번호, 작업별 상태/진행률)
+
+        # 메모리 상태 모델 (이벤트로 갱신)
+        self.journal = JournalTailer(farm_manager.config.events_dir)
+        self._workers = {}  # worker_id -> WorkerInfo
+        self._jobs = {}  # job_id -> (RenderJob, status, completed, total)
+        self._jobs_generation = None
+        self._synced_at = 0.0
+
+    def full_sync(self):
+        """워커 파일 + 모든 작업 진행률 다시 읽기"""
+        self._workers = {w.worker_id: w for w in self.farm_manager.get_active_workers()}
+        self._jobs = {row[0].job_id: row for row in self.farm_manager.get_all_jobs_with_status()}
+        self._jobs_generation = self.farm_manager.jobs_generation
+        self._synced_at = time.time()
+
+    def apply_events(self, events: list):
+        """저널 이벤트 반영 (하트비트는 워커 정보 교체, 작업 이벤트는 해당 작업만 다시 계산)"""
+        dirty_jobs = set()
+        for event in events:
+            if event.get("ev") == EVENT_HEARTBEAT:
+                try:
+                    worker = WorkerInfo.from_dict(event["info"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                self._workers[worker.worker_id] = worker
+            elif event.get("job"):
+                dirty_jobs.add(event["job"])
+
+        # 작업 파일이 바뀌었으면 새로 생기거나 바뀐 작업도 다시 계산하고 사라진 작업은 제거
+        generation = self.farm_manager.jobs_generation
+        if generation != self._jobs_generation:
+            self._jobs_generation = generation
+            current = {job.job_id: job for job in self.farm_manager.get_all_jobs()}
+            for job_id in list(self._jobs):
+                if job_id not in current:
+                    del self._jobs[job_id]
+            for job_id, job in current.items():
+                if job_id not in self._jobs or self._jobs[job_id][0] is not job:
+                    self._jobs[job_id] = self.farm_manager.get_job_status(job)
+                    dirty_jobs.discard(job_id)
+
+        for job_id in dirty_jobs:
+            if job_id in self._jobs:
+                self._jobs[job_id] = self.farm_manager.get_job_status(self._jobs[job_id][0])
 
     def run(self):
         self.is_running = True
         while self.is_running:
             try:
-                workers = self.farm_manager.get_active_workers()
+                events, resync = self.journal.poll()
+                if resync or time.time() - self._synced_at >= STATUS_FULL_SYNC_SEC:
+                    self.full_sync()
+                else:
+                    self.apply_events(events)
+
+                now = datetime.now()
+                workers = [w for w in self._workers.values()
+                           if (now - w.last_heartbeat).total_seconds() < WORKER_TIMEOUT_SEC]
                 # 실시간 동기화: 모든 작업 + 상태 정보
-                jobs_with_status = self.farm_manager.get_all_jobs_with_status()
+                jobs_with_status = self.farm_manager.sort_jobs_with_status(list(self._jobs.values()))
 
                 # 현재 작업 ID 세트
                 current_job_ids = {job.job_id for job, _, _, _ in jobs_with_status}
@@ -410,7 +486,15 @@ class StatusUpdateThread(QThread):
                 self._last_job_ids = current_job_ids
 
                 self.workers_signal.emit(workers)
-                self.jobs_signal.emit(jobs_with_status)
+
+                # 작업 파일도 진행률도 그대로면 작업 테이블은 다시 그리지 않음
+                jobs_key = (
+                    self._jobs_generation,
+                    tuple((job.job_id, status, completed) for job, status, completed, _ in jobs_with_status),
+                )
+                if jobs_key != self._last_jobs_key:
+                    self._last_jobs_key = jobs_key
+                    self.jobs_signal.emit(jobs_with_status)
             except (OSError, IOError):
                 pass
             time.sleep(1)
@@ -421,13 +505,13 @@ class StatusUpdateThread(QThread):
 
 class WorkerThread(QThread):
     """워커 스레드 (폴더 감시 + 자동 처리)"""
-    log_signal = Signal(str)
     progress_signal = Signal(int, int)  # completed, total
     network_status_signal = Signal(bool)  # network connected
 
-    def __init__(self, farm_manager, cli_path, parallel_workers=10, watchdog_mode=True):
+    def __init__(self, farm_manager, cli_path, parallel_workers=10, watchdog_mode=True, log_sink=None):
         super().__init__()
         self.farm_manager = farm_manager
+        self.log_sink = log_sink or LogSink()
         self.cli_path = Path(cli_path)
         self.parallel_workers = parallel_workers
         self.watchdog_mode = watchdog_mode  # watchdog 모드 (새 작업 자동 감지)
@@ -438,78 +522,90 @@ class WorkerThread(QThread):
         self.total_processed = 0
         self.total_success = 0
         self.total_failed = 0
-        self.current_job_stats = {"success": 0, "failed": 0, "retried": 0}
+        self.job_stats = {}  # job_id -> {"success", "failed"} (이 워커가 처리한 프레임 수)
 
         # 현재 진행 중인 범위 추적 (graceful shutdown용)
         self.active_ranges = []  # [(job_id, start, end, eye), ...]
         self.active_ranges_lock = threading.Lock()
+        self.active_processes = set()  # 실행 중인 braw_cli 프로세스 (중지 타임아웃 시 종료)
+        self._processes_killed = False  # True면 새 프로세스를 시작하지 않음
+
+        # 네트워크 복구 후 이어서 처리할 마지막 작업
+        self._resume_job = None
+
+        # 미완료 작업 목록 캐시 (슬롯이 빌 때마다 작업 파일 전체를 읽지 않도록)
+        self._runnable_jobs = []
+        self._jobs_scanned_at = 0.0
+        self._drained_jobs = set()  # 남은 티켓이 없는 작업 (다음 목록 갱신까지 건너뜀)
 
         # 대기 상태 로그 제어
         self._idle_logged = False
 
+    def log(self, text, level=None):
+        """로그 기록 (UI는 LogView가 묶어서 표시)"""
+        self.log_sink.write(text, level)
+
     def run(self):
-        """워커 메인 루프"""
+        """워커 메인 루프 (연속 파이프라인: 슬롯이 비는 즉시 다음 범위 클레임)"""
         self.is_running = True
-        self.log_signal.emit("=== 워커 시작 ===")
-        self.log_signal.emit(f"워커 ID: {self.farm_manager.worker.worker_id}")
-        self.log_signal.emit(f"병렬 처리: {self.parallel_workers}")
-        self.log_signal.emit("")
+        self.log("=== 워커 시작 ===")
+        self.log(f"워커 ID: {self.farm_manager.worker.worker_id}")
+        self.log(f"병렬 처리: {self.parallel_workers}")
+        self.log("")
 
         network_error_count = 0
-        max_network_errors = 3
-
-        while self.is_running:
-            try:
-                # 네트워크 연결 확인
-                if not self.farm_manager.check_network_connection():
-                    network_error_count += 1
-                    if network_error_count == 1:
-                        self.log_signal.emit("⚠️ 네트워크 연결 끊김 - 재연결 대기 중...")
-                        self.network_status_signal.emit(False)
-                    elif network_error_count % 6 == 0:  # 30초마다 로그
-                        self.log_signal.emit(f"⏳ 네트워크 재연결 시도 중... ({network_error_count * 5}초 경과)")
-                    time.sleep(5)
-                    continue
-
-                # 네트워크 복구됨
-                if network_error_count > 0:
-                    self.log_signal.emit("✅ 네트워크 연결 복구됨")
-                    self.network_status_signal.emit(True)
-                    self.log_signal.emit("🔄 내 클레임 해제 및 마지막 작업 복구 시도...")
-
-                    # 내 클레임 해제
-                    self.farm_manager.release_my_claims()
 
-                    # 마지막 작업 이어서 처리
-                    last_job = self.farm_manager.get_last_job()
-                    if last_job:
-                        self.log_signal.emit(f"📥 마지막 작업 복구: {last_job.job_id}")
-                        self.process_job(last_job)
+        # 검증은 별도 스레드에서 (검증 중에도 빈 슬롯은 계속 채움)
+        verify_executor = ThreadPoolExecutor(max_workers=1)
 
-                    network_error_count = 0
-
-                # 만료된 클레임 정리
-                self.farm_manager.cleanup_expired_claims()
-
-                # 대기중인 작업 찾기 (완료되지 않은 것만)
-                jobs = self.farm_manager.get_pending_jobs()
-
-                # 완료되지 않은 작업만 필터링하고, 생성 시간순 정렬
-                incomplete_jobs = [j for j in jobs if not self.farm_manager.is_job_complete(j)]
-                incomplete_jobs.sort(key=lambda x: x.created_at)
+        with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
+            futures = {}  # future -> (job, start, end, eye, started_at)
 
-                if incomplete_jobs:
-                    # 첫 번째 미완료 작업만 처리 (한 파일 집중)
-                    job = incomplete_jobs[0]
-                    self._idle_logged = False  # 작업 시작하면 대기 로그 리셋
-                    if self.is_running:
-                        self.farm_manager.last_job_id = job.job_id
-                        self.process_job(job)
-                else:
-                    # 작업 없음 - watchdog 모드에 따라 처리
-                    if self.watchdog_mode:
+            # 중지 요청 후에도 진행 중인 범위는 끝까지 처리하고 완료 표시
+            while self.is_running or futures:
+                try:
+                    # 네트워크 연결 확인 (새로 클레임할 때만)
+                    if self.is_running and len(futures) < self.parallel_workers:
+                        if not self.farm_manager.check_network_connection():
+                            network_error_count += 1
+                            if network_error_count == 1:
+                                self.log("⚠️ 네트워크 연결 끊김 - 재연결 대기 중...")
+                                self.network_status_signal.emit(False)
+                            elif network_error_count % 6 == 0:  # 30초마다 로그
+                                self.log(f"⏳ 네트워크 재연결 시도 중... ({network_error_count * 5}초 경과)")
+                            if not futures:
+                                time.sleep(5)
+                                continue
+                        elif network_error_count > 0:
+                            self.log("✅ 네트워크 연결 복구됨")
+                            self.network_status_signal.emit(True)
+                            # 진행 중인 범위가 없을 때만 내 클레임 해제 (진행 중인 티켓은 유효)
+                            if not futures:
+                                self.log("🔄 내 클레임 해제 및 마지막 작업 복구 시도...")
+                                self.farm_manager.release_my_claims()
+
+                                # 마지막 작업을 다음 슬롯부터 우선 처리
+                                last_job = self.farm_manager.get_last_job()
+                                if last_job:
+                                    self.log(f"📥 마지막 작업 복구: {last_job.job_id}")
+                                    self._resume_job = last_job
+                                self._jobs_scanned_at = 0.0  # 해제한 티켓을 바로 다시 보도록
+                            network_error_count = 0
+
+                    # 빈 슬롯 채우기 (우선순위가 가장 높은 미완료 작업부터)
+                    if self.is_running and network_error_count == 0:
+                        self.refill_slots(executor, futures)
+
+                    if futures:
+                        self._idle_logged = False
+                        done, _ = wait(futures, timeout=WORKER_SLOT_WAIT_SEC, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            job, start_frame, end_frame, eye, started_at = futures.pop(future)
+                            self.finish_range(future, job, start_frame, end_frame, eye, started_at, verify_executor)
+                    elif self.watchdog_mode:
+                        # 작업 없음 - 새 작업 감시
                         if not self._idle_logged:
-                            self.log_signal.emit("🔍 대기 중 - 새 작업 감시 중... (5초마다 확인)")
+                            self.log("🔍 대기 중 - 새 작업 감시 중... (5초마다 확인)")
                             self.farm_manager.worker.status = "idle"
                             self.farm_manager.worker.current_job_id = ""
                             self.farm_manager.worker.current_clip_name = ""
@@ -518,50 +614,165 @@ class WorkerThread(QThread):
                         time.sleep(5)  # 5초 대기 후 다시 확인
                     else:
                         # watchdog 비활성화 - 종료
-                        self.log_signal.emit("✅ 모든 작업 완료 - 워커 중지 (Watchdog 비활성화)")
+                        self.log("✅ 모든 작업 완료 - 워커 중지 (Watchdog 비활성화)")
                         self.is_running = False
 
-            except (OSError, PermissionError) as e:
-                # 네트워크 오류로 처리
-                network_error_count += 1
-                if network_error_count == 1:
-                    self.log_signal.emit(f"⚠️ 네트워크 오류: {str(e)}")
-                time.sleep(5)
-            except Exception as e:
-                self.log_signal.emit(f"❌ 오류: {str(e)}")
-                time.sleep(5)
+                except (OSError, PermissionError) as e:
+                    # 네트워크 오류로 처리
+                    network_error_count += 1
+                    if network_error_count == 1:
+                        self.log(f"⚠️ 네트워크 오류: {str(e)}")
+                    time.sleep(5)
+                except Exception as e:
+                    self.log(f"❌ 오류: {str(e)}")
+                    time.sleep(5)
 
-        self.log_signal.emit("=== 워커 종료 ===")
+        verify_executor.shutdown(wait=True)
+
+        io_stats = self.farm_manager.get_io_stats()
+        self.log(
+            f"📂 폴더 캐시: scandir {io_stats['scandir_passes']}회, 조회 {io_stats['lookups']}회 "
+            f"(네트워크 stat {io_stats['stat_calls_avoided']}회 절약)"
+        )
+        self.log(f"  전체 누적 - 성공: {self.total_success}, 실패: {self.total_failed}")
+        self.log("=== 워커 종료 ===")
 
     def stop(self):
         """워커 종료 (graceful shutdown)"""
         self.is_stopping = True
         self.is_running = False
-        self.log_signal.emit("⏳ 워커 중지 요청 - 진행 중인 작업 완료 대기 중...")
+        self.log("⏳ 워커 중지 요청 - 진행 중인 작업 완료 대기 중...")
 
     def cleanup_active_ranges(self):
         """중지 시 완료되지 않은 범위 클레임 해제"""
         with self.active_ranges_lock:
             for job_id, start, end, eye in self.active_ranges:
                 self.farm_manager.release_range_claim(job_id, start, end, eye)
-                self.log_signal.emit(f"  🔓 클레임 해제: {start}-{end} ({eye})")
+                self.log(f"  🔓 클레임 해제: {start}-{end} ({eye})")
             self.active_ranges.clear()
 
-    def process_job(self, job: RenderJob):
-        """작업 처리 (100프레임 범위 기반 배치)"""
-        # 만료된 클레임 정리 (배치 시작 전)
-        self.farm_manager.cleanup_expired_claims()
-        self.farm_manager.cleanup_expired_range_claims()
+    def terminate_active_processes(self, timeout_sec: float = 10) -> bool:
+        """실행 중인 braw_cli 프로세스 종료 (terminate → kill), 모두 종료됐는지 반환"""
+        with self.active_ranges_lock:
+            self._processes_killed = True
+            procs = list(self.active_processes)
+        for proc in procs:
+            proc.terminate()
+        deadline = time.time() + timeout_sec
+        for proc in procs:
+            try:
+                proc.wait(timeout=max(0.0, deadline - time.time()))
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        for proc in procs:
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                return False
+        return True
 
-        # 현재 작업 통계 초기화
-        self.current_job_stats = {"success": 0, "failed": 0, "retried": 0}
+    def abort_active_ranges(self) -> bool:
+        """중지 타임아웃 시: 렌더 프로세스를 끝낸 뒤에만 남은 범위 클레임 해제
 
-        self.log_signal.emit(f"\n작업 발견: {job.job_id}")
-        self.log_signal.emit(f"  파일: {Path(job.clip_path).name}")
-        self.log_signal.emit(f"  범위: {job.start_frame}-{job.end_frame}")
-        self.log_signal.emit(f"  배치 크기: {settings.batch_frame_size}프레임")
+        프로세스 종료를 확인하지 못하면 클레임을 그대로 둠 (렌더가 계속되는 동안 다른 워커가
+        같은 프레임을 가져가지 않도록 - 클레임 만료 후 회수됨)
+        """
+        if not self.terminate_active_processes():
+            self.log("⚠️ 종료되지 않은 렌더 프로세스 - 클레임은 만료 후 회수됩니다")
+            return False
+        self.wait(5000)  # 종료된 범위는 워커 루프가 실패로 정리
+        self.cleanup_active_ranges()
+        return True
+
+    def run_cli(self, cmd, timeout_sec: float) -> subprocess.CompletedProcess:
+        """braw_cli 실행 (subprocess.run과 같은 결과, 중지 시 종료할 수 있도록 프로세스 추적)"""
+        with self.active_ranges_lock:
+            if self._processes_killed:
+                raise subprocess.SubprocessError("워커 중지 중 - 실행하지 않음")
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                creationflags=SUBPROCESS_FLAGS
+            )
+            self.active_processes.add(proc)
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout_sec)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        finally:
+            with self.active_ranges_lock:
+                self.active_processes.discard(proc)
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+    def get_runnable_jobs(self) -> list:
+        """미완료 작업 목록 (우선순위 순, WORKER_JOB_SCAN_INTERVAL_SEC마다 다시 읽음)"""
+        now = time.time()
+        if now - self._jobs_scanned_at >= WORKER_JOB_SCAN_INTERVAL_SEC:
+            # 만료된 클레임 정리 (정리 담당 리스를 가진 워커만 실제로 실행)
+            self.farm_manager.run_janitor()
+
+            jobs = self.farm_manager.get_pending_jobs()
+            jobs = [j for j in jobs if not self.farm_manager.is_job_complete(j)]
+            jobs.sort(key=lambda x: (-x.priority, x.created_at))  # 우선순위 → 먼저 제출된 작업 순
+            self._runnable_jobs = jobs
+            self._drained_jobs.clear()
+            self._jobs_scanned_at = now
+        return [j for j in self._runnable_jobs if j.job_id not in self._drained_jobs]
+
+    def refill_slots(self, executor, futures):
+        """빈 슬롯마다 다음 범위 클레임 후 제출 (작업 경계와 무관하게 슬롯을 계속 채움)
+
+        슬롯마다 작업을 다시 고름 - 우선순위가 높은 작업 먼저, 같은 우선순위는 가중치 비율대로 분산
+        """
+        while len(futures) < self.parallel_workers and self.is_running:
+            jobs = self.get_runnable_jobs()
+            if not jobs:
+                break
+            local_running = {}
+            for job, *_ in futures.values():
+                local_running[job.job_id] = local_running.get(job.job_id, 0) + 1
+
+            ordered = self.farm_manager.order_jobs_for_claim(jobs, local_running)
+            resume = self._resume_job
+            if resume is not None:
+                # 네트워크 복구 후 마지막 작업을 남은 티켓이 없을 때까지 먼저
+                ordered = [resume] + [j for j in ordered if j.job_id != resume.job_id]
+
+            claimed = False
+            for job in ordered:
+                result = self.farm_manager.find_next_frame_range(job, settings.batch_frame_size)
+                if not result:
+                    # 남은 티켓 없음 - 다음 작업 목록 갱신까지 건너뜀
+                    self._drained_jobs.add(job.job_id)
+                    if job is resume:
+                        self._resume_job = None
+                    continue
+                start_frame, end_frame, eye = result
+                self.start_range(job, start_frame, end_frame, eye)
+                future = executor.submit(self.process_frame_range, job, start_frame, end_frame, eye)
+                futures[future] = (job, start_frame, end_frame, eye, time.time())
+                claimed = True
+                break
+            if not claimed:
+                break
+
+    def start_range(self, job: RenderJob, start_frame: int, end_frame: int, eye: str):
+        """범위 시작 기록 (처음 보는 작업이면 작업 정보 로그 + 워커 상태 갱신)"""
+        if job.job_id not in self.job_stats:
+            self.job_stats[job.job_id] = {"success": 0, "failed": 0}
+            self.log(f"\n작업 발견: {job.job_id}")
+            self.log(f"  파일: {Path(job.clip_path).name}")
+            self.log(f"  범위: {job.start_frame}-{job.end_frame}")
+            self.log(f"  배치 크기: {settings.batch_frame_size}프레임")
 
         # 워커 상태 및 현재 작업 정보 업데이트
+        self.farm_manager.last_job_id = job.job_id
         self.farm_manager.worker.status = "active"
         # 작업이 바뀌면 카운터 리셋
         if self.farm_manager.worker.current_job_id != job.job_id:
@@ -569,158 +780,135 @@ class WorkerThread(QThread):
             # 전체 프레임 수 계산 (프레임 범위 * eye 개수)
             frame_count = (job.end_frame - job.start_frame + 1) * len(job.eyes)
             self.farm_manager.worker.current_total_frames = frame_count
-        self.farm_manager.worker.current_job_id = job.job_id
-        self.farm_manager.worker.current_clip_name = Path(job.clip_path).name
-        self.farm_manager.update_worker()
-
-        # 병렬 워커 수만큼 100프레임 범위 찾아서 처리
-        # parallel_workers=10이면 10개 범위(1000프레임)를 동시 처리
-        range_tasks = []
-        for _ in range(self.parallel_workers):
-            if not self.is_running:
-                break
-            result = self.farm_manager.find_next_frame_range(job, settings.batch_frame_size)
-            if result:
-                range_tasks.append(result)
-
-        if not range_tasks:
-            # 처리할 범위가 없음 - 작업 완료 여부 확인
-            if self.farm_manager.is_job_complete(job):
-                # 완료된 작업이면 100%로 표시
-                total = job.get_total_tasks()
-                self.progress_signal.emit(total, total)
-                self.farm_manager.worker.current_processed = total
-                self.farm_manager.worker.current_total_frames = total
-                self.log_signal.emit(f"  작업 완료됨 (다른 워커가 처리)")
-            self.farm_manager.worker.status = "idle"
+            self.farm_manager.worker.current_job_id = job.job_id
+            self.farm_manager.worker.current_clip_name = Path(job.clip_path).name
             self.farm_manager.update_worker()
-            return
-
-        total_frames_in_batch = sum(end - start + 1 for start, end, _ in range_tasks)
-        self.log_signal.emit(f"  📦 {len(range_tasks)}개 범위 병렬 처리 시작 (총 {total_frames_in_batch}프레임)")
-        for start_frame, end_frame, eye in range_tasks:
-            self.log_signal.emit(f"    - {start_frame}-{end_frame} ({eye.upper()})")
 
         # 활성 범위 등록 (graceful shutdown용)
         with self.active_ranges_lock:
-            self.active_ranges = [(job.job_id, s, e, ey) for s, e, ey in range_tasks]
+            self.active_ranges.append((job.job_id, start_frame, end_frame, eye))
+        self.log(f"  🚀 시작: {start_frame}-{end_frame} ({eye.upper()})")
 
-        # 병렬로 여러 범위 동시 처리
-        with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
-            futures = {}
-            for start_frame, end_frame, eye in range_tasks:
-                future = executor.submit(self.process_frame_range, job, start_frame, end_frame, eye)
-                futures[future] = (start_frame, end_frame, eye)
+    def finish_range(self, future, job: RenderJob, start_frame: int, end_frame: int, eye: str,
+                     started_at: float, verify_executor: ThreadPoolExecutor):
+        """끝난 범위 결과 반영 (완료 표시 또는 클레임 반환) 후 작업이 끝났으면 검증 예약"""
+        frame_count = end_frame - start_frame + 1
+        stats = self.job_stats.setdefault(job.job_id, {"success": 0, "failed": 0})
 
-            for future in as_completed(futures):
-                start_frame, end_frame, eye = futures[future]
-                frame_count = end_frame - start_frame + 1
+        try:
+            success = future.result()
+        except Exception as e:
+            self.log(f"  ⚠️ [{start_frame}-{end_frame}] {eye.upper()} 예외: {str(e)}")
+            success = False
+
+        self.farm_manager.record_range_run(
+            job, start_frame, end_frame, eye, started_at, time.time(),
+            RUN_OK if success else RUN_FAILED
+        )
+
+        # 활성 범위에서 제거
+        with self.active_ranges_lock:
+            try:
+                self.active_ranges.remove((job.job_id, start_frame, end_frame, eye))
+            except ValueError:
+                pass
+
+        if success:
+            # 범위 내 모든 프레임 완료 표시
+            self.farm_manager.mark_range_completed(job.job_id, start_frame, end_frame, eye)
+            stats["success"] += frame_count
+            self.total_success += frame_count
+            self.total_processed += frame_count
+            self.farm_manager.worker.frames_completed += frame_count
+            if self.farm_manager.worker.current_job_id == job.job_id:
+                self.farm_manager.worker.current_processed += frame_count
+            self.farm_manager.update_worker()
+            self.log(f"  ✅ 범위 완료: {start_frame}-{end_frame} ({eye.upper()}) - {frame_count}프레임")
+        else:
+            # 범위 클레임 해제 (재시도 가능하도록)
+            self.farm_manager.release_range_claim(job.job_id, start_frame, end_frame, eye, failed=True)
+            self.farm_manager.increment_total_errors()
+            stats["failed"] += frame_count
+            self.total_failed += frame_count
+            self.total_processed += frame_count
+            self.farm_manager.update_worker()
+            self.log(f"  ❌ 범위 실패: {start_frame}-{end_frame} ({eye.upper()})")
+
+        # 진행률 업데이트
+        progress = self.farm_manager.get_job_progress(job.job_id)
+        total = job.get_total_tasks()
+        self.progress_signal.emit(progress["completed"], total)
+
+        # 작업이 완전히 끝났는지 확인 (완료 매니페스트 기준)
+        if progress["completed"] >= total and self.farm_manager.is_job_complete(job):
+            self._drained_jobs.add(job.job_id)
+            self.log(f"\n작업 처리 완료: {job.job_id}")
+            self.log(f"  ✓ 성공: {stats['success']}")
+            self.log(f"  ✗ 실패: {stats['failed']}")
+            self.job_stats.pop(job.job_id, None)
 
-                try:
-                    success = future.result()
-                except Exception as e:
-                    self.log_signal.emit(f"  ⚠️ [{start_frame}-{end_frame}] {eye.upper()} 예외: {str(e)}")
-                    success = False
-
-                # 활성 범위에서 제거
-                with self.active_ranges_lock:
-                    try:
-                        self.active_ranges.remove((job.job_id, start_frame, end_frame, eye))
-                    except ValueError:
-                        pass
-
-                if success:
-                    # 범위 내 모든 프레임 완료 표시
-                    self.farm_manager.mark_range_completed(job.job_id, start_frame, end_frame, eye)
-                    self.current_job_stats["success"] += frame_count
-                    self.total_success += frame_count
-                    self.total_processed += frame_count
-                    self.farm_manager.worker.frames_completed += frame_count
-                    self.farm_manager.worker.current_processed += frame_count
-                    self.farm_manager.update_worker()
-                    self.log_signal.emit(f"  ✅ 범위 완료: {start_frame}-{end_frame} ({eye.upper()}) - {frame_count}프레임")
-                else:
-                    # 범위 클레임 해제 (재시도 가능하도록)
-                    self.farm_manager.release_range_claim(job.job_id, start_frame, end_frame, eye)
-                    self.farm_manager.increment_total_errors()
-                    self.current_job_stats["failed"] += frame_count
-                    self.total_failed += frame_count
-                    self.total_processed += frame_count
-                    self.farm_manager.update_worker()
-                    self.log_signal.emit(f"  ❌ 범위 실패: {start_frame}-{end_frame} ({eye.upper()})")
-
-                # 진행률 업데이트
-                progress = self.farm_manager.get_job_progress(job.job_id)
-                total = job.get_total_tasks()
-                self.progress_signal.emit(progress["completed"], total)
-
-        # 배치 처리 완료 통계 출력
-        self.log_signal.emit(f"\n배치 처리 완료: {job.job_id}")
-        self.log_signal.emit(f"  ✓ 성공: {self.current_job_stats['success']}")
-        self.log_signal.emit(f"  ✗ 실패: {self.current_job_stats['failed']}")
-        self.log_signal.emit(f"  전체 누적 - 성공: {self.total_success}, 실패: {self.total_failed}")
-
-        # 작업이 완전히 끝났는지 확인 (모든 .done 파일 존재 여부)
-        if self.farm_manager.is_job_complete(job):
             # 진행률 100%로 표시
-            total = job.get_total_tasks()
             self.progress_signal.emit(total, total)
             # 워커 처리 수도 전체로 업데이트하고 즉시 반영
-            self.farm_manager.worker.current_processed = total
-            self.farm_manager.worker.current_total_frames = total
+            if self.farm_manager.worker.current_job_id == job.job_id:
+                self.farm_manager.worker.current_processed = total
+                self.farm_manager.worker.current_total_frames = total
+            # 진행 중인 범위가 없으면 작업 완료 후 대기 상태로 (처리 수는 유지 - 마지막 처리 결과 표시)
+            with self.active_ranges_lock:
+                busy = bool(self.active_ranges)
+            if not busy:
+                self.farm_manager.worker.status = "idle"
+                self.farm_manager.worker.current_job_id = ""
+                self.farm_manager.worker.current_clip_name = ""
             self.farm_manager.update_worker()  # 완료 상태 즉시 반영
 
-            # 검증 클레임 시도 (한 워커만 검증 수행)
-            if self.farm_manager.claim_verification(job.job_id):
-                self.log_signal.emit(f"\n📁 작업 완료 - 출력 파일 검증 시작...")
-                try:
-                    verify_result = self.farm_manager.verify_job_output_files(job)
+            verify_executor.submit(self.verify_job, job)
 
-                    # 이미 검증 완료된 작업이면 간단히 표시
-                    if verify_result.get('already_verified'):
-                        self.log_signal.emit(f"  이미 검증 완료됨 ✅")
+    def verify_job(self, job: RenderJob):
+        """완료된 작업 출력 파일 검증 (한 워커만 수행, 문제 프레임은 재처리 예약)"""
+        # 검증 클레임 시도 (한 워커만 검증 수행)
+        if self.farm_manager.claim_verification(job.job_id):
+            self.log(f"\n📁 작업 완료 - 출력 파일 검증 시작...")
+            try:
+                verify_result = self.farm_manager.verify_job_output_files(job)
+
+                # 이미 검증 완료된 작업이면 간단히 표시
+                if verify_result.get('already_verified'):
+                    self.log(f"  이미 검증 완료됨 ✅")
+                else:
+                    self.log(f"  예상: {verify_result['total_expected']}개")
+                    self.log(f"  정상: {verify_result['total_existing']}개")
+                    self.log(f"  미싱: {verify_result['total_missing']}개")
+                    self.log(f"  손상: {verify_result['total_corrupted']}개")
+                    if verify_result['avg_file_size'] > 0:
+                        avg_mb = verify_result['avg_file_size'] / (1024 * 1024)
+                        self.log(f"  평균 크기: {avg_mb:.1f}MB")
+
+                    total_problems = verify_result['total_missing'] + verify_result['total_corrupted']
+                    if total_problems > 0:
+                        self.log(f"  ⚠️ 문제 프레임 {total_problems}개 발견! 자동 복구 시도...")
+                        # 손상된 파일 번호 출력
+                        for corrupted in verify_result['corrupted_files'][:5]:  # 최대 5개만 표시
+                            size_kb = corrupted['size'] / 1024
+                            ref_kb = corrupted.get('ref_size', 0) / 1024
+                            self.log(f"    - 프레임 {corrupted['frame']} ({corrupted['eye']}): {size_kb:.1f}KB (기준 {ref_kb:.0f}KB의 {size_kb/ref_kb*100:.0f}%)")
+                        if len(verify_result['corrupted_files']) > 5:
+                            self.log(f"    ... 외 {len(verify_result['corrupted_files']) - 5}개")
+                        repaired = self.farm_manager.repair_missing_frames(job)
+                        self.log(f"  🔧 {repaired}개 프레임 재처리 예약됨")
+                        # 재발행된 티켓을 바로 가져가도록 작업 목록 다시 읽기
+                        self._jobs_scanned_at = 0.0
                     else:
-                        self.log_signal.emit(f"  예상: {verify_result['total_expected']}개")
-                        self.log_signal.emit(f"  정상: {verify_result['total_existing']}개")
-                        self.log_signal.emit(f"  미싱: {verify_result['total_missing']}개")
-                        self.log_signal.emit(f"  손상: {verify_result['total_corrupted']}개")
-                        if verify_result['avg_file_size'] > 0:
-                            avg_mb = verify_result['avg_file_size'] / (1024 * 1024)
-                            self.log_signal.emit(f"  평균 크기: {avg_mb:.1f}MB")
-
-                        total_problems = verify_result['total_missing'] + verify_result['total_corrupted']
-                        if total_problems > 0:
-                            self.log_signal.emit(f"  ⚠️ 문제 프레임 {total_problems}개 발견! 자동 복구 시도...")
-                            # 손상된 파일 번호 출력
-                            for corrupted in verify_result['corrupted_files'][:5]:  # 최대 5개만 표시
-                                size_kb = corrupted['size'] / 1024
-                                avg_kb = corrupted.get('avg_size', 0) / 1024
-                                self.log_signal.emit(f"    - 프레임 {corrupted['frame']} ({corrupted['eye']}): {size_kb:.1f}KB (평균 {avg_kb:.0f}KB의 {size_kb/avg_kb*100:.0f}%)")
-                            if len(verify_result['corrupted_files']) > 5:
-                                self.log_signal.emit(f"    ... 외 {len(verify_result['corrupted_files']) - 5}개")
-                            repaired = self.farm_manager.repair_missing_frames(job)
-                            self.log_signal.emit(f"  🔧 {repaired}개 프레임 재처리 예약됨")
-                        else:
-                            self.log_signal.emit(f"  ✅ 모든 파일 정상 확인 (검증 완료)")
-                finally:
-                    # 검증 클레임 해제
-                    self.farm_manager.release_verification_claim(job.job_id)
-            elif self.farm_manager.is_job_verified(job.job_id):
-                self.log_signal.emit(f"\n📁 작업 완료 - 이미 검증됨 ✅")
-            else:
-                self.log_signal.emit(f"\n📁 작업 완료 - 다른 워커가 검증 중...")
+                        self.log(f"  ✅ 모든 파일 정상 확인 (검증 완료)")
+            except Exception as e:
+                self.log(f"  ⚠️ 검증 오류: {str(e)}")
+            finally:
+                # 검증 클레임 해제
+                self.farm_manager.release_verification_claim(job.job_id)
+        elif self.farm_manager.is_job_verified(job.job_id):
+            self.log(f"\n📁 작업 완료 - 이미 검증됨 ✅")
         else:
-            # 아직 처리할 프레임이 남아있음
-            progress = self.farm_manager.get_job_progress(job.job_id)
-            total = job.get_total_tasks()
-            self.log_signal.emit(f"  진행 중: {progress['completed']}/{total} 완료")
-
-        # 작업 완료 후 워커 정보 업데이트 (처리 수는 유지)
-        self.farm_manager.worker.status = "idle"
-        self.farm_manager.worker.current_job_id = ""
-        self.farm_manager.worker.current_clip_name = ""
-        # current_processed와 current_total_frames는 유지 (마지막 처리 결과 표시)
-        self.farm_manager.update_worker()
+            self.log(f"\n📁 작업 완료 - 다른 워커가 검증 중...")
 
     def process_frame(self, job: RenderJob, frame_idx: int, eye: str) -> bool:
         """단일 프레임 처리"""
@@ -779,7 +967,9 @@ class WorkerThread(QThread):
                 creationflags=SUBPROCESS_FLAGS
             )
 
-            return result.returncode == 0 and output_file.exists()
+            if result.returncode != 0:
+                return False
+            return self.farm_manager.record_output_files([output_file])[output_file]
 
         except subprocess.TimeoutExpired:
             print(f"[TIMEOUT] 프레임 처리 타임아웃: {frame_idx}")
@@ -826,7 +1016,7 @@ class WorkerThread(QThread):
 
         # 디버그: 실행 명령 출력
         print(f"[DEBUG] RANGE CMD: {' '.join(cmd)}")
-        self.log_signal.emit(f"  실행: {' '.join(cmd)}")
+        self.log(f"  실행: {' '.join(cmd)}")
 
         try:
             # 배치 처리 타임아웃
@@ -834,32 +1024,23 @@ class WorkerThread(QThread):
             frame_count = end_frame - start_frame + 1
             timeout_sec = max(BATCH_CLAIM_TIMEOUT_SEC, frame_count * 15)  # 프레임당 15초 여유
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=timeout_sec,
-                creationflags=SUBPROCESS_FLAGS
-            )
+            result = self.run_cli(cmd, timeout_sec)
 
             # 결과 로그
             if result.stdout:
                 for line in result.stdout.strip().split('\n'):
                     if line.strip():
-                        self.log_signal.emit(f"    {line}")
+                        self.log(f"    {line}", LOG_DEBUG)
 
             if result.returncode != 0:
                 if result.stderr:
-                    self.log_signal.emit(f"  ⚠️ 오류: {result.stderr[:200]}")
+                    self.log(f"  ⚠️ 오류: {result.stderr[:200]}")
                 return False
 
-            # 성공 확인: 출력 파일 중 일부 존재 확인
+            # 성공 확인: 범위의 출력 파일을 시퀀스 인덱스에 기록하고 모든 프레임 존재 확인
             # CLI는 항상 L/R 폴더 구조로 저장
             clip_basename = clip.stem
             ext = ".exr" if job.format == "exr" else ".ppm"
-            check_frame = start_frame
 
             # eye type folder (L/R/SBS)
             if eye == "left":
@@ -869,17 +1050,27 @@ class WorkerThread(QThread):
             else:  # sbs
                 folder = "SBS"
 
-            check_file = output_dir / folder / f"{clip_basename}_{check_frame:06d}{ext}"
-
-            return check_file.exists()
+            output_files = [
+                output_dir / folder / f"{clip_basename}_{frame_idx:06d}{ext}"
+                for frame_idx in range(start_frame, end_frame + 1)
+            ]
+            found = self.farm_manager.record_output_files(output_files)
+
+            # 하나라도 없으면 범위 전체 실패 (클레임 반환 후 재처리 - 일부만 완료 표시하지 않음)
+            missing = [f.name for f in output_files if not found[f]]
+            if missing:
+                self.log(f"  ⚠️ 출력 파일 누락 {len(missing)}개: {', '.join(missing[:3])}"
+                         f"{' ...' if len(missing) > 3 else ''}")
+                return False
+            return True
 
         except subprocess.TimeoutExpired:
             print(f"[TIMEOUT] 범위 처리 타임아웃: {start_frame}-{end_frame}")
-            self.log_signal.emit(f"  ⏰ 타임아웃: {start_frame}-{end_frame}")
+            self.log(f"  ⏰ 타임아웃: {start_frame}-{end_frame}")
             return False
         except Exception as e:
             print(f"[ERROR] 범위 처리 오류: {e}")
-            self.log_signal.emit(f"  ❌ 오류: {str(e)}")
+            self.log(f"  ❌ 오류: {str(e)}")
             return False
 
 
@@ -893,9 +1084,17 @@ class FarmUI(QMainWindow):
         self.worker_thread = None
         self.status_thread = None
 
+        # 로그 (로컬 디스크에 회전 파일)
+        self.log_sink = LogSink(LOG_RING_RECORDS, LOG_PENDING_MAX, settings.config_file.parent / "logs",
+                                f"farm_{self.farm_manager.worker.worker_id}", LOG_FILE_MAX_BYTES, LOG_FILE_BACKUP_COUNT)
+
         # CLI 경로를 설정에서 가져오기
         self.cli_path = Path(settings.cli_path)
 
+        # 클립 메타데이터 (farm.db 공유 캐시)
+        self.clip_metadata = ClipMetadataCache(settings.db_path, self.cli_path, CLIP_INFO_TIMEOUT_SEC, SUBPROCESS_FLAGS,
+                                               CLIP_METADATA_RETRY_SEC, CLIP_METADATA_BUSY_TIMEOUT_SEC)
+
         # CLI 파일 존재 확인
         if not self.cli_path.exists():
             QMessageBox.warning(
@@ -1582,10 +1781,8 @@ class FarmUI(QMainWindow):
         widget = QGroupBox("📝 작업 로그")
         layout = QVBoxLayout(widget)
 
-        self.worker_log = QTextEdit()
-        self.worker_log.setReadOnly(True)
-        self.worker_log.setFont(QFont("Consolas", 9))
-        # 최대 높이 제한 제거하여 창에 맞춰 늘어나도록 함
+        self.worker_log = LogView(self.log_sink, LOG_MAX_LINES, LOG_FLUSH_INTERVAL_MS,
+                                  LOG_FLUSH_MAX_RECORDS, LOG_SEARCH_MAX_RESULTS)
         layout.addWidget(self.worker_log)
 
         return widget
@@ -1743,25 +1940,8 @@ class FarmUI(QMainWindow):
             self.file_count_label.setStyleSheet("color: #888888; font-weight: bold; padding: 5px;")
 
     def get_clip_frame_count(self, clip_path) -> int:
-        """클립의 총 프레임 수 반환 (실패 시 0)"""
-        try:
-            result = subprocess.run(
-                [str(self.cli_path), clip_path, "--info"],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=CLIP_INFO_TIMEOUT_SEC,
-                creationflags=SUBPROCESS_FLAGS
-            )
-
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    if "FRAME_COUNT=" in line and not line.startswith("[DEBUG]"):
-                        return int(line.split("=", 1)[1])
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError, ValueError):
-            pass
-        return 0
+        """클립의 총 프레임 수 반환 (farm.db 메타데이터 캐시 우선, 실패 시 0)"""
+        return self.clip_metadata.frame_count(clip_path)
 
     def auto_detect_frame_range(self, clip_path):
         """파일의 프레임 범위 자동 감지 (deprecated - get_clip_frame_count 사용)"""
@@ -1778,37 +1958,40 @@ class FarmUI(QMainWindow):
             return
 
         try:
-            # CLI로 정보 가져오기
-            result = subprocess.run(
-                [str(self.cli_path), clip_path, "--info"],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=CLIP_INFO_TIMEOUT_SEC,
-                creationflags=SUBPROCESS_FLAGS
-            )
-
-            if result.returncode != 0:
-                # SDK 에러인 경우 경고만 표시하고 계속 진행
-                error_msg = result.stderr if result.stderr else result.stdout
-                if "IBlackmagicRawFactory" in error_msg:
-                    QMessageBox.warning(self, "경고",
-                        "Blackmagic RAW SDK를 찾을 수 없습니다.\n"
-                        "프레임 범위를 수동으로 설정하세요.\n\n"
-                        "렌더팜 워커 PC에서는 SDK가 설치되어 있어야 합니다.")
-                    self.file_info_label.setText("⚠️ SDK 없음 - 수동 설정 필요")
-                    self.file_info_label.setStyleSheet("color: #ff9800;")
-                else:
-                    QMessageBox.warning(self, "오류", f"파일 정보를 가져올 수 없습니다.\n{error_msg}")
-                return
+            cached = self.clip_metadata.get(clip_path)  # 다른 PC가 이미 조회한 클립이면 CLI 실행 생략
+            if cached is not None:
+                info = cached.to_info()
+            else:
+                # CLI로 정보 가져오기
+                result = subprocess.run(
+                    [str(self.cli_path), clip_path, "--info"],
+                    capture_output=True,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    timeout=CLIP_INFO_TIMEOUT_SEC,
+                    creationflags=SUBPROCESS_FLAGS
+                )
+
+                if result.returncode != 0:
+                    # SDK 에러인 경우 경고만 표시하고 계속 진행
+                    error_msg = result.stderr if result.stderr else result.stdout
+                    if "IBlackmagicRawFactory" in error_msg:
+                        QMessageBox.warning(self, "경고",
+                            "Blackmagic RAW SDK를 찾을 수 없습니다.\n"
+                            "프레임 범위를 수동으로 설정하세요.\n\n"
+                            "렌더팜 워커 PC에서는 SDK가 설치되어 있어야 합니다.")
+                        self.file_info_label.setText("⚠️ SDK 없음 - 수동 설정 필요")
+                        self.file_info_label.setStyleSheet("color: #ff9800;")
+                    else:
+                        QMessageBox.warning(self, "오류", f"파일 정보를 가져올 수 없습니다.\n{error_msg}")
+                    return
 
-            # 출력 파싱
-            info = {}
-            for line in result.stdout.splitlines():
-                if "=" in line and not line.startswith("[DEBUG]"):
-                    key, value = line.strip().split("=", 1)
-                    info[key] = value
+                # 출력 파싱
+                info = parse_info(result.stdout)
+                clip_info = clip_info_from(clip_path, info)
+                if clip_info is not None:
+                    self.clip_metadata.put(clip_info)
 
             # UI 업데이트
             if "FRAME_COUNT" in info:
@@ -1985,8 +2168,7 @@ class FarmUI(QMainWindow):
 
         parallel = self.parallel_spin.value()
         watchdog = self.watchdog_checkbox.isChecked()
-        self.worker_thread = WorkerThread(self.farm_manager, self.cli_path, parallel, watchdog)
-        self.worker_thread.log_signal.connect(self.append_worker_log)
+        self.worker_thread = WorkerThread(self.farm_manager, self.cli_path, parallel, watchdog, self.log_sink)
         self.worker_thread.progress_signal.connect(self.update_progress)
         self.worker_thread.network_status_signal.connect(self.update_network_status)
         self.worker_thread.start()
@@ -2009,9 +2191,8 @@ class FarmUI(QMainWindow):
 
             # 최대 60초 대기 (진행 중인 배치 완료)
             if not self.worker_thread.wait(60000):
-                self.append_worker_log("⚠️ 타임아웃 - 남은 클레임 해제 중...")
-                self.worker_thread.cleanup_active_ranges()
-                self.worker_thread.wait(5000)
+                self.append_worker_log("⚠️ 타임아웃 - 렌더 프로세스 종료 후 남은 클레임 해제 중...")
+                self.worker_thread.abort_active_ranges()
 
             self.append_worker_log("✅ 워커가 안전하게 중지되었습니다.")
 
@@ -2029,6 +2210,7 @@ class FarmUI(QMainWindow):
             # 설정 즉시 적용
             self.parallel_spin.setValue(settings.parallel_workers)
             self.cli_path = Path(settings.cli_path)
+            self.clip_metadata.cli_path = self.cli_path
 
             # FarmManager의 경로도 업데이트
             self.farm_manager = FarmManager()
@@ -2108,15 +2290,8 @@ class FarmUI(QMainWindow):
             )
 
     def append_worker_log(self, text):
-        """워커 로그 추가 (메모리 누수 방지: 최대 LOG_MAX_LINES줄)"""
-        self.worker_log.append(text)
-        # 로그 줄 수 제한 (메모리 누수 방지)
-        doc = self.worker_log.document()
-        if doc.blockCount() > LOG_MAX_LINES:
-            cursor = self.worker_log.textCursor()
-            cursor.movePosition(cursor.MoveOperation.Start)
-            cursor.movePosition(cursor.MoveOperation.Down, cursor.MoveMode.KeepAnchor, doc.blockCount() - LOG_MAX_LINES)
-            cursor.removeSelectedText()
+        """워커 로그 추가 (어느 스레드에서나 호출 가능, 표시는 LogView가 묶어서)"""
+        self.log_sink.write(text)
 
     def update_progress(self, completed, total):
         """진행률 업데이트"""
@@ -2327,6 +2502,7 @@ class FarmUI(QMainWindow):
             try:
                 with open(job_file, 'w', encoding='utf-8') as f:
                     json.dump(job_info, f, indent=2, ensure_ascii=False)
+                self.farm_manager.job_cache.invalidate(job_file.name)
 
                 # 테이블 업데이트
                 self.jobs_table.setItem(row, 3, QTableWidgetItem(f"{new_start}-{new_end}"))
@@ -2362,6 +2538,18 @@ class FarmUI(QMainWindow):
             menu.addAction(open_folder_action)
             menu.addSeparator()
 
+        # 우선순위/가중치 (단일 선택)
+        if len(job_ids) == 1:
+            priority_action = QAction("⚖️ 우선순위/가중치 설정", self)
+            priority_action.triggered.connect(lambda: self.edit_job_priority(job_ids[0]))
+            menu.addAction(priority_action)
+
+        # 중복 렌더 감사 (다중 선택 지원)
+        audit_action = QAction("📊 중복 렌더 감사", self)
+        audit_action.triggered.connect(lambda: self.show_duplicate_report(job_ids))
+        menu.addAction(audit_action)
+        menu.addSeparator()
+
         # 다중 선택 지원 액션들
         if len(job_ids) == 1:
             # 리셋 액션
@@ -2408,12 +2596,52 @@ class FarmUI(QMainWindow):
         # 메뉴 표시
         menu.exec(self.jobs_table.viewport().mapToGlobal(position))
 
+    def edit_job_priority(self, job_id: str):
+        """작업 우선순위/가중치 변경 다이얼로그"""
+        job_info = self.farm_manager.load_job(job_id)
+        if not job_info:
+            QMessageBox.warning(self, "오류", "작업 정보를 찾을 수 없습니다.")
+            return
+
+        priority, ok = QInputDialog.getInt(
+            self, "우선순위 설정",
+            "우선순위 (높을수록 먼저 처리):",
+            int(job_info.get("priority", JOB_PRIORITY_DEFAULT)), 0, 100
+        )
+        if not ok:
+            return
+        weight, ok = QInputDialog.getDouble(
+            self, "가중치 설정",
+            "가중치 (같은 우선순위 작업 간 워커 배분 비율):",
+            float(job_info.get("weight", JOB_WEIGHT_DEFAULT)), 0.1, 100.0, 1
+        )
+        if not ok:
+            return
+
+        self.farm_manager.set_job_priority(job_id, priority, weight)
+        self.append_worker_log(f"⚖️ 작업 '{job_id}' 우선순위 {priority}, 가중치 {weight:.1f}")
+
+    def show_duplicate_report(self, job_ids: list):
+        """선택한 작업의 중복 렌더/낭비 시간 리포트를 로그에 출력 (감사 로그 읽기/집계는 별도 스레드)"""
+        self.append_worker_log("⏳ 중복 렌더 감사 리포트 작성 중...")
+        threading.Thread(target=self._build_duplicate_report, args=(job_ids,), daemon=True).start()
+
+    def _build_duplicate_report(self, job_ids: list):
+        """백그라운드: 리포트 작성 후 로그 출력"""
+        try:
+            report = self.farm_manager.get_duplicate_report(job_ids)
+        except Exception as e:
+            self.append_worker_log(f"⚠️ 감사 리포트 오류: {e}")
+            return
+        for line in format_report(report):
+            self.append_worker_log(f"📊 {line}")
+
     def reset_job(self, job_id: str):
         """작업 리셋 (비동기)"""
         reply = QMessageBox.question(
             self, "작업 리셋",
             f"작업 '{job_id}'의 진행 상태를 초기화하시겠습니까?\n"
-            "클레임 파일과 .done 파일이 삭제되고 처음부터 다시 시작됩니다.\n"
+            "클레임 파일과 완료 기록이 삭제되고 처음부터 다시 시작됩니다.\n"
             "(출력된 EXR 파일은 유지됩니다)",
             QMessageBox.Yes | QMessageBox.No
         )
@@ -2427,7 +2655,7 @@ class FarmUI(QMainWindow):
             executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             future = executor.submit(do_reset)
             future.add_done_callback(
-                lambda f: self.log_signal.emit(f"✅ 작업 '{f.result()}' 리셋됨") if f.result() else None
+                lambda f: self.log_sink.write(f"✅ 작업 '{f.result()}' 리셋됨") if f.result() else None
             )
             executor.shutdown(wait=False)
 
@@ -2450,7 +2678,7 @@ class FarmUI(QMainWindow):
             executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             future = executor.submit(do_mark)
             future.add_done_callback(
-                lambda f: self.log_signal.emit(f"✅ 작업 '{f.result()}' 완료 표시됨") if f.result() else None
+                lambda f: self.log_sink.write(f"✅ 작업 '{f.result()}' 완료 표시됨") if f.result() else None
             )
             executor.shutdown(wait=False)
 
@@ -2484,7 +2712,7 @@ class FarmUI(QMainWindow):
             executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             future = executor.submit(do_delete)
             future.add_done_callback(
-                lambda f: self.log_signal.emit(f"🗑️ 작업 '{f.result()}' 삭제됨") if f.result() else None
+                lambda f: self.log_sink.write(f"🗑️ 작업 '{f.result()}' 삭제됨") if f.result() else None
             )
             executor.shutdown(wait=False)
 
@@ -2506,7 +2734,7 @@ class FarmUI(QMainWindow):
             executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             future = executor.submit(do_reset)
             future.add_done_callback(
-                lambda f: self.log_signal.emit(f"✅ {f.result()}개 작업 리셋됨") if f.result() else None
+                lambda f: self.log_sink.write(f"✅ {f.result()}개 작업 리셋됨") if f.result() else None
             )
             executor.shutdown(wait=False)
 
@@ -2529,7 +2757,7 @@ class FarmUI(QMainWindow):
             executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             future = executor.submit(do_mark)
             future.add_done_callback(
-                lambda f: self.log_signal.emit(f"✅ {f.result()}개 작업 완료 표시됨") if f.result() else None
+                lambda f: self.log_sink.write(f"✅ {f.result()}개 작업 완료 표시됨") if f.result() else None
             )
             executor.shutdown(wait=False)
 
@@ -2551,7 +2779,7 @@ class FarmUI(QMainWindow):
             executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
             future = executor.submit(do_delete)
             future.add_done_callback(
-                lambda f: self.log_signal.emit(f"🗑️ {f.result()}개 작업 삭제됨") if f.result() else None
+                lambda f: self.log_sink.write(f"🗑️ {f.result()}개 작업 삭제됨") if f.result() else None
             )
             executor.shutdown(wait=False)
 
@@ -2586,14 +2814,14 @@ class FarmUI(QMainWindow):
 
             # 최대 30초 대기 (진행 중인 작업 완료)
             if not self.worker_thread.wait(30000):
-                self.append_worker_log("⚠️ 타임아웃 - 남은 클레임 해제 중...")
-                self.worker_thread.cleanup_active_ranges()
-                self.worker_thread.wait(5000)
+                self.append_worker_log("⚠️ 타임아웃 - 렌더 프로세스 종료 후 남은 클레임 해제 중...")
+                self.worker_thread.abort_active_ranges()
 
         if self.status_thread:
             self.status_thread.stop()
             self.status_thread.wait()
 
+        self.log_sink.close()
         event.accept()
 
 
@@ -21,7 +21,7 @@ import time
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QHBoxLayout, QLabel, QPushButton, QLineEdit,
                                QTextEdit, QGroupBox, QRadioButton, QCheckBox,
-                               QFileDialog, QSpinBox, QTableWidget, QTableWidgetItem,
+                               QFileDialog, QSpinBox, QTableView,
                                QTabWidget, QProgressBar, QMessageBox, QMenu, QDialog,
                                QListWidget, QListWidgetItem, QComboBox, QInputDialog,
                                QHeaderView, QAbstractItemView, QScrollBar, QSplitter,
@@ -31,16 +31,40 @@ from PySide6.QtGui import QFont, QColor, QAction, QDesktopServices, QIcon
 
 from .farm_core_v2 import FarmManagerV2, create_farm_manager
 from .farm_db import Pool, Job, Worker, JobStatus
+from .frame_qc import FrameQCPool, is_available as qc_available
+from .sbs_assembly import SBSAssemblyPool, is_available as sbs_assembly_available
+from .render_audit import RUN_OK, RUN_FAILED, CAUSE_RERENDER, format_report
+from .table_model import KeyedTableModel, make_proxy, selected_keys, cell
+from .status_service import StatusService, StatusSnapshot
+from .status_publisher import StatusPublisher
+from .log_sink import LogSink, LogView
+from .frame_heatmap import FrameHeatmap, FRAME_STATUS_STYLE, legend_html
+from .clip_metadata import ClipMetadataCache
+from .clip_probe import ClipProbeQueue
 from .config import (
     settings,
     SUBPROCESS_TIMEOUT_DEFAULT_SEC,
     SUBPROCESS_TIMEOUT_ACES_SEC,
     CLIP_INFO_TIMEOUT_SEC,
+    CLIP_METADATA_RETRY_SEC,
+    CLIP_METADATA_BUSY_TIMEOUT_SEC,
+    CLIP_PROBE_WORKERS,
     LOG_MAX_LINES,
+    LOG_RING_RECORDS,
+    LOG_PENDING_MAX,
+    LOG_FLUSH_INTERVAL_MS,
+    LOG_FLUSH_MAX_RECORDS,
+    LOG_FILE_MAX_BYTES,
+    LOG_FILE_BACKUP_COUNT,
+    LOG_SEARCH_MAX_RESULTS,
     BATCH_CLAIM_TIMEOUT_SEC,
     FRAME_BASE_TIMEOUT_SEC,
     FRAME_PER_FRAME_TIMEOUT_SEC,
     FRAME_SBS_MULTIPLIER,
+    QC_MAX_PENDING,
+    UI_STATUS_POLL_SEC,
+    UI_JOB_PAGE_SIZE,
+    UI_STATUS_FULL_REFRESH_SEC,
 )
 
 
@@ -120,6 +144,16 @@ class SettingsDialog(QDialog):
         self.retry_spin.setToolTip("프레임 처리 실패 시 재시도 횟수")
         process_layout.addRow("최대 재시도:", self.retry_spin)
 
+        self.qc_check = QCheckBox("렌더 후 이미지 QC (numpy/OpenEXR 필요)")
+        self.qc_check.setChecked(settings.qc_enabled)
+        self.qc_check.setToolTip("검은 프레임, NaN 픽셀, 클리핑, 단색 프레임을 검사하고 이상 시 재렌더")
+        process_layout.addRow("QC:", self.qc_check)
+
+        self.sbs_assembly_check = QCheckBox("L/R 출력으로 SBS 조립 (numpy/OpenEXR 필요)")
+        self.sbs_assembly_check.setChecked(settings.sbs_assembly_enabled)
+        self.sbs_assembly_check.setToolTip("L/R을 함께 렌더하는 작업은 SBS를 다시 디코딩하지 않고 완료된 L/R을 이어 붙여 생성")
+        process_layout.addRow("SBS:", self.sbs_assembly_check)
+
         layout.addWidget(process_group)
 
         # 버튼
@@ -157,6 +191,8 @@ class SettingsDialog(QDialog):
         settings.parallel_workers = self.parallel_spin.value()
         settings.batch_frame_size = self.batch_spin.value()
         settings.max_retries = self.retry_spin.value()
+        settings.qc_enabled = self.qc_check.isChecked()
+        settings.sbs_assembly_enabled = self.sbs_assembly_check.isChecked()
         settings.save()
         self.accept()
 
@@ -312,14 +348,14 @@ class PoolEditDialog(QDialog):
 class WorkerThreadV2(QThread):
     """워커 스레드 V2 - DB 기반"""
 
-    log_signal = Signal(str)
     progress_signal = Signal(int, int)  # completed, total
     job_completed_signal = Signal(str)  # job_id - 작업 완료 시 시그널
 
     def __init__(self, farm_manager: FarmManagerV2, cli_path: Path,
-                 parallel_workers: int = 10, watchdog_mode: bool = True):
+                 parallel_workers: int = 10, watchdog_mode: bool = True, log_sink: LogSink = None):
         super().__init__()
         self.farm_manager = farm_manager
+        self.log_sink = log_sink or LogSink()
         self.cli_path = cli_path
         self.parallel_workers = parallel_workers
         self.watchdog_mode = watchdog_mode
@@ -330,6 +366,17 @@ class WorkerThreadV2(QThread):
         self.total_success = 0
         self.total_failed = 0
 
+        # 이미지 QC (선택)
+        self.qc_pool = None
+        self.qc_futures = {}  # future -> (job, frame_idx, eye)
+        self.qc_skipped = 0
+
+        # SBS 조립 (L/R 출력이 있으면 디코딩 대신 조립)
+        self.sbs_pool = None
+
+    def log(self, text: str, level: int = None):
+        """로그 기록 (UI는 LogView가 묶어서 표시)"""
+        self.log_sink.write(text, level)
 
     def get_pending_frame_count(self) -> int:
         """대기 중인 프레임 수 조회"""
@@ -343,14 +390,23 @@ class WorkerThreadV2(QThread):
         self.is_running = True
         self.farm_manager.start()
 
-        self.log_signal.emit("=== 워커 V2 시작 ===")
-        self.log_signal.emit(f"워커 ID: {self.farm_manager.worker_id}")
-        self.log_signal.emit(f"풀: {self.farm_manager.current_pool_id}")
-        self.log_signal.emit(f"병렬 처리: {self.parallel_workers}")
-        self.log_signal.emit("")
+        self.log("=== 워커 V2 시작 ===")
+        self.log(f"워커 ID: {self.farm_manager.worker_id}")
+        self.log(f"풀: {self.farm_manager.current_pool_id}")
+        self.log(f"병렬 처리: {self.parallel_workers}")
+        self.log("")
 
         idle_logged = False
 
+        if settings.qc_enabled:
+            self.qc_pool = FrameQCPool()
+            self.log("이미지 QC: 사용")
+
+        # EXR까지 조립 가능한 워커만 SBS를 조립으로 미룸 (불가능한 워커는 기존처럼 디코딩)
+        if settings.sbs_assembly_enabled and sbs_assembly_available("exr"):
+            self.sbs_pool = SBSAssemblyPool()
+            self.log("SBS 조립: 사용")
+
         with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
             futures = {}
 
@@ -373,9 +429,17 @@ class WorkerThreadV2(QThread):
                     else:
                         effective_workers = self.parallel_workers
 
-                    # 빈 슬롯만큼 작업 클레임
+                    # 빈 슬롯만큼 작업 클레임 (L/R이 끝난 SBS 조립 우선)
                     while len(futures) < effective_workers and self.is_running:
-                        claimed = self.farm_manager.claim_frames(batch_size)
+                        assemble = False
+                        claimed = None
+                        if self.sbs_pool:
+                            sbs_claimed = self.farm_manager.claim_sbs_assembly(batch_size)
+                            if sbs_claimed:
+                                claimed = (*sbs_claimed, "sbs")
+                                assemble = True
+                        if not claimed:
+                            claimed = self.farm_manager.claim_frames(batch_size, defer_sbs=self.sbs_pool is not None)
 
                         if claimed:
                             idle_logged = False
@@ -385,16 +449,18 @@ class WorkerThreadV2(QThread):
                             if not job:
                                 continue
 
-                            self.log_signal.emit(f"🚀 시작: {job_id} [{start_frame}-{end_frame}] ({eye.upper()})")
+                            if assemble:
+                                self.log(f"🧩 조립: {job_id} [{start_frame}-{end_frame}] (SBS)")
+                            else:
+                                self.log(f"🚀 시작: {job_id} [{start_frame}-{end_frame}] ({eye.upper()})")
 
                             # 하트비트 업데이트
                             self.farm_manager.update_heartbeat("active", job_id, self.total_success)
 
-                            # 병렬 실행 제출
-                            future = executor.submit(
-                                self.process_frame_range, job, start_frame, end_frame, eye
-                            )
-                            futures[future] = (job_id, start_frame, end_frame, eye, job)
+                            # 병렬 실행 제출 (빈 슬롯만큼만 제출하므로 제출 시각 = 시작 시각)
+                            task = self.assemble_sbs_range if assemble else self.process_frame_range
+                            future = executor.submit(task, job, start_frame, end_frame, eye)
+                            futures[future] = (job_id, start_frame, end_frame, eye, job, time.time())
                         else:
                             break
 
@@ -407,23 +473,31 @@ class WorkerThreadV2(QThread):
                         done_futures = [f for f in futures if f.done()]
 
                         for future in done_futures:
-                            job_id, start_frame, end_frame, eye, job = futures.pop(future)
+                            job_id, start_frame, end_frame, eye, job, started_at = futures.pop(future)
                             frame_count = end_frame - start_frame + 1
 
                             try:
                                 success = future.result()
+                                self.farm_manager.record_range_run(
+                                    job, start_frame, end_frame, eye, started_at, time.time(),
+                                    RUN_OK if success else RUN_FAILED
+                                )
                                 if success:
                                     self.farm_manager.complete_frames(job_id, start_frame, end_frame, eye)
                                     self.total_success += frame_count
-                                    self.log_signal.emit(f"  ✅ 완료: {start_frame}-{end_frame} ({eye.upper()})")
+                                    self.log(f"  ✅ 완료: {start_frame}-{end_frame} ({eye.upper()})")
+                                    self.submit_qc(job, start_frame, end_frame, eye)
                                 else:
                                     self.farm_manager.release_frames(job_id, start_frame, end_frame, eye)
                                     self.total_failed += frame_count
-                                    self.log_signal.emit(f"  ❌ 실패: {start_frame}-{end_frame} ({eye.upper()})")
+                                    self.log(f"  ❌ 실패: {start_frame}-{end_frame} ({eye.upper()})")
                             except Exception as e:
+                                self.farm_manager.record_range_run(
+                                    job, start_frame, end_frame, eye, started_at, time.time(), RUN_FAILED
+                                )
                                 self.farm_manager.release_frames(job_id, start_frame, end_frame, eye)
                                 self.total_failed += frame_count
-                                self.log_signal.emit(f"  ❌ 오류: {start_frame}-{end_frame} - {str(e)}")
+                                self.log(f"  ❌ 오류: {start_frame}-{end_frame} - {str(e)}")
 
                             self.total_processed += frame_count
 
@@ -435,31 +509,111 @@ class WorkerThreadV2(QThread):
                             if progress['completed'] >= progress['total'] and progress['total'] > 0:
                                 self.job_completed_signal.emit(job_id)
 
+                    # 끝난 QC 결과 반영
+                    if self.qc_futures:
+                        self.collect_qc_results()
+
                     # 작업이 없고 대기 중인 것도 없으면
                     if not futures:
                         if self.watchdog_mode:
                             if not idle_logged:
-                                self.log_signal.emit("🔍 대기 중 - 새 작업 감시 중...")
+                                self.log("🔍 대기 중 - 새 작업 감시 중...")
                                 idle_logged = True
                             self.farm_manager.update_heartbeat("idle")
                             time.sleep(3)
                         else:
-                            self.log_signal.emit("✅ 모든 작업 완료")
+                            self.log("✅ 모든 작업 완료")
                             break
                     else:
                         time.sleep(0.1)  # CPU 부하 감소
 
                 except Exception as e:
-                    self.log_signal.emit(f"❌ 오류: {str(e)}")
+                    self.log(f"❌ 오류: {str(e)}")
                     time.sleep(3)
 
+        if self.qc_pool:
+            self.qc_pool.shutdown()
+            self.qc_pool = None
+            self.qc_futures.clear()
+
+        if self.sbs_pool:
+            self.sbs_pool.shutdown()
+            self.sbs_pool = None
+
         self.farm_manager.stop()
-        self.log_signal.emit("\n=== 워커 중지됨 ===")
+        self.log("\n=== 워커 중지됨 ===")
 
     def stop(self):
         """워커 중지"""
         self.is_running = False
 
+    def assemble_sbs_range(self, job: Job, start_frame: int, end_frame: int, eye: str = "sbs") -> bool:
+        """L/R 출력을 이어 붙여 SBS 범위 생성 (프레임별로 조립 프로세스 풀에 분산)"""
+        tasks = []
+        for frame_idx in range(start_frame, end_frame + 1):
+            left = self.farm_manager.get_output_file_path(job, frame_idx, "left")
+            right = self.farm_manager.get_output_file_path(job, frame_idx, "right")
+            output = self.farm_manager.get_output_file_path(job, frame_idx, "sbs")
+            tasks.append((frame_idx, output, self.sbs_pool.submit(left, right, output)))
+
+        success = True
+        for frame_idx, output, future in tasks:
+            result = future.result()
+            if not result["ok"]:
+                success = False
+                self.log(f"  ⚠️ SBS 조립 실패: 프레임 {frame_idx} - {result['error']}")
+
+        # 조립 결과를 시퀀스 인덱스에 기록하고 전부 있는지 확인
+        found = self.farm_manager.record_output_files([output for _, output, _ in tasks])
+        return success and all(found.values())
+
+    def submit_qc(self, job: Job, start_frame: int, end_frame: int, eye: str):
+        """완료된 범위의 프레임 QC 제출 (백로그가 넘치면 건너뛰어 렌더 속도 유지)"""
+        if not self.qc_pool or not qc_available(job.format):
+            return
+        for frame_idx in range(start_frame, end_frame + 1):
+            if len(self.qc_futures) >= QC_MAX_PENDING:
+                self.qc_skipped += end_frame - frame_idx + 1
+                return
+            output_file = self.farm_manager.get_output_file_path(job, frame_idx, eye)
+            future = self.qc_pool.submit(output_file)
+            self.qc_futures[future] = (job, frame_idx, eye)
+
+    def collect_qc_results(self):
+        """끝난 QC 결과를 DB에 기록하고 이상 프레임 재렌더 예약"""
+        done = [f for f in self.qc_futures if f.done()]
+        if not done:
+            return
+
+        results = []
+        anomalies = {}  # (job_id, eye) -> (job, [frame_idx, ...])
+        for future in done:
+            job, frame_idx, eye = self.qc_futures.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"status": "error", "issues": ["qc_failed"], "stats": {"error": str(e)[:200]}}
+            results.append((job.job_id, frame_idx, eye, result))
+            if result["status"] == "error":
+                # 검사 자체의 실패는 기록만 (프레임은 정상일 수 있으므로 재렌더하지 않음)
+                self.log(f"  ⚠️ QC 검사 실패: {job.job_id} 프레임 {frame_idx} ({eye.upper()}) - {', '.join(result['issues'])}")
+                continue
+            if result["status"] != "ok":
+                entry = anomalies.setdefault((job.job_id, eye), (job, []))
+                entry[1].append(frame_idx)
+                self.log(
+                    f"  🔍 QC 이상: {job.job_id} 프레임 {frame_idx} ({eye.upper()}) - {', '.join(result['issues'])}"
+                )
+
+        try:
+            self.farm_manager.record_qc_results(results)
+            for (job_id, eye), (job, frame_indices) in anomalies.items():
+                flagged = self.farm_manager.flag_frames_for_rerender(job, eye, sorted(frame_indices))
+                if flagged:
+                    self.log(f"  🔁 재렌더 예약: {job_id} ({eye.upper()}) {flagged}프레임")
+        except Exception as e:
+            self.log(f"  ⚠️ QC 결과 기록 실패: {str(e)}")
+
     def process_frame_range(self, job: Job, start_frame: int, end_frame: int, eye: str) -> bool:
         """프레임 범위 처리 (실시간 진행률 포함)"""
         import threading
@@ -501,16 +655,26 @@ class WorkerThreadV2(QThread):
         frame_count = end_frame - start_frame + 1
         stop_monitor = threading.Event()
         last_progress = [0]  # mutable for closure
+        output_files = [
+            self.farm_manager.get_output_file_path(job, frame_idx, eye)
+            for frame_idx in range(start_frame, end_frame + 1)
+        ]
+        found = {}  # 확인된 출력 파일 (모니터와 최종 확인이 공유)
+
+        def probe_next():
+            """CLI는 프레임 순서대로 쓰므로 다음 미확인 프레임만 확인해 인덱스에 기록"""
+            while len(found) < frame_count:
+                check_path = output_files[len(found)]
+                if not self.farm_manager.record_output_files([check_path])[check_path]:
+                    break
+                found[check_path] = True
+            return len(found)
 
         def monitor_progress():
             """출력 파일 감시하여 진행률 표시"""
             import time
             while not stop_monitor.is_set():
-                completed = 0
-                for frame_idx in range(start_frame, end_frame + 1):
-                    check_path = self.farm_manager.get_output_file_path(job, frame_idx, eye)
-                    if check_path.exists():
-                        completed += 1
+                completed = probe_next()
 
                 if completed > last_progress[0]:
                     last_progress[0] = completed
@@ -522,9 +686,9 @@ class WorkerThreadV2(QThread):
                         total_done = total_progress['completed'] + completed
                         total_all = total_progress['total']
                         total_pct = (total_done / total_all * 100) if total_all > 0 else 0
-                        self.log_signal.emit(f"  📊 [{start_frame}-{end_frame}] {eye.upper()}: {completed}/{frame_count} ({pct:.2f}%) | 전체: {total_done}/{total_all} ({total_pct:.2f}%)")
+                        self.log(f"  📊 [{start_frame}-{end_frame}] {eye.upper()}: {completed}/{frame_count} ({pct:.2f}%) | 전체: {total_done}/{total_all} ({total_pct:.2f}%)")
                     except Exception:
-                        self.log_signal.emit(f"  📊 [{start_frame}-{end_frame}] {eye.upper()}: {completed}/{frame_count} ({pct:.2f}%)")
+                        self.log(f"  📊 [{start_frame}-{end_frame}] {eye.upper()}: {completed}/{frame_count} ({pct:.2f}%)")
 
                 if completed >= frame_count:
                     break
@@ -554,21 +718,25 @@ class WorkerThreadV2(QThread):
             # CLI 실행 결과 확인
             if result.returncode != 0:
                 err_msg = result.stderr[:200] if result.stderr else "no stderr"
-                self.log_signal.emit(f"  ⚠️ CLI 오류 (code={result.returncode}): {err_msg}")
+                self.log(f"  ⚠️ CLI 오류 (code={result.returncode}): {err_msg}")
 
-            # 첫 프레임 파일 존재 확인
-            check_file = self.farm_manager.get_output_file_path(job, start_frame, eye)
-            if check_file.exists():
+            # 남은 프레임을 한 번에 인덱스에 기록한 뒤 첫 프레임 파일 존재 확인
+            stop_monitor.set()
+            monitor_thread.join(timeout=1)
+            remaining = [f for f in output_files if f not in found]
+            found.update(self.farm_manager.record_output_files(remaining))
+            check_file = output_files[0]
+            if found.get(check_file):
                 return True
             else:
-                self.log_signal.emit(f"  ⚠️ 출력 파일 없음: {check_file}")
+                self.log(f"  ⚠️ 출력 파일 없음: {check_file}")
                 return False
 
         except subprocess.TimeoutExpired:
-            self.log_signal.emit(f"  ⏰ 타임아웃")
+            self.log(f"  ⏰ 타임아웃")
             return False
         except Exception as e:
-            self.log_signal.emit(f"  ❌ 오류: {str(e)}")
+            self.log(f"  ❌ 오류: {str(e)}")
             return False
         finally:
             stop_monitor.set()
@@ -595,7 +763,20 @@ class FarmUIV2(QMainWindow):
         self.cli_path = Path(settings.cli_path)
 
         self.worker_thread = None
-        self.status_timer = None
+        self.status_service = None
+
+        # 로그 (로컬 디스크에 회전 파일)
+        self.log_sink = LogSink(LOG_RING_RECORDS, LOG_PENDING_MAX, settings.config_file.parent / "logs",
+                                f"farm_v2_{self.farm_manager.worker_id}", LOG_FILE_MAX_BYTES, LOG_FILE_BACKUP_COUNT)
+
+        # 클립 메타데이터 (farm.db 공유 캐시)
+        self.clip_metadata = ClipMetadataCache(db_path, self.cli_path, CLIP_INFO_TIMEOUT_SEC, SUBPROCESS_FLAGS,
+                                               CLIP_METADATA_RETRY_SEC, CLIP_METADATA_BUSY_TIMEOUT_SEC)
+        self.clip_probes = ClipProbeQueue(self.clip_metadata, CLIP_PROBE_WORKERS, self)
+        self.clip_probes.probed.connect(self.on_clip_probed)
+        self.clip_probes.progress.connect(self.on_clip_probe_progress)
+        self.submit_waiting = False  # 프레임 정보 조회가 끝나면 제출 계속
+        self.submit_reprobed = set()  # 이번 제출에서 다시 조회한 클립 (또 실패하면 건너뜀)
 
         self.init_ui()
         self.setup_timers()
@@ -637,13 +818,13 @@ class FarmUIV2(QMainWindow):
                 padding: 5px;
                 border-radius: 3px;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #353535;
                 gridline-color: #454545;
                 border: none;
             }
-            QTableWidget::item { padding: 5px; }
-            QTableWidget::item:selected { background-color: #0d7377; }
+            QTableView::item { padding: 5px; }
+            QTableView::item:selected { background-color: #0d7377; }
             QHeaderView::section {
                 background-color: #404040;
                 padding: 5px;
@@ -774,6 +955,17 @@ class FarmUIV2(QMainWindow):
         file_layout.addLayout(file_btn_layout)
         layout.addLayout(file_layout)
 
+        # 프레임 정보 조회 진행 (백그라운드)
+        probe_layout = QHBoxLayout()
+        self.probe_status_label = QLabel("")
+        self.probe_status_label.setStyleSheet("color: #888;")
+        probe_layout.addWidget(self.probe_status_label, 1)
+        self.probe_cancel_btn = QPushButton("⏹ 조회 취소")
+        self.probe_cancel_btn.clicked.connect(self.cancel_clip_probes)
+        self.probe_cancel_btn.setVisible(False)
+        probe_layout.addWidget(self.probe_cancel_btn)
+        layout.addLayout(probe_layout)
+
         # 출력 경로
         output_layout = QHBoxLayout()
         output_layout.addWidget(QLabel("출력:"))
@@ -852,10 +1044,10 @@ class FarmUIV2(QMainWindow):
         layout.addLayout(priority_layout)
 
         # 제출 버튼
-        submit_btn = QPushButton("🚀 작업 제출")
-        submit_btn.setStyleSheet("background-color: #0d7377; font-weight: bold; padding: 12px;")
-        submit_btn.clicked.connect(self.submit_job)
-        layout.addWidget(submit_btn)
+        self.submit_btn = QPushButton("🚀 작업 제출")
+        self.submit_btn.setStyleSheet("background-color: #0d7377; font-weight: bold; padding: 12px;")
+        self.submit_btn.clicked.connect(self.submit_job)
+        layout.addWidget(self.submit_btn)
 
         return group
 
@@ -918,11 +1110,49 @@ class FarmUIV2(QMainWindow):
         group = QGroupBox("📋 작업 목록")
         layout = QVBoxLayout(group)
 
-        self.jobs_table = QTableWidget()
-        self.jobs_table.setColumnCount(12)
-        self.jobs_table.setHorizontalHeaderLabels([
+        # 필터 (상태, 클립 이름 검색) - DB에서 걸러 현재 페이지만 조회
+        filter_layout = QHBoxLayout()
+        self.jobs_status_combo = QComboBox()
+        for label, statuses in self.JOB_STATUS_FILTERS:
+            self.jobs_status_combo.addItem(label, statuses)
+        self.jobs_status_combo.currentIndexChanged.connect(self.on_jobs_filter_changed)
+        filter_layout.addWidget(self.jobs_status_combo)
+
+        self.jobs_filter_input = QLineEdit()
+        self.jobs_filter_input.setPlaceholderText("🔍 클립 이름 검색 (앞부분, * 사용 가능)")
+        self.jobs_filter_input.setClearButtonEnabled(True)
+        self.jobs_search_timer = QTimer(self)  # 입력이 멈춘 뒤 한 번만 조회
+        self.jobs_search_timer.setSingleShot(True)
+        self.jobs_search_timer.setInterval(300)
+        self.jobs_search_timer.timeout.connect(self.on_jobs_filter_changed)
+        self.jobs_filter_input.textChanged.connect(self.jobs_search_timer.start)
+        filter_layout.addWidget(self.jobs_filter_input, 1)
+
+        self.jobs_prev_btn = QPushButton("◀")
+        self.jobs_prev_btn.setMaximumWidth(40)
+        self.jobs_prev_btn.clicked.connect(lambda: self.change_jobs_page(-1))
+        self.jobs_next_btn = QPushButton("▶")
+        self.jobs_next_btn.setMaximumWidth(40)
+        self.jobs_next_btn.clicked.connect(lambda: self.change_jobs_page(1))
+        self.jobs_page_label = QLabel("-")
+        self.jobs_page_label.setStyleSheet("color: #888;")
+        filter_layout.addWidget(self.jobs_prev_btn)
+        filter_layout.addWidget(self.jobs_page_label)
+        filter_layout.addWidget(self.jobs_next_btn)
+        layout.addLayout(filter_layout)
+
+        self.jobs_model = KeyedTableModel([
             "작업 ID", "클립", "프레임", "풀", "상태", "L", "R", "SBS", "진행률", "우선순위", "생성", "경과"
-        ])
+        ], self)
+        self.jobs_proxy = make_proxy(self.jobs_model, self)
+        self.jobs_page = None  # 마지막 스냅샷의 (offset, limit, 전체 수)
+
+        self.jobs_table = QTableView()
+        self.jobs_table.setModel(self.jobs_proxy)
+        self.jobs_table.setSortingEnabled(True)
+        self.jobs_table.sortByColumn(10, Qt.DescendingOrder)  # 최신 작업 먼저
+        self.jobs_table.horizontalHeader().sortIndicatorChanged.connect(self.on_jobs_sort_changed)
+        self.jobs_table.verticalHeader().setVisible(False)
         self.jobs_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.jobs_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.jobs_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
@@ -931,16 +1161,33 @@ class FarmUIV2(QMainWindow):
         self.jobs_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.jobs_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.jobs_table.customContextMenuRequested.connect(self.show_job_context_menu)
+        self.jobs_table.selectionModel().selectionChanged.connect(self.on_jobs_selection_changed)
         layout.addWidget(self.jobs_table)
 
+        # 선택한 작업의 프레임 현황 (프레임 × eye 히트맵)
+        heatmap_header = QHBoxLayout()
+        self.job_heatmap_label = QLabel("🧩 프레임 현황")
+        heatmap_header.addWidget(self.job_heatmap_label, 1)
+        legend = QLabel(legend_html())
+        legend.setStyleSheet("color: #888;")
+        heatmap_header.addWidget(legend)
+        layout.addLayout(heatmap_header)
+        self.job_heatmap = FrameHeatmap()
+        layout.addWidget(self.job_heatmap)
+
         # 워커 현황
         worker_group = QGroupBox("🖥️ 활성 워커")
         worker_layout = QVBoxLayout(worker_group)
-        self.worker_table = QTableWidget()
-        self.worker_table.setColumnCount(5)
-        self.worker_table.setHorizontalHeaderLabels([
+        self.worker_model = KeyedTableModel([
             "워커 ID", "상태", "현재 작업", "완료 수", "마지막 활동"
-        ])
+        ], self)
+        self.worker_proxy = make_proxy(self.worker_model, self)
+        self.worker_table = QTableView()
+        self.worker_table.setModel(self.worker_proxy)
+        self.worker_table.setSortingEnabled(True)
+        self.worker_table.sortByColumn(0, Qt.AscendingOrder)
+        self.worker_table.verticalHeader().setVisible(False)
+        self.worker_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.worker_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.worker_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.worker_table.setMaximumHeight(150)
@@ -959,18 +1206,20 @@ class FarmUIV2(QMainWindow):
         group = QGroupBox("📜 로그")
         layout = QVBoxLayout(group)
 
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        # self.log_text.setMaximumHeight(200)  # 제거: 창 크기에 맞춤
-        layout.addWidget(self.log_text)
+        self.log_view = LogView(self.log_sink, LOG_MAX_LINES, LOG_FLUSH_INTERVAL_MS,
+                                LOG_FLUSH_MAX_RECORDS, LOG_SEARCH_MAX_RESULTS)
+        layout.addWidget(self.log_view)
 
         return group
 
     def setup_timers(self):
-        """타이머 설정"""
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.refresh_jobs)
-        self.status_timer.start(5000)  # 5초마다
+        """상태 조회 서비스 시작 (DB 조회는 UI 스레드에서 하지 않음, 현황은 발행 스냅샷 우선)"""
+        self.status_service = StatusService(self.farm_manager.db, UI_STATUS_POLL_SEC, UI_JOB_PAGE_SIZE,
+                                            UI_STATUS_FULL_REFRESH_SEC, StatusPublisher(self.farm_manager.db), self)
+        self.status_service.snapshot_ready.connect(self.apply_status_snapshot)
+        self.status_service.error_signal.connect(self.append_worker_log)
+        self.status_service.start()
+        self.status_service.request_refresh()
 
     # ===== 이벤트 핸들러 =====
 
@@ -1023,6 +1272,7 @@ class FarmUIV2(QMainWindow):
         if dialog.exec() == QDialog.Accepted:
             # 설정 변경 후 UI 업데이트
             self.cli_path = Path(settings.cli_path)
+            self.clip_metadata.cli_path = self.cli_path
             self.parallel_spin.setValue(settings.parallel_workers)
 
     def on_sbs_toggled(self, checked: bool):
@@ -1070,27 +1320,76 @@ class FarmUIV2(QMainWindow):
             event.ignore()
 
     def add_file_to_list(self, file_path: str):
-        """파일 목록에 추가 (중복 체크, 프레임 정보 포함)"""
+        """파일 목록에 추가 (중복 체크, 프레임 정보는 백그라운드 조회)"""
         # 중복 체크
+        if self.find_file_item(file_path) is not None:
+            return  # 이미 있음
+
+        item = QListWidgetItem(f"{Path(file_path).name} (⏳ 프레임 정보 조회 중)")
+        item.setData(Qt.UserRole, file_path)
+        item.setToolTip(file_path)
+        self.file_list.addItem(item)
+
+        if file_path in self.clip_frame_cache:
+            self.on_clip_probed(file_path, self.clip_frame_cache[file_path])
+        else:
+            self.clip_probes.submit(file_path)
+
+    def find_file_item(self, file_path: str) -> Optional[QListWidgetItem]:
+        """파일 목록에서 경로의 항목"""
         for i in range(self.file_list.count()):
             item = self.file_list.item(i)
             if item.data(Qt.UserRole) == file_path:
-                return  # 이미 있음
-
-        # 프레임 수 조회
-        frame_count = self.get_clip_frame_count(file_path)
+                return item
+        return None
+
+    def on_clip_probed(self, file_path: str, frame_count: int):
+        """클립 하나의 프레임 정보 조회 완료 (UI 스레드)"""
+        self.clip_frame_cache[file_path] = frame_count
+        item = self.find_file_item(file_path)
+        if item is None:
+            return  # 조회 중에 목록에서 빠짐
         clip_name = Path(file_path).name
         if frame_count > 0:
-            display_text = f"{clip_name} (0-{frame_count - 1})"
-            self.clip_frame_cache[file_path] = frame_count
+            item.setText(f"{clip_name} (0-{frame_count - 1})")
         else:
-            display_text = f"{clip_name} (프레임 정보 없음)"
-            self.clip_frame_cache[file_path] = 0
+            item.setText(f"{clip_name} (프레임 정보 없음)")
+        if item is self.file_list.currentItem():
+            self.on_file_selected(item, None)
+
+    def on_clip_probe_progress(self, done: int, total: int):
+        """조회 진행 표시, 제출 대기 중이었으면 목록의 클립 조회가 끝난 뒤 제출 계속"""
+        pending = total - done
+        self.probe_status_label.setText(f"🔍 프레임 정보 조회 {done:,}/{total:,}" if pending > 0 else "")
+        self.probe_cancel_btn.setVisible(pending > 0)
+        # 목록에서 지운 파일의 조회는 기다리지 않음, 다른 풀 스레드가 먼저 끝낸 조회의 probed 시그널이 아직 큐에 있으면 기다림
+        clip_paths = self.list_clip_paths()
+        if (self.submit_waiting and not self.clip_probes.pending(clip_paths)
+                and all(p in self.clip_frame_cache for p in clip_paths)):
+            self.set_submit_waiting(False)
+            self.submit_job()
+
+    def list_clip_paths(self) -> List[str]:
+        """파일 목록의 클립 경로"""
+        return [self.file_list.item(i).data(Qt.UserRole) or self.file_list.item(i).text()
+                for i in range(self.file_list.count())]
+
+    def cancel_clip_probes(self):
+        """진행 중인 프레임 정보 조회 취소 (제출 대기도 취소)"""
+        self.set_submit_waiting(False)
+        self.submit_reprobed.clear()
+        self.clip_probes.cancel()
+        for i in range(self.file_list.count()):
+            item = self.file_list.item(i)
+            file_path = item.data(Qt.UserRole)
+            if file_path not in self.clip_frame_cache:
+                item.setText(f"{Path(file_path).name} (조회 취소됨 - 제출 시 다시 조회)")
 
-        item = QListWidgetItem(display_text)
-        item.setData(Qt.UserRole, file_path)
-        item.setToolTip(file_path)
-        self.file_list.addItem(item)
+    def set_submit_waiting(self, waiting: bool):
+        """제출 버튼을 조회 대기 상태로"""
+        self.submit_waiting = waiting
+        self.submit_btn.setText("⏳ 프레임 정보 조회 후 제출 (취소하려면 조회 취소)" if waiting else "🚀 작업 제출")
+        self.submit_btn.setEnabled(not waiting)
 
     def add_files(self):
         """파일 추가 버튼"""
@@ -1152,6 +1451,7 @@ class FarmUIV2(QMainWindow):
 
     def on_clear_files(self):
         """파일 목록 지우기"""
+        self.cancel_clip_probes()
         self.file_list.clear()
         self.clip_frame_cache.clear()
         self.frame_info_label.setText("(0=전체)")
@@ -1211,6 +1511,7 @@ class FarmUIV2(QMainWindow):
 
     def submit_job(self):
         """작업 제출"""
+        reprobed, self.submit_reprobed = self.submit_reprobed, set()  # 조회 대기 후 이어서 제출할 때만 남아 있음
         if self.file_list.count() == 0:
             self.append_worker_log("⚠️ 파일을 선택하세요.")
             return
@@ -1233,17 +1534,27 @@ class FarmUIV2(QMainWindow):
             self.append_worker_log("⚠️ L, R, SBS 중 하나 이상 선택하세요.")
             return
 
+        # 프레임 정보 조회가 안 끝났거나 실패한 클립이 있으면 (다시) 조회가 끝난 뒤 제출 (on_clip_probe_progress)
+        # 실패는 일시적인 타임아웃일 수 있으므로 제출마다 한 번 다시 조회
+        clip_paths = self.list_clip_paths()
+        missing = [p for p in clip_paths
+                   if self.clip_frame_cache.get(p, 0) <= 0 and p not in reprobed]
+        if missing:
+            for clip_path in missing:
+                self.clip_frame_cache.pop(clip_path, None)
+                self.clip_probes.submit(clip_path)  # 취소됐거나 실패했던 클립은 다시 조회
+            self.submit_reprobed = reprobed | set(missing)
+            self.set_submit_waiting(True)
+            self.append_worker_log(f"⏳ 프레임 정보 조회 대기: {len(missing)}개 클립 (끝나면 자동 제출)")
+            return
+
         # 작업 제출
         submitted = 0
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            clip_path = item.data(Qt.UserRole) or item.text()
+        for clip_path in clip_paths:
             clip_name = Path(clip_path).stem
 
-            # 프레임 수 가져오기 (캐시 사용)
+            # 프레임 수 (백그라운드 조회 결과)
             frame_count = self.clip_frame_cache.get(clip_path, 0)
-            if frame_count <= 0:
-                frame_count = self.get_clip_frame_count(clip_path)
             if frame_count <= 0:
                 self.append_worker_log(f"⚠️ 프레임 수 확인 실패: {clip_name}")
                 continue
@@ -1320,122 +1631,178 @@ class FarmUIV2(QMainWindow):
         self.refresh_jobs()
         self.append_worker_log(f"✅ {submitted}개 작업이 제출되었습니다.")
 
-    def get_clip_frame_count(self, clip_path: str) -> int:
-        """클립 프레임 수 조회"""
+    JOB_STATUS_TEXT = {
+        'pending': '⏳ 대기',
+        'in_progress': '🔄 진행중',
+        'completed': '✅ 완료',
+        'excluded': '⏸️ 제외',
+        'paused': '⏯️ 일시정지',
+        'failed': '❌ 실패'
+    }
+
+    def refresh_jobs(self):
+        """작업/워커 현황 새로고침 요청 (결과는 apply_status_snapshot으로 도착)"""
+        if self.status_service:
+            self.status_service.request_refresh()
+
+    def apply_status_snapshot(self, snapshot: StatusSnapshot):
+        """상태 스냅샷을 테이블에 반영 (바뀐 쪽만, 바뀐 셀만)"""
         try:
-            result = subprocess.run(
-                [str(self.cli_path), clip_path, "--info"],
-                capture_output=True,
-                text=True,
-                timeout=CLIP_INFO_TIMEOUT_SEC,
-                creationflags=SUBPROCESS_FLAGS
+            if snapshot.jobs_changed:
+                rows = {}
+                for entry in snapshot.jobs:
+                    rows[entry.job.job_id] = self.build_job_row(
+                        entry.job, entry.status, entry.completed, entry.total, entry.eye_progress, snapshot.taken_at
+                    )
+                self.jobs_model.set_rows(rows)
+                self.update_jobs_page(snapshot)
+
+            # 워커 현황 업데이트
+            if snapshot.workers_changed:
+                self.refresh_workers(snapshot.workers)
+
+            if snapshot.frames_changed:
+                self.update_job_heatmap(snapshot.frames)
+        finally:
+            self.status_service.acknowledge()
+
+    # 상태 필터 (표시 이름, jobs.status 목록 - None이면 전체)
+    JOB_STATUS_FILTERS = [
+        ("전체", None),
+        ("⏳ 대기", ['pending']),
+        ("🔄 진행중", ['in_progress']),
+        ("✅ 완료", ['completed']),
+        ("⏸️ 제외", ['excluded']),
+        ("⏯️ 일시정지", ['paused']),
+        ("❌ 실패", ['failed']),
+    ]
+
+    # 서버 정렬이 가능한 열 -> query_jobs sort_by (나머지 열은 현재 페이지 안에서만 정렬)
+    JOB_SORT_KEYS = {0: "job_id", 1: "clip_name", 2: "start_frame", 3: "pool_id", 4: "status",
+                     9: "priority", 10: "created_at"}
+
+    def update_jobs_page(self, snapshot: StatusSnapshot):
+        """페이지 표시와 상태별 작업 수 갱신"""
+        self.jobs_page = (snapshot.offset, snapshot.limit, snapshot.job_total)
+        first = snapshot.offset + 1 if snapshot.jobs else 0
+        last = snapshot.offset + len(snapshot.jobs)
+        self.jobs_page_label.setText(f"{first:,}-{last:,} / {snapshot.job_total:,}")
+        self.jobs_prev_btn.setEnabled(snapshot.offset > 0)
+        self.jobs_next_btn.setEnabled(last < snapshot.job_total)
+        counts = " · ".join(
+            f"{label} {sum(snapshot.status_counts.get(st, 0) for st in statuses):,}"
+            for label, statuses in self.JOB_STATUS_FILTERS[1:]
+            if any(snapshot.status_counts.get(st) for st in statuses)
+        )
+        self.jobs_status_combo.setToolTip(counts or "작업 없음")
+
+    def on_jobs_filter_changed(self, *args):
+        """상태/검색 필터 변경 - 첫 페이지부터 다시 조회"""
+        if self.status_service:
+            self.status_service.set_query(
+                statuses=self.jobs_status_combo.currentData(),
+                search=self.jobs_filter_input.text().strip(),
+                offset=0,
             )
-            for line in result.stdout.split('\n'):
-                if 'frame' in line.lower() and 'count' in line.lower():
-                    match = re.search(r'(\d+)', line)
-                    if match:
-                        return int(match.group(1))
-        except Exception:
-            pass
-        return 0
 
-    def refresh_jobs(self):
-        """작업 목록 새로고침"""
-        jobs_with_status = self.farm_manager.get_all_jobs_with_status()
-
-        self.jobs_table.setRowCount(len(jobs_with_status))
-        for row, (job, status, completed, total) in enumerate(jobs_with_status):
-            # 작업 ID
-            self.jobs_table.setItem(row, 0, QTableWidgetItem(job.job_id))
-
-            # 클립
-            clip_name = Path(job.clip_path).stem
-            self.jobs_table.setItem(row, 1, QTableWidgetItem(clip_name))
-
-            # 프레임 범위
-            frame_range = f"{job.start_frame}-{job.end_frame}"
-            self.jobs_table.setItem(row, 2, QTableWidgetItem(frame_range))
-
-            # 풀
-            self.jobs_table.setItem(row, 3, QTableWidgetItem(job.pool_id))
-
-            # 상태
-            status_text = {
-                'pending': '⏳ 대기',
-                'in_progress': '🔄 진행중',
-                'completed': '✅ 완료',
-                'excluded': '⏸️ 제외',
-                'paused': '⏯️ 일시정지',
-                'failed': '❌ 실패'
-            }.get(status, status)
-            self.jobs_table.setItem(row, 4, QTableWidgetItem(status_text))
-
-            # 눈별 진행률 (L, R, SBS)
-            eye_progress = self.farm_manager.get_job_eye_progress(job.job_id)
-            for col, eye in [(5, 'left'), (6, 'right'), (7, 'sbs')]:
-                if eye in eye_progress:
-                    ep = eye_progress[eye]
-                    pct = (ep['completed'] / ep['total'] * 100) if ep['total'] > 0 else 0
-                    self.jobs_table.setItem(row, col, QTableWidgetItem(f"{ep['completed']}/{ep['total']}"))
-                else:
-                    self.jobs_table.setItem(row, col, QTableWidgetItem("-"))
-
-            # 전체 진행률
-            pct = (completed / total * 100) if total > 0 else 0
-            self.jobs_table.setItem(row, 8, QTableWidgetItem(f"{completed}/{total} ({pct:.2f}%)"))
-
-            # 우선순위
-            self.jobs_table.setItem(row, 9, QTableWidgetItem(str(job.priority)))
-
-            # 생성일
-            self.jobs_table.setItem(row, 10, QTableWidgetItem(
-                job.created_at.strftime("%m/%d %H:%M")
-            ))
-
-            # 경과 시간 (완료된 프레임이 있으면 시작된 것으로 간주)
-            if completed > 0 or status == 'in_progress':
-                elapsed = datetime.now() - job.created_at
-                hours, remainder = divmod(int(elapsed.total_seconds()), 3600)
-                minutes, seconds = divmod(remainder, 60)
-                if hours > 0:
-                    elapsed_str = f"{hours}시간 {minutes}분"
-                else:
-                    elapsed_str = f"{minutes}분 {seconds}초"
-                self.jobs_table.setItem(row, 11, QTableWidgetItem(elapsed_str))
+    def on_jobs_sort_changed(self, column: int, order):
+        """헤더 클릭 - DB 정렬 가능한 열이면 첫 페이지부터 다시 조회"""
+        sort_by = self.JOB_SORT_KEYS.get(column)
+        if sort_by and self.status_service:
+            self.status_service.set_query(sort_by=sort_by, descending=order == Qt.DescendingOrder, offset=0)
+
+    def change_jobs_page(self, step: int):
+        """이전/다음 페이지"""
+        if not self.jobs_page or not self.status_service:
+            return
+        offset, limit, total = self.jobs_page
+        offset = max(0, min(offset + step * limit, max(0, total - 1) // limit * limit))
+        self.status_service.set_query(offset=offset)
+
+    def build_job_row(self, job: Job, status: str, completed: int, total: int,
+                      eye_progress: dict, now: datetime) -> tuple:
+        """작업 테이블 한 행 (셀 = (표시, 정렬 값))"""
+        # 눈별 진행률 (L, R, SBS)
+        eye_cells = []
+        for eye in ('left', 'right', 'sbs'):
+            ep = eye_progress.get(eye)
+            if ep:
+                eye_cells.append(cell(f"{ep['completed']}/{ep['total']}",
+                                      ep['completed'] / ep['total'] if ep['total'] > 0 else 0.0))
             else:
-                self.jobs_table.setItem(row, 11, QTableWidgetItem("-"))
+                eye_cells.append(cell("-", -1.0))
 
-        # 워커 현황 업데이트
-        self.refresh_workers()
+        # 전체 진행률
+        pct = (completed / total * 100) if total > 0 else 0
 
-    def refresh_workers(self):
-        """워커 현황 새로고침"""
-        workers = self.farm_manager.get_active_workers()
-        self.worker_table.setRowCount(len(workers))
-        for row, worker in enumerate(workers):
-            self.worker_table.setItem(row, 0, QTableWidgetItem(worker.worker_id))
+        # 경과 시간 (완료된 프레임이 있으면 시작된 것으로 간주)
+        if completed > 0 or status == 'in_progress':
+            elapsed_sec = int((now - job.created_at).total_seconds())
+            hours, remainder = divmod(elapsed_sec, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            if hours > 0:
+                elapsed = cell(f"{hours}시간 {minutes}분", elapsed_sec)
+            else:
+                elapsed = cell(f"{minutes}분 {seconds}초", elapsed_sec)
+        else:
+            elapsed = cell("-", -1)
+
+        return (
+            cell(job.job_id),
+            cell(Path(job.clip_path).stem),
+            cell(f"{job.start_frame}-{job.end_frame}", job.start_frame),
+            cell(job.pool_id),
+            cell(self.JOB_STATUS_TEXT.get(status, status)),
+            *eye_cells,
+            cell(f"{completed}/{total} ({pct:.2f}%)", pct),
+            cell(str(job.priority), job.priority),
+            cell(job.created_at.strftime("%m/%d %H:%M"), job.created_at.timestamp()),
+            elapsed,
+        )
 
+    def on_jobs_selection_changed(self, *args):
+        """작업 하나를 고르면 그 작업의 프레임 히트맵 조회 시작"""
+        job_ids = selected_keys(self.jobs_table, self.jobs_proxy)
+        if self.status_service:
+            self.status_service.watch_job(job_ids[0] if len(job_ids) == 1 else None)
+
+    def update_job_heatmap(self, frames):
+        """프레임 히트맵과 상태별 프레임 수 표시"""
+        self.job_heatmap.set_frames(frames)
+        if frames is None:
+            self.job_heatmap_label.setText("🧩 프레임 현황")
+            return
+        counts = {}
+        for runs in frames.runs.values():
+            for run_start, run_end, status, _ in runs:
+                counts[status] = counts.get(status, 0) + run_end - run_start + 1
+        summary = " · ".join(f"{name} {counts[st]:,}" for st, (_, _, name) in FRAME_STATUS_STYLE.items() if counts.get(st))
+        self.job_heatmap_label.setText(f"🧩 {frames.job_id} [{frames.start_frame}-{frames.end_frame}]  {summary}")
+
+    def refresh_workers(self, workers):
+        """워커 현황 반영 (바뀐 셀만 모델에 반영)"""
+        rows = {}
+        for worker in workers:
             status_icon = {'active': '🟢', 'idle': '🟡', 'offline': '🔴'}.get(worker.status, '⚪')
-            self.worker_table.setItem(row, 1, QTableWidgetItem(f"{status_icon} {worker.status}"))
-
-            self.worker_table.setItem(row, 2, QTableWidgetItem(worker.current_job_id or "-"))
-            self.worker_table.setItem(row, 3, QTableWidgetItem(str(worker.frames_completed)))
-
             if worker.last_heartbeat:
-                time_str = worker.last_heartbeat.strftime("%H:%M:%S")
+                last_seen = cell(worker.last_heartbeat.strftime("%H:%M:%S"), worker.last_heartbeat.timestamp())
             else:
-                time_str = "-"
-            self.worker_table.setItem(row, 4, QTableWidgetItem(time_str))
+                last_seen = cell("-", 0.0)
+            rows[worker.worker_id] = (
+                cell(worker.worker_id),
+                cell(f"{status_icon} {worker.status}"),
+                cell(worker.current_job_id or "-"),
+                cell(str(worker.frames_completed), worker.frames_completed),
+                last_seen,
+            )
+        self.worker_model.set_rows(rows)
 
     def show_job_context_menu(self, position):
         """작업 컨텍스트 메뉴"""
-        selected = self.jobs_table.selectedItems()
-        if not selected:
+        job_ids = selected_keys(self.jobs_table, self.jobs_proxy)
+        if not job_ids:
             return
 
-        rows = set(item.row() for item in selected)
-        job_ids = [self.jobs_table.item(row, 0).text() for row in rows]
-
         menu = QMenu(self)
 
         # 출력 폴더 열기 (단일 선택시)
@@ -1450,6 +1817,12 @@ class FarmUIV2(QMainWindow):
             menu.addAction(scan_action)
             menu.addSeparator()
 
+        # 중복 렌더 감사
+        audit_action = QAction("📊 중복 렌더 감사", self)
+        audit_action.triggered.connect(lambda: self.show_duplicate_report(job_ids))
+        menu.addAction(audit_action)
+        menu.addSeparator()
+
         # 상태 변경
         exclude_action = QAction("⏸️ 제외", self)
         exclude_action.triggered.connect(lambda: self.batch_job_action(job_ids, 'exclude'))
@@ -1513,6 +1886,23 @@ class FarmUIV2(QMainWindow):
         else:
             self.append_worker_log(f"⚠️ 작업을 찾을 수 없습니다: {job_id}")
 
+    def show_duplicate_report(self, job_ids: list):
+        """선택한 작업의 중복 렌더/낭비 시간 리포트를 로그에 출력 (감사 기록 조회/집계는 별도 스레드)"""
+        self.append_worker_log("⏳ 중복 렌더 감사 리포트 작성 중...")
+        threading.Thread(target=self._build_duplicate_report, args=(job_ids,), daemon=True).start()
+
+    def _build_duplicate_report(self, job_ids: list):
+        """백그라운드: 리포트 작성 후 로그 출력"""
+        try:
+            report = self.farm_manager.get_duplicate_report(job_ids)
+        except Exception as e:
+            self.append_worker_log(f"⚠️ 감사 리포트 오류: {e}")
+            return
+        finally:
+            self.farm_manager.db.close()  # 이 스레드의 DB 연결만 닫힘
+        for line in format_report(report):
+            self.append_worker_log(f"📊 {line}")
+
     def batch_job_action(self, job_ids: list, action: str):
         """배치 작업 처리"""
         for job_id in job_ids:
@@ -1554,9 +1944,9 @@ class FarmUIV2(QMainWindow):
             self.farm_manager,
             self.cli_path,
             self.parallel_spin.value(),
-            self.watchdog_check.isChecked()
+            self.watchdog_check.isChecked(),
+            self.log_sink
         )
-        self.worker_thread.log_signal.connect(self.append_worker_log)
         self.worker_thread.progress_signal.connect(self.update_progress)
         self.worker_thread.job_completed_signal.connect(self.on_job_completed)
         self.worker_thread.start()
@@ -1647,11 +2037,8 @@ class FarmUIV2(QMainWindow):
         self.stats_label.setText(f"진행: {completed}/{total} ({pct:.2f}%)")
 
     def append_worker_log(self, text: str):
-        """로그 추가"""
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {text}")
-        # 스크롤 맨 아래로
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        """로그 추가 (어느 스레드에서나 호출 가능)"""
+        self.log_sink.write(text)
 
     def closeEvent(self, event):
         """종료 이벤트"""
@@ -1662,10 +2049,13 @@ class FarmUIV2(QMainWindow):
             self.worker_thread.stop()
             self.worker_thread.wait(5000)
 
-        if self.status_timer:
-            self.status_timer.stop()
+        if self.status_service:
+            self.status_service.stop()
+            self.status_service.wait()
 
+        self.clip_probes.shutdown()
         self.farm_manager.close()
+        self.log_sink.close()
         event.accept()
 
     def save_window_state(self):
@@ -1810,6 +2200,12 @@ class FarmUIV2(QMainWindow):
             priority=min(original_job.priority + 10, 100)  # 우선순위 높임 (max 100)
         )
 
+        # 재렌더 작업은 시작~끝 전체를 다시 렌더하므로 그 구간을 리셋으로 기록 (중복 렌더 감사용)
+        try:
+            self.farm_manager.record_frame_resets(original_job_id, "", [(start_frame, end_frame)], CAUSE_RERENDER)
+        except Exception:
+            pass
+
         self.append_worker_log(f"🔄 재렌더 작업 생성: {new_job_id} ({len(error_frames)}프레임)")
 
         return new_job_id
@@ -1864,8 +2260,8 @@ class FarmUIV2(QMainWindow):
             if error_frames and settings.seqchecker_auto_rerender:
                 new_job_id = self.create_rerender_job(job_id, error_frames)
                 if new_job_id:
-                    # UI 스레드에서 새로고침
-                    QTimer.singleShot(0, self.refresh_jobs)
+                    # 상태 서비스에 새로고침 요청 (스레드 안전)
+                    self.refresh_jobs()
         except Exception as e:
             self.append_worker_log(f"⚠️ SeqChecker 오류: {e}")
 
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 작업 프레임 히트맵
+작업 한 개의 프레임 × eye 상태를 가로 막대로 표시 (대기/처리 중/완료/실패, 툴팁에 워커)
+
+- 입력은 FarmDatabase.get_frame_runs()의 구간 목록 (프레임 단위 행이 아님)
+- 위젯 폭만큼의 칸에 구간을 우선순위 낮은 상태부터 bytearray 슬라이스로 칠하므로 비용 = 구간 수 + 칸 수
+  (한 칸에 여러 프레임이 들어가면 실패 > 처리 중 > 대기 > 완료 순으로 보임 - 실패 한 프레임도 가려지지 않음)
+- 새 구간 목록이 오면 바뀐 eye 줄만 다시 칠함
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QWidget, QToolTip
+
+from .farm_db import FrameRuns
+
+# 상태 -> (칠하는 순서 = 우선순위, 색, 표시 이름)
+FRAME_STATUS_STYLE = {
+    "completed": (1, "#4caf50", "완료"),
+    "pending": (2, "#4a4a4a", "대기"),
+    "claimed": (3, "#ffa726", "처리 중"),
+    "failed": (4, "#e53935", "실패"),
+}
+EYE_LABELS = {"left": "L", "right": "R", "sbs": "SBS"}
+
+LABEL_WIDTH = 36
+ROW_HEIGHT = 18
+ROW_GAP = 4
+
+
+class FrameHeatmap(QWidget):
+    """프레임 × eye 상태 히트맵"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frames: Optional[FrameRuns] = None
+        self._rows: Dict[str, bytearray] = {}  # eye -> 칸별 상태 우선순위
+        self._width = 0  # _rows를 칠한 칸 수
+        self._starts: Dict[str, List[int]] = {}  # eye -> 구간 시작 프레임 (툴팁 검색용)
+
+        self._colors = [QColor("#2b2b2b").rgb()] + [0] * len(FRAME_STATUS_STYLE)
+        for priority, color, _ in FRAME_STATUS_STYLE.values():
+            self._colors[priority] = QColor(color).rgb()
+
+        self.setMouseTracking(True)
+        self.setMinimumHeight(ROW_HEIGHT + 2 * ROW_GAP)
+
+    def set_frames(self, frames: Optional[FrameRuns]):
+        """새 구간 목록 반영 (같은 작업이면 구간이 바뀐 eye만 다시 칠함)"""
+        old = self.frames
+        self.frames = frames
+        if frames is None:
+            self._rows.clear()
+            self._starts.clear()
+        else:
+            same_job = old is not None and old.job_id == frames.job_id and old.eyes == frames.eyes
+            for eye in frames.eyes:
+                runs = frames.runs.get(eye, [])
+                if same_job and eye in self._rows and old.runs.get(eye, []) == runs:
+                    continue
+                self._starts[eye] = [run[0] for run in runs]
+                if self._width:
+                    self._rows[eye] = self._paint_row(runs)
+            for eye in list(self._rows):
+                if eye not in frames.eyes:
+                    del self._rows[eye]
+                    self._starts.pop(eye, None)
+        rows = len(frames.eyes) if frames else 1
+        self.setMinimumHeight(rows * (ROW_HEIGHT + ROW_GAP) + ROW_GAP)
+        self.update()
+
+    def _paint_row(self, runs: List[Tuple[int, int, str, str]]) -> bytearray:
+        """구간 -> 칸별 우선순위 (낮은 우선순위부터 칠해 높은 상태가 남음)"""
+        width = self._width
+        start = self.frames.start_frame
+        count = max(1, self.frames.end_frame - start + 1)
+        row = bytearray(width)
+        for run_start, run_end, status, _ in sorted(runs, key=lambda r: FRAME_STATUS_STYLE.get(r[2], (0,))[0]):
+            priority = FRAME_STATUS_STYLE.get(status, (0,))[0]
+            # frame_at과 같은 대응 (칸 x의 프레임 = start + x * count // width) - 폭보다 프레임이 적으면 여러 칸
+            first = (run_start - start) * width // count
+            last = max(first, (run_end - start + 1) * width // count - 1)
+            row[first:last + 1] = bytes([priority]) * (last - first + 1)
+        return row[:width]
+
+    def _bar_rect(self) -> QRect:
+        return self.rect().adjusted(LABEL_WIDTH, ROW_GAP, -ROW_GAP, -ROW_GAP)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#1e1e1e"))
+        if self.frames is None:
+            painter.setPen(QColor("#888888"))
+            painter.drawText(self.rect(), Qt.AlignCenter, "작업을 선택하면 프레임 현황이 표시됩니다")
+            return
+
+        bar = self._bar_rect()
+        if bar.width() != self._width:
+            self._width = max(1, bar.width())
+            self._rows = {eye: self._paint_row(self.frames.runs.get(eye, [])) for eye in self.frames.eyes}
+
+        painter.setPen(QColor("#cccccc"))
+        for i, eye in enumerate(self.frames.eyes):
+            top = bar.top() + i * (ROW_HEIGHT + ROW_GAP)
+            painter.drawText(QRect(0, top, LABEL_WIDTH - 4, ROW_HEIGHT), Qt.AlignRight | Qt.AlignVCenter,
+                             EYE_LABELS.get(eye, eye))
+            data = bytes(self._rows[eye])  # QImage는 버퍼를 복사하지 않음 - 그리는 동안 유지
+            image = QImage(data, self._width, 1, self._width, QImage.Format_Indexed8)
+            image.setColorTable(self._colors)
+            painter.drawImage(QRect(bar.left(), top, self._width, ROW_HEIGHT), image)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update()  # 칸 수는 paintEvent에서 다시 계산
+
+    def frame_at(self, x: int, y: int) -> Optional[Tuple[str, int]]:
+        """위젯 좌표 -> (eye, 프레임 번호)"""
+        if self.frames is None or not self._width:
+            return None
+        bar = self._bar_rect()
+        i = (y - bar.top()) // (ROW_HEIGHT + ROW_GAP)
+        if not bar.left() <= x < bar.left() + self._width or not 0 <= i < len(self.frames.eyes):
+            return None
+        count = self.frames.end_frame - self.frames.start_frame + 1
+        return self.frames.eyes[i], self.frames.start_frame + (x - bar.left()) * count // self._width
+
+    def run_at(self, eye: str, frame: int) -> Optional[Tuple[int, int, str, str]]:
+        """프레임이 속한 구간"""
+        starts = self._starts.get(eye, [])
+        i = bisect_right(starts, frame) - 1
+        if i < 0:
+            return None
+        return self.frames.runs[eye][i]
+
+    def mouseMoveEvent(self, event):
+        pos = event.position().toPoint()
+        hit = self.frame_at(pos.x(), pos.y())
+        if hit is None:
+            QToolTip.hideText()
+            return
+        eye, frame = hit
+        run = self.run_at(eye, frame)
+        if run is None:
+            QToolTip.hideText()
+            return
+        run_start, run_end, status, worker_id = run
+        text = f"{EYE_LABELS.get(eye, eye)} 프레임 {frame}: {FRAME_STATUS_STYLE.get(status, (0, '', status))[2]}"
+        text += f"\n구간 {run_start}-{run_end}"
+        if worker_id:
+            text += f" · 워커 {worker_id}"
+        QToolTip.showText(event.globalPosition().toPoint(), text, self)
+
+
+def legend_html() -> str:
+    """상태 색 범례 (QLabel용)"""
+    return " ".join(f'<span style="color:{color}">■</span> {name}'
+                    for _, color, name in FRAME_STATUS_STYLE.values())
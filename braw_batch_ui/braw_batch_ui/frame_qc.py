@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BRAW Render Farm - 렌더 결과 이미지 QC
+검은 프레임, NaN/Inf 픽셀, 클리핑, 단색(STMAP 오류 등) 프레임 탐지
+PPM은 메모리 매핑, EXR은 OpenEXR 바인딩으로 읽고 서브샘플 격자에서 벡터 연산
+"""
+
+import mmap
+from concurrent.futures import ProcessPoolExecutor, Future
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import OpenEXR
+except ImportError:
+    OpenEXR = None
+
+from .config import (
+    QC_SUBSAMPLE_STEP,
+    QC_BLACK_LEVEL,
+    QC_BLACK_RATIO,
+    QC_CLIPPED_RATIO,
+    QC_EXR_CLIP_LEVEL,
+    QC_FLAT_STDDEV,
+    QC_PROCESS_WORKERS,
+)
+
+
+def is_available(output_format: str) -> bool:
+    """해당 출력 포맷의 QC 가능 여부 (numpy 필수, EXR은 OpenEXR 추가 필요)"""
+    if np is None:
+        return False
+    if output_format == "exr":
+        return OpenEXR is not None
+    return True
+
+
+def _read_ppm(path: Path, step: int):
+    """PPM(P6) 메모리 매핑 후 서브샘플 격자만 읽기 → (h, w, 3) float32, 0~1"""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        # 헤더: P6 <w> <h> <maxval> + 공백 1바이트
+        tokens = []
+        pos = 0
+        while len(tokens) < 4:
+            while mm[pos:pos + 1].isspace():
+                pos += 1
+            if mm[pos:pos + 1] == b"#":
+                pos = mm.find(b"\n", pos) + 1
+                continue
+            end = pos
+            while end < len(mm) and not mm[end:end + 1].isspace():
+                end += 1
+            if end == pos:
+                raise ValueError("PPM 헤더 손상")
+            tokens.append(mm[pos:end])
+            pos = end
+        if tokens[0] != b"P6":
+            raise ValueError(f"지원하지 않는 PPM 형식: {tokens[0]!r}")
+        width, height, maxval = int(tokens[1]), int(tokens[2]), int(tokens[3])
+        dtype = np.uint8 if maxval < 256 else np.dtype(">u2")
+
+        pixels = np.ndarray((height, width, 3), dtype=dtype, buffer=mm, offset=pos + 1)
+        # 격자 샘플만 복사 - 샘플 행이 걸친 페이지만 실제로 읽힘
+        sampled = pixels[::step, ::step].astype(np.float32) / float(maxval)
+        del pixels  # mmap 뷰 해제 (close 전에 필요)
+        return sampled
+    finally:
+        mm.close()
+
+
+def _read_exr(path: Path, step: int):
+    """EXR(half-float DWAA) 디코드 후 서브샘플 격자 → (h, w, c) float32"""
+    if hasattr(OpenEXR, "File"):
+        with OpenEXR.File(str(path), separate_channels=True) as exr:
+            channels = exr.channels()
+            names = [n for n in ("R", "G", "B") if n in channels] or sorted(channels)[:3]
+            planes = [channels[n].pixels[::step, ::step] for n in names]
+    else:
+        # 구버전 바인딩 (InputFile API)
+        import Imath
+        exr = OpenEXR.InputFile(str(path))
+        try:
+            header = exr.header()
+            dw = header["dataWindow"]
+            width, height = dw.max.x - dw.min.x + 1, dw.max.y - dw.min.y + 1
+            names = [n for n in ("R", "G", "B") if n in header["channels"]]
+            half = Imath.PixelType(Imath.PixelType.HALF)
+            planes = [
+                np.frombuffer(exr.channel(n, half), dtype=np.float16).reshape(height, width)[::step, ::step]
+                for n in names
+            ]
+        finally:
+            exr.close()
+    return np.stack(planes, axis=-1).astype(np.float32)
+
+
+def analyze_frame(path: str, step: int = QC_SUBSAMPLE_STEP) -> Dict[str, Any]:
+    """프레임 하나 QC (프로세스 풀에서 실행)
+
+    Returns:
+        {"status": "ok"|"anomaly"|"error", "issues": [...], "stats": {...}}
+    """
+    path = Path(path)
+    is_exr = path.suffix.lower() == ".exr"
+    try:
+        img = _read_exr(path, step) if is_exr else _read_ppm(path, step)
+    except Exception as e:
+        return {"status": "error", "issues": ["unreadable"], "stats": {"error": str(e)[:200]}}
+
+    pixels = img.reshape(-1, img.shape[-1])
+    finite = np.isfinite(pixels)
+    nonfinite = int(pixels.size - np.count_nonzero(finite))
+    safe = np.where(finite, pixels, 0.0)
+
+    peak = safe.max(axis=1)
+    black_ratio = float(np.count_nonzero(peak <= QC_BLACK_LEVEL)) / len(peak)
+    clip_level = QC_EXR_CLIP_LEVEL if is_exr else 1.0
+    clipped_ratio = float(np.count_nonzero(safe.min(axis=1) >= clip_level)) / len(peak)
+    stddev = safe.std(axis=0)
+
+    stats = {
+        "samples": int(len(peak)),
+        "mean": [round(float(v), 5) for v in safe.mean(axis=0)],
+        "min": [round(float(v), 5) for v in safe.min(axis=0)],
+        "max": [round(float(v), 5) for v in safe.max(axis=0)],
+        "std": [round(float(v), 5) for v in stddev],
+        "nonfinite": nonfinite,
+        "black_ratio": round(black_ratio, 4),
+        "clipped_ratio": round(clipped_ratio, 4),
+    }
+
+    issues = []
+    if nonfinite > 0:
+        issues.append("nan")
+    if black_ratio >= QC_BLACK_RATIO:
+        issues.append("black")
+    elif clipped_ratio >= QC_CLIPPED_RATIO:
+        issues.append("clipped")
+    elif float(stddev.max()) <= QC_FLAT_STDDEV:
+        issues.append("flat")  # 단색 - 잘못된 STMAP 워프 등
+
+    return {"status": "anomaly" if issues else "ok", "issues": issues, "stats": stats}
+
+
+class FrameQCPool:
+    """QC 프로세스 풀 (워커 스레드에서 비동기 제출)"""
+
+    def __init__(self, max_workers: int = QC_PROCESS_WORKERS):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def submit(self, path: Path) -> Future:
+        """프레임 QC 제출 (풀은 처음 제출 시 생성)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor.submit(analyze_frame, str(path))
+
+    def shutdown(self):
+        """풀 종료 (대기 중인 QC는 취소)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 작업 파일 캐시
+jobs/*.json을 (이름, mtime_ns, size) 키로 파싱 결과와 함께 메모리에 두고,
+scandir 한 번으로 바뀐 파일만 다시 읽고 사라진 파일은 버린다 (작업 파일은 제출 후 거의 바뀌지 않음)
+
+generation은 목록에 변화(추가/변경/삭제)가 있을 때만 증가 - UI는 값이 같으면 다시 그리지 않아도 됨
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class JobFileCache:
+    """작업 폴더 하나의 파싱 캐시 (스레드 안전)
+
+    parse(path)는 파일을 읽어 파싱한 객체를 반환 (읽기/파싱 실패 시 None - 다음 갱신 때 재시도)
+    """
+
+    def __init__(self, folder: Path, parse: Callable[[Path], Optional[Any]],
+                 suffix: str = ".json", ttl_sec: float = 1.0):
+        self.folder = Path(folder)
+        self.parse = parse
+        self.suffix = suffix
+        self.ttl_sec = ttl_sec
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Tuple[int, int], Any]] = {}  # 이름 -> ((mtime_ns, size), 파싱 결과)
+        self._loaded_at = 0.0
+        self.generation = 0
+
+        # 통계
+        self.file_reads = 0
+        self.file_hits = 0
+
+    def refresh(self, force: bool = False) -> bool:
+        """TTL이 지났으면 scandir 후 바뀐 파일만 다시 파싱 (목록이 바뀌었으면 True)"""
+        with self._lock:
+            if not force and self._loaded_at and time.time() - self._loaded_at < self.ttl_sec:
+                return False
+            listing = {}
+            try:
+                with os.scandir(self.folder) as it:
+                    for entry in it:
+                        if not entry.name.endswith(self.suffix):
+                            continue
+                        try:
+                            st = entry.stat()
+                        except (OSError, IOError):
+                            continue  # 나열 직후 삭제됨
+                        listing[entry.name] = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                pass
+            except (OSError, IOError):
+                return False  # 네트워크 오류 - 이전 목록 유지
+
+            changed = False
+            entries = {}
+            for name, key in listing.items():
+                cached = self._entries.get(name)
+                if cached is not None and cached[0] == key:
+                    entries[name] = cached
+                    self.file_hits += 1
+                    continue
+                self.file_reads += 1
+                value = self.parse(self.folder / name)
+                if value is None:
+                    # 쓰는 중(빈 파일/부분 쓰기) - 이전 값 유지, 키는 저장하지 않아 다음 갱신 때 다시 읽음
+                    if cached is not None:
+                        entries[name] = ((0, -1), cached[1])
+                    continue
+                entries[name] = (key, value)
+                changed = True
+            if set(entries) != set(self._entries):
+                changed = True
+
+            self._entries = entries
+            self._loaded_at = time.time()
+            if changed:
+                self.generation += 1
+            return changed
+
+    def values(self) -> List[Any]:
+        """모든 파싱 결과 (이름 순)"""
+        self.refresh()
+        with self._lock:
+            return [self._entries[name][1] for name in sorted(self._entries)]
+
+    def get(self, name: str) -> Optional[Any]:
+        """파일 하나의 파싱 결과 (없으면 None)"""
+        self.refresh()
+        with self._lock:
+            cached = self._entries.get(name)
+            return cached[1] if cached is not None else None
+
+    def invalidate(self, name: str = None):
+        """이 프로세스가 작업 파일을 쓰거나 지운 직후 호출 - 다음 조회에서 바로 다시 scandir
+
+        name을 주면 mtime/size가 같아 보여도 그 파일은 다시 읽음 (같은 초 안의 수정 대비)
+        """
+        with self._lock:
+            self._loaded_at = 0.0
+            if name is not None and name in self._entries:
+                self._entries[name] = ((0, -1), self._entries[name][1])
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "generation": self.generation,
+                "file_reads": self.file_reads,
+                "file_hits": self.file_hits,
+            }
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 공유 폴더 리스(lease) 파일
+여러 워커 중 한 대만 맡아야 하는 일(클레임 만료 정리 등)의 담당자를 파일 하나로 선출
++ 내용이 다 쓰인 파일 원자적 생성 (create_exclusive)
+
+- 획득: 배타적 생성 (이미 있으면 실패) - 내용은 담당 워커 ID
+- 유지: 담당자가 주기적으로 mtime 갱신 (os.utime)
+- 만료: mtime이 TTL보다 오래되면 다른 워커가 rename으로 치우고 다시 O_EXCL 생성
+  rename은 한 워커만 성공하므로 동시에 만료를 본 워커 중 하나만 새 리스를 만든다
+  (드물게 두 워커가 잠깐 겹쳐도 다음 갱신 때 내용이 다른 쪽이 물러남 - 맡기는 일은 중복 실행해도 안전해야 함)
+"""
+
+import errno
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# 공유 폴더가 hard link를 지원하는지 (지원하지 않는다는 오류를 받으면 O_EXCL 생성으로 전환)
+_link_supported = True
+
+# hard link 미지원으로 보는 오류 (그 외 오류는 일시적인 공유 폴더 오류로 보고 그대로 올림)
+_LINK_UNSUPPORTED_ERRNOS = {errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.ENOSYS}
+_LINK_UNSUPPORTED_WINERRORS = {1, 50}  # ERROR_INVALID_FUNCTION, ERROR_NOT_SUPPORTED
+
+
+def _unique_name(path: Path, tag: str) -> Path:
+    """같은 폴더의 워커/스레드별 고유 임시 이름 (숨김 파일 - 폴더 목록에 걸리지 않음)"""
+    return path.with_name(f".{path.name}.{socket.gethostname()}.{os.getpid()}.{threading.get_ident()}.{tag}")
+
+
+def _create_excl(path: Path, data: bytes) -> bool:
+    """O_CREAT|O_EXCL로 생성 후 쓰기 (이미 있으면 False)
+
+    생성과 쓰기 사이에는 빈 파일이 보일 수 있음
+    """
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return True
+
+
+def create_exclusive(path: Path, data: bytes) -> bool:
+    """내용이 다 쓰인 파일을 path에 원자적으로 생성 (이미 있으면 False)
+
+    임시 파일에 다 쓴 뒤 hard link로 게시 - 다른 워커는 빈 파일/부분 쓰기를 볼 수 없어 검증 읽기가 필요 없음
+    hard link를 지원하지 않는 공유 폴더면 O_CREAT|O_EXCL로 생성 후 쓰기
+    """
+    global _link_supported
+    path = Path(path)
+    if not _link_supported:
+        return _create_excl(path, data)
+    temp = _unique_name(path, "tmp")
+    with open(temp, "wb") as f:
+        f.write(data)
+    try:
+        os.link(temp, path)
+        return True
+    except FileExistsError:
+        return False
+    except OSError as e:
+        if e.errno not in _LINK_UNSUPPORTED_ERRNOS and getattr(e, "winerror", None) not in _LINK_UNSUPPORTED_WINERRORS:
+            raise  # 일시적인 공유 폴더 오류 - 다음 시도에서 다시 hard link
+        _link_supported = False
+        return _create_excl(path, data)
+    finally:
+        try:
+            temp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+class FileLease:
+    """리스 파일 하나 (담당자 선출용, 워커 프로세스마다 하나)"""
+
+    def __init__(self, path: Path, holder_id: str, ttl_sec: float):
+        self.path = Path(path)
+        self.holder_id = holder_id
+        self.ttl_sec = ttl_sec
+        self.held = False
+
+    def _age(self) -> Optional[float]:
+        """리스 파일 경과 시간 (없으면 None)"""
+        try:
+            return time.time() - self.path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _read_holder(self) -> str:
+        """현재 담당 워커 ID (읽기 실패 시 빈 문자열)"""
+        try:
+            return self.path.read_text(encoding="utf-8").strip()
+        except (OSError, IOError, UnicodeDecodeError):
+            return ""
+
+    def _create(self) -> bool:
+        """리스 파일 생성 (이미 있으면 False)"""
+        return create_exclusive(self.path, self.holder_id.encode("utf-8"))
+
+    def acquire(self) -> bool:
+        """리스 획득 또는 갱신 (이 워커가 담당자면 True)
+
+        네트워크 오류는 담당하지 않은 것으로 처리 (다음 호출에서 재시도)
+        """
+        try:
+            age = self._age()
+            if age is not None and age < self.ttl_sec:
+                # 살아 있는 리스 - 내 것이면 갱신
+                if self.held and self._read_holder() == self.holder_id:
+                    os.utime(self.path)
+                    return True
+                self.held = False
+                return False
+
+            if age is not None:
+                # 만료된 리스 치우기 (rename은 한 워커만 성공)
+                tomb = self.path.with_name(f"{self.path.name}.{self.holder_id}.{os.getpid()}.stale")
+                try:
+                    os.replace(self.path, tomb)
+                except FileNotFoundError:
+                    pass  # 다른 워커가 먼저 치움
+                else:
+                    tomb.unlink(missing_ok=True)
+
+            self.held = self._create()
+            return self.held
+        except (OSError, IOError):
+            self.held = False
+            return False
+
+    def release(self):
+        """리스 반납 (내가 담당자일 때만 삭제)"""
+        if not self.held:
+            return
+        self.held = False
+        try:
+            if self._read_holder() == self.holder_id:
+                self.path.unlink(missing_ok=True)
+        except (OSError, IOError):
+            pass
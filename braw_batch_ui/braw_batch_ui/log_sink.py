@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 워커 로그 파이프라인
+워커 스레드는 줄마다 Qt 시그널을 보내지 않고 LogSink.write()로 기록만 하고,
+UI는 타이머로 쌓인 기록을 한 번에 가져가 위젯에 묶어서 추가 (이벤트 루프 부하 = 타이머 주기)
+
+- 링 버퍼: 최근 ring_size개 기록 보관 (검색/레벨 변경 시 위젯을 다시 그리는 원본)
+- 표시 대기열: 위젯이 따라가지 못하면 오래된 것부터 버리고 개수만 표시 (링과 파일에는 남음)
+- 파일: 로컬 디스크에 JSON 줄 형식, 크기 기준 회전 (쓰기는 별도 스레드)
+- 레벨: 명시하지 않으면 메시지 앞 아이콘으로 추정 (📊 진행, ⚠️ 경고, ❌/⏰ 오류)
+"""
+
+import json
+import logging
+import queue
+import re
+import threading
+import time
+from collections import deque
+from logging.handlers import QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLineEdit,
+                               QPlainTextEdit, QLabel)
+
+# 레벨 (logging 값과 호환, 진행률은 DEBUG와 INFO 사이)
+LOG_DEBUG = logging.DEBUG
+LOG_PROGRESS = 15
+LOG_INFO = logging.INFO
+LOG_WARNING = logging.WARNING
+LOG_ERROR = logging.ERROR
+
+LEVEL_NAMES = {LOG_DEBUG: "debug", LOG_PROGRESS: "progress", LOG_INFO: "info",
+               LOG_WARNING: "warning", LOG_ERROR: "error"}
+
+
+class LogRecord(NamedTuple):
+    """로그 기록 한 줄"""
+    ts: float
+    level: int
+    text: str
+
+
+def classify(text: str) -> int:
+    """메시지 아이콘으로 레벨 추정"""
+    head = text.lstrip()[:2]
+    if head.startswith("📊"):
+        return LOG_PROGRESS
+    if "❌" in head or "⏰" in head:
+        return LOG_ERROR
+    if "⚠" in head:
+        return LOG_WARNING
+    return LOG_INFO
+
+
+def format_record(record: LogRecord) -> str:
+    """위젯 표시 형식"""
+    return f"[{time.strftime('%H:%M:%S', time.localtime(record.ts))}] {record.text}"
+
+
+class LogSink:
+    """로그 기록 수집기 (모든 스레드에서 write 가능)"""
+
+    def __init__(self, ring_size: int = 50000, max_pending: int = 5000,
+                 log_dir: Path = None, name: str = "worker",
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5):
+        self._lock = threading.Lock()
+        self._ring = deque(maxlen=ring_size)
+        self._pending = deque()
+        self.max_pending = max_pending
+        self._dropped = 0  # 마지막 drain 이후 표시 대기열에서 버린 수
+
+        # 로컬 파일 (회전) - 쓰기는 QueueListener 스레드에서
+        self.log_file = None
+        self._queue = None
+        self._listener = None
+        if log_dir is not None:
+            try:
+                log_dir = Path(log_dir)
+                log_dir.mkdir(parents=True, exist_ok=True)
+                self.log_file = log_dir / f"{re.sub(r'[^\w.-]', '_', name)}.log"
+                handler = RotatingFileHandler(self.log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                              encoding="utf-8", delay=True)
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                self._queue = queue.SimpleQueue()
+                self._listener = QueueListener(self._queue, handler)
+                self._listener.start()
+            except OSError:
+                self.log_file = None  # 파일 기록 없이 계속 (표시/검색은 동작)
+
+    def write(self, text: str, level: int = None):
+        """기록 추가 (여러 줄이면 줄마다 한 기록)"""
+        now = time.time()
+        lines = text.split("\n") if "\n" in text else [text]
+        records = [LogRecord(now, level if level is not None else classify(line), line) for line in lines]
+        with self._lock:
+            self._ring.extend(records)
+            self._pending.extend(records)
+            overflow = len(self._pending) - self.max_pending
+            for _ in range(max(0, overflow)):
+                self._pending.popleft()
+            if overflow > 0:
+                self._dropped += overflow
+        if self._queue is not None:
+            for record in records:
+                self._queue.put(logging.makeLogRecord({
+                    "msg": json.dumps({"ts": round(record.ts, 3), "level": LEVEL_NAMES.get(record.level, record.level),
+                                       "msg": record.text}, ensure_ascii=False),
+                    "levelno": record.level,
+                }))
+
+    def drain(self, max_records: int) -> Tuple[List[LogRecord], int]:
+        """표시 대기 기록을 최대 max_records개 가져감 → (기록, 그 사이 버린 수)"""
+        with self._lock:
+            count = min(max_records, len(self._pending))
+            records = [self._pending.popleft() for _ in range(count)]
+            dropped, self._dropped = self._dropped, 0
+        return records, dropped
+
+    def recent(self, min_level: int = 0, limit: int = 1000, pattern: str = "") -> List[LogRecord]:
+        """링 버퍼에서 최근 기록 (대소문자 무시 부분 일치, 오래된 것부터)"""
+        pattern = pattern.lower()
+        with self._lock:
+            ring = list(self._ring)
+        result = []
+        for record in reversed(ring):
+            if record.level >= min_level and (not pattern or pattern in record.text.lower()):
+                result.append(record)
+                if len(result) >= limit:
+                    break
+        result.reverse()
+        return result
+
+    def close(self):
+        """파일 기록 종료 (남은 기록은 모두 씀)"""
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+            self._queue = None
+
+
+class LogView(QWidget):
+    """LogSink 표시 위젯 (묶음 추가, 레벨 필터, 링 버퍼 검색)"""
+
+    LEVEL_FILTERS = [
+        ("전체", LOG_DEBUG),
+        ("진행 이상", LOG_PROGRESS),
+        ("정보 이상", LOG_INFO),
+        ("경고 이상", LOG_WARNING),
+        ("오류만", LOG_ERROR),
+    ]
+
+    def __init__(self, sink: LogSink, max_lines: int = 5000, flush_interval_ms: int = 200,
+                 flush_max_records: int = 500, search_max_results: int = 2000,
+                 min_level: int = LOG_PROGRESS, parent=None):
+        super().__init__(parent)
+        self.sink = sink
+        self.max_lines = max_lines
+        self.flush_max_records = flush_max_records
+        self.search_max_results = search_max_results
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        bar = QHBoxLayout()
+        self.level_combo = QComboBox()
+        for label, level in self.LEVEL_FILTERS:
+            self.level_combo.addItem(label, level)
+        self.level_combo.setCurrentIndex(max(0, self.level_combo.findData(min_level)))
+        self.level_combo.currentIndexChanged.connect(self.rebuild)
+        bar.addWidget(self.level_combo)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔍 로그 검색 (최근 기록 전체 대상, 검색 중 실시간 표시 멈춤)")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.returnPressed.connect(self.rebuild)
+        self.search_input.textChanged.connect(lambda text: self.rebuild() if not text else None)
+        bar.addWidget(self.search_input, 1)
+
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #888;")
+        if sink.log_file is not None:
+            self.status_label.setToolTip(f"로그 파일: {sink.log_file}")
+        bar.addWidget(self.status_label)
+        layout.addLayout(bar)
+
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setFont(QFont("Consolas", 9))
+        self.text.setMaximumBlockCount(max_lines)  # 넘치면 위젯이 앞부분을 버림
+        layout.addWidget(self.text)
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.timeout.connect(self.flush)
+        self.flush_timer.start(flush_interval_ms)
+
+    @property
+    def min_level(self) -> int:
+        return self.level_combo.currentData()
+
+    @property
+    def searching(self) -> bool:
+        return bool(self.search_input.text().strip())
+
+    def _append(self, lines: List[str]):
+        """줄 묶음을 한 번에 추가 (맨 아래를 보고 있을 때만 자동 스크롤)"""
+        if not lines:
+            return
+        scrollbar = self.text.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+        self.text.appendPlainText("\n".join(lines))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def flush(self):
+        """대기 기록 묶음 반영 (타이머)"""
+        records, dropped = self.sink.drain(self.flush_max_records)
+        if self.searching:
+            return  # 검색 결과 표시 중 - 기록은 링/파일에만
+        min_level = self.min_level
+        lines = [format_record(r) for r in records if r.level >= min_level]
+        if dropped:
+            lines.append(f"… {dropped:,}줄 표시 생략 (검색/로그 파일에는 남음)")
+        self._append(lines)
+
+    def rebuild(self, *args):
+        """레벨/검색 변경 - 링 버퍼에서 다시 그리기"""
+        pattern = self.search_input.text().strip()
+        limit = self.search_max_results if pattern else self.max_lines
+        records = self.sink.recent(self.min_level, limit, pattern)
+        self.text.clear()
+        self._append([format_record(r) for r in records])
+        self.status_label.setText(f"검색 결과 {len(records):,}줄" if pattern else "")
@@ -16,6 +16,9 @@ import json
 import time
 import re
 
+from config import settings
+from clip_metadata import ClipMetadataCache, parse_info, clip_info_from
+
 
 class BatchJob:
     """배치 작업 정의 (프레임 범위 단위)"""
@@ -40,6 +43,9 @@ class BrawBatchUI:
         # CLI 경로
         self.cli_path = Path(__file__).parents[2] / "build" / "bin" / "braw_cli.exe"
 
+        # 클립 메타데이터 (렌더팜 farm.db 공유 캐시 - 환경변수 우선)
+        self.clip_metadata = ClipMetadataCache(os.environ.get("BRAW_FARM_DB", settings.db_path))
+
         # 상태
         self.is_running = False
         self.current_process: Optional[subprocess.Popen] = None
@@ -182,26 +188,29 @@ class BrawBatchUI:
             return
 
         try:
-            cmd = [str(self.cli_path), str(clip), "--info"]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=10
-            )
-
-            if result.returncode != 0:
-                messagebox.showerror("오류", f"클립 정보를 가져올 수 없습니다.\n{result.stderr}")
-                return
-
-            # 출력 파싱
-            info = {}
-            for line in result.stdout.splitlines():
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    info[key] = value
+            cached = self.clip_metadata.get(str(clip))  # 팜에서 이미 조회한 클립이면 CLI 실행 생략
+            if cached is not None:
+                info = cached.to_info()
+            else:
+                cmd = [str(self.cli_path), str(clip), "--info"]
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    timeout=10
+                )
+
+                if result.returncode != 0:
+                    messagebox.showerror("오류", f"클립 정보를 가져올 수 없습니다.\n{result.stderr}")
+                    return
+
+                # 출력 파싱
+                info = parse_info(result.stdout)
+                clip_info = clip_info_from(str(clip), info)
+                if clip_info is not None:
+                    self.clip_metadata.put(clip_info)
 
             if 'FRAME_COUNT' in info:
                 frame_count = int(info['FRAME_COUNT'])
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 중복 렌더 감사
+범위 실행 기록(워커, 결과, 소요 시간)과 프레임 리셋 기록으로
+같은 프레임이 여러 번 렌더된 횟수와 낭비된 슬롯 시간을 원인별로 집계
+
+V1은 워커별 JSONL 파일(audit/{worker_id}.jsonl), V2는 DB 테이블에 같은 형식의 레코드를 남긴다.
+    run:   {job_id, target, eye, start_frame, end_frame, worker_id, started_at, finished_at, outcome}
+    reset: {job_id, target, eye, start_frame, end_frame, cause, at}   # eye "" = 모든 eye
+"""
+
+import json
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+RUN_OK = "ok"
+RUN_FAILED = "failed"
+
+CAUSE_CLAIM_EXPIRY = "claim_expiry"  # 클레임 만료 후 다른 워커가 재클레임 (원래 워커는 계속 렌더 중)
+CAUSE_OVERLAP = "overlap"  # 클레임 경합 등으로 동시에 같은 프레임 렌더
+CAUSE_REPAIR = "repair"  # 검증 후 복구 (완료 기록 해제)
+CAUSE_RERENDER = "rerender"  # SeqChecker/QC 재렌더
+CAUSE_RESET = "reset"  # 사용자 작업 리셋
+CAUSE_OTHER = "other"  # 리셋 기록 없이 순차적으로 다시 렌더됨
+
+CAUSES = (CAUSE_CLAIM_EXPIRY, CAUSE_OVERLAP, CAUSE_REPAIR, CAUSE_RERENDER, CAUSE_RESET, CAUSE_OTHER)
+
+
+def render_target(output_dir: str, clip_path: str) -> str:
+    """출력 대상 키 (재렌더 작업처럼 job_id가 달라도 같은 파일을 쓰면 같은 키)"""
+    folder = Path(output_dir).as_posix().rstrip("/").lower()
+    return f"{folder}|{Path(clip_path).stem}"
+
+
+def frames_to_ranges(frames: List[int]) -> List[Tuple[int, int]]:
+    """프레임 목록 → 연속 구간 [(start, end), ...]"""
+    ranges = []
+    for frame in sorted(set(frames)):
+        if ranges and frame == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], frame)
+        else:
+            ranges.append((frame, frame))
+    return ranges
+
+
+class AuditLog:
+    """워커별 JSONL 감사 로그 (V1 파일 기반 팜용, append 전용)"""
+
+    def __init__(self, audit_dir: Path, worker_id: str):
+        self.audit_dir = Path(audit_dir)
+        self.log_file = self.audit_dir / f"{worker_id}.jsonl"
+        self.worker_id = worker_id
+        self._lock = threading.Lock()
+
+    def _append(self, record: Dict[str, Any]):
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            try:
+                self.audit_dir.mkdir(parents=True, exist_ok=True)
+                with open(self.log_file, "ab") as f:
+                    f.write(line)
+            except (OSError, IOError):
+                pass  # 감사 기록 실패가 렌더를 막으면 안 됨
+
+    def log_run(self, job_id: str, target: str, eye: str, start_frame: int, end_frame: int,
+                started_at: float, finished_at: float, outcome: str):
+        """범위 실행 기록"""
+        self._append({
+            "type": "run", "job_id": job_id, "target": target, "eye": eye,
+            "start_frame": start_frame, "end_frame": end_frame, "worker_id": self.worker_id,
+            "started_at": round(started_at, 3), "finished_at": round(finished_at, 3), "outcome": outcome,
+        })
+
+    def log_reset(self, job_id: str, target: str, eye: str, frames: List[int], cause: str, at: float):
+        """프레임 리셋 기록 (연속 구간 단위)"""
+        for start_frame, end_frame in frames_to_ranges(frames):
+            self._append({
+                "type": "reset", "job_id": job_id, "target": target, "eye": eye,
+                "start_frame": start_frame, "end_frame": end_frame, "cause": cause, "at": round(at, 3),
+            })
+
+
+def load_audit_dir(audit_dir: Path) -> Tuple[List[Dict], List[Dict]]:
+    """감사 로그 폴더 전체 읽기 → (runs, resets). 깨진 줄(쓰는 중인 마지막 줄 등)은 건너뜀"""
+    runs, resets = [], []
+    audit_dir = Path(audit_dir)
+    if not audit_dir.exists():
+        return runs, resets
+    for log_file in audit_dir.glob("*.jsonl"):
+        try:
+            with open(log_file, "rb") as f:
+                lines = f.read().splitlines()
+        except (OSError, IOError):
+            continue
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("type") == "run":
+                runs.append(record)
+            elif record.get("type") == "reset":
+                resets.append(record)
+    return runs, resets
+
+
+def _classify(earlier: List[Tuple], current: Tuple, resets: List[Tuple], frame_idx: int,
+              claim_timeout_sec: float) -> str:
+    """중복 렌더 한 건의 원인 판정
+
+    earlier/current: (started_at, finished_at, ...)
+    resets: 해당 target/eye의 [(at, start_frame, end_frame, cause), ...] (시간순)
+    """
+    started = current[0]
+    previous_start = earlier[-1][0]
+
+    # 직전 렌더 이후 이 프레임을 되돌린 기록이 있으면 그 원인
+    cause = None
+    for at, start_frame, end_frame, reset_cause in resets:
+        if at > started:
+            break
+        if at >= previous_start and start_frame <= frame_idx <= end_frame:
+            cause = reset_cause
+    if cause:
+        return cause
+
+    # 앞선 렌더가 끝나기 전에 시작됨 → 동시 렌더
+    # 앞선 클레임이 아직 유효했으면 클레임 경합(overlap), 모두 만료됐으면 만료 후 재클레임
+    overlapping = [e for e in earlier if e[1] > started]
+    if overlapping:
+        if any(started - e[0] < claim_timeout_sec for e in overlapping):
+            return CAUSE_OVERLAP
+        return CAUSE_CLAIM_EXPIRY
+    return CAUSE_OTHER
+
+
+def _segments(runs: List[Tuple[int, int, Tuple]], resets: List[Tuple[int, int, Tuple]]):
+    """프레임 축을 실행/리셋 구간 경계로 나눈 조각 (start, end, 덮는 실행들, 덮는 리셋들)
+
+    한 조각 안의 프레임은 모두 같은 실행/리셋에 덮이므로 프레임마다 풀지 않고 조각 단위로 판정
+    runs/resets: [(start_frame, end_frame, 값), ...], 실행이 하나도 없는 조각은 건너뜀
+    """
+    events = defaultdict(lambda: ([], []))  # 프레임 -> (시작하는 항목, 끝난 다음 항목)
+    for kind, items in ((0, runs), (1, resets)):
+        for i, (start_frame, end_frame, _) in enumerate(items):
+            events[start_frame][0].append((kind, i))
+            events[end_frame + 1][1].append((kind, i))
+    active = (set(), set())
+    points = sorted(events)
+    for point, next_point in zip(points, points[1:]):
+        for kind, i in events[point][1]:
+            active[kind].discard(i)
+        for kind, i in events[point][0]:
+            active[kind].add(i)
+        if active[0]:
+            yield (point, next_point - 1, sorted(runs[i][2] for i in active[0]),
+                   sorted(resets[i][2] for i in active[1]))
+
+
+def build_duplicate_report(runs: List[Dict], resets: List[Dict], claim_timeout_sec: float) -> Dict[str, Any]:
+    """중복 렌더 집계
+
+    성공한 범위 실행의 프레임마다 첫 렌더 이후의 렌더를 중복으로 보고,
+    범위 소요 시간(슬롯 점유 시간)을 프레임 수로 나눈 값을 낭비 시간으로 합산
+    (target/eye별로 구간 경계를 훑어 같은 실행에 덮인 프레임 묶음 단위로 계산 - 비용은 구간 수에 비례)
+
+    Returns:
+        {"targets": {target: 요약}, "totals": 요약}
+        요약 = {job_ids, frames, renders, duplicate_frames, duplicate_renders,
+                wasted_hours, failed_hours, by_cause: {cause: {"renders", "hours"}}}
+    """
+    run_index = defaultdict(list)  # (target, eye) -> [(start, end, (started, finished, per_frame_sec))]
+    summaries: Dict[str, Dict[str, Any]] = {}
+
+    for run in runs:
+        target = run["target"]
+        summary = summaries.setdefault(target, _empty_summary())
+        if run["job_id"] not in summary["job_ids"]:
+            summary["job_ids"].append(run["job_id"])
+        duration = max(0.0, run["finished_at"] - run["started_at"])
+        if run["outcome"] != RUN_OK:
+            summary["failed_hours"] += duration / 3600
+            continue
+        per_frame = duration / (run["end_frame"] - run["start_frame"] + 1)
+        run_index[(target, run["eye"])].append(
+            (run["start_frame"], run["end_frame"], (run["started_at"], run["finished_at"], per_frame)))
+
+    reset_index = defaultdict(list)  # (target, eye) -> [(start, end, (at, start, end, cause))]
+    for reset in resets:
+        reset_index[(reset["target"], reset["eye"])].append(
+            (reset["start_frame"], reset["end_frame"],
+             (reset["at"], reset["start_frame"], reset["end_frame"], reset["cause"])))
+
+    for (target, eye), eye_runs in run_index.items():
+        summary = summaries[target]
+        eye_resets = reset_index.get((target, eye), []) + reset_index.get((target, ""), [])
+        for start_frame, end_frame, entries, frame_resets in _segments(eye_runs, eye_resets):
+            count = end_frame - start_frame + 1
+            summary["frames"] += count
+            summary["renders"] += count * len(entries)
+            if len(entries) < 2:
+                continue
+            summary["duplicate_frames"] += count
+            for i in range(1, len(entries)):
+                cause = _classify(entries[:i], entries[i], frame_resets, start_frame, claim_timeout_sec)
+                hours = entries[i][2] * count / 3600
+                summary["duplicate_renders"] += count
+                summary["wasted_hours"] += hours
+                summary["by_cause"][cause]["renders"] += count
+                summary["by_cause"][cause]["hours"] += hours
+
+    totals = _empty_summary()
+    for summary in summaries.values():
+        totals["job_ids"].extend(summary["job_ids"])
+        for key in ("frames", "renders", "duplicate_frames", "duplicate_renders", "wasted_hours", "failed_hours"):
+            totals[key] += summary[key]
+        for cause, values in summary["by_cause"].items():
+            totals["by_cause"][cause]["renders"] += values["renders"]
+            totals["by_cause"][cause]["hours"] += values["hours"]
+
+    return {"targets": summaries, "totals": totals}
+
+
+def _empty_summary() -> Dict[str, Any]:
+    return {
+        "job_ids": [], "frames": 0, "renders": 0, "duplicate_frames": 0, "duplicate_renders": 0,
+        "wasted_hours": 0.0, "failed_hours": 0.0,
+        "by_cause": {cause: {"renders": 0, "hours": 0.0} for cause in CAUSES},
+    }
+
+
+def format_report(report: Dict[str, Any]) -> List[str]:
+    """리포트 → 로그 출력용 문자열 목록 (낭비 시간 큰 순)"""
+    def cause_text(summary):
+        parts = [f"{cause} {v['renders']}회/{v['hours']:.2f}h"
+                 for cause, v in summary["by_cause"].items() if v["renders"]]
+        return ", ".join(parts) if parts else "-"
+
+    totals = report["totals"]
+    lines = [
+        f"중복 렌더 감사: 프레임 {totals['frames']}개, 렌더 {totals['renders']}회, "
+        f"중복 프레임 {totals['duplicate_frames']}개 (중복 렌더 {totals['duplicate_renders']}회)",
+        f"  낭비: {totals['wasted_hours']:.2f} 슬롯시간 (실패 실행 {totals['failed_hours']:.2f}시간 별도)",
+        f"  원인: {cause_text(totals)}",
+    ]
+    targets = sorted(report["targets"].values(), key=lambda s: s["wasted_hours"], reverse=True)
+    for summary in targets:
+        if not summary["duplicate_renders"]:
+            continue
+        job_label = summary["job_ids"][0]
+        if len(summary["job_ids"]) > 1:
+            job_label += f" 외 {len(summary['job_ids']) - 1}개"
+        lines.append(
+            f"  - {job_label}: 중복 {summary['duplicate_frames']}/{summary['frames']}프레임, "
+            f"{summary['wasted_hours']:.2f}h ({cause_text(summary)})"
+        )
+    return lines
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BRAW Render Farm - SBS 프레임 조립
+이미 렌더된 L/R 출력을 가로로 이어 붙여 SBS 프레임 생성 (클립을 세 번째로 디코딩하지 않음)
+CLI의 merge_sbs와 같은 배치: 왼쪽 | 오른쪽, 폭 = L 폭 + R 폭
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, Future
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import OpenEXR
+except ImportError:
+    OpenEXR = None
+
+from .config import SBS_ASSEMBLY_WORKERS
+
+
+def is_available(output_format: str) -> bool:
+    """해당 출력 포맷의 SBS 조립 가능 여부 (numpy 필수, EXR은 OpenEXR 3.x 바인딩 추가 필요)"""
+    if np is None:
+        return False
+    if output_format == "exr":
+        return OpenEXR is not None and hasattr(OpenEXR, "File")
+    return True
+
+
+def _temp_path(output_path: Path) -> Path:
+    """임시 출력 경로 (시퀀스 패턴에 걸리지 않는 이름, 완료 후 os.replace)"""
+    return output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+
+
+def _read_ppm(path: Path):
+    """PPM(P6) 읽기 → (maxval, (h, w, 3) 배열). CLI는 16비트(65535) big-endian으로 씀"""
+    with open(path, "rb") as f:
+        data = f.read()
+    tokens = []
+    pos = 0
+    while len(tokens) < 4:
+        while pos < len(data) and data[pos:pos + 1].isspace():
+            pos += 1
+        if data[pos:pos + 1] == b"#":
+            pos = data.find(b"\n", pos) + 1
+            continue
+        end = pos
+        while end < len(data) and not data[end:end + 1].isspace():
+            end += 1
+        if end == pos:
+            raise ValueError("PPM 헤더 손상")
+        tokens.append(data[pos:end])
+        pos = end
+    if tokens[0] != b"P6":
+        raise ValueError(f"지원하지 않는 PPM 형식: {tokens[0]!r}")
+    width, height, maxval = int(tokens[1]), int(tokens[2]), int(tokens[3])
+    dtype = np.uint8 if maxval < 256 else np.dtype(">u2")
+    pixels = np.frombuffer(data, dtype=dtype, count=width * height * 3, offset=pos + 1)
+    return maxval, pixels.reshape(height, width, 3)
+
+
+def _assemble_ppm(left: Path, right: Path, output: Path):
+    """PPM 조립 (비트 단위로 동일 - 무손실)"""
+    left_max, left_img = _read_ppm(left)
+    right_max, right_img = _read_ppm(right)
+    if left_max != right_max or left_img.shape[0] != right_img.shape[0]:
+        raise ValueError(f"L/R 형식 불일치: {left_img.shape}/{left_max} vs {right_img.shape}/{right_max}")
+    # concatenate 결과는 네이티브 바이트 순서가 되므로 PPM 순서(big-endian)로 되돌림
+    sbs = np.concatenate([left_img, right_img], axis=1).astype(left_img.dtype, copy=False)
+    height, width = sbs.shape[:2]
+
+    temp = _temp_path(output)
+    with open(temp, "wb") as f:
+        f.write(f"P6\n{width} {height}\n{left_max}\n".encode("ascii"))
+        f.write(sbs.tobytes())
+    os.replace(temp, output)
+
+
+def _assemble_exr(left: Path, right: Path, output: Path):
+    """EXR 조립 (half 채널을 그대로 이어 붙이고 L 헤더의 압축/색공간 속성 유지)"""
+    with OpenEXR.File(str(left), separate_channels=True) as left_exr, \
+            OpenEXR.File(str(right), separate_channels=True) as right_exr:
+        left_channels = left_exr.channels()
+        right_channels = right_exr.channels()
+        if sorted(left_channels) != sorted(right_channels):
+            raise ValueError(f"L/R 채널 불일치: {sorted(left_channels)} vs {sorted(right_channels)}")
+        channels = {}
+        for name, channel in left_channels.items():
+            left_pixels, right_pixels = channel.pixels, right_channels[name].pixels
+            if left_pixels.shape[0] != right_pixels.shape[0]:
+                raise ValueError(f"L/R 높이 불일치: {left_pixels.shape} vs {right_pixels.shape}")
+            channels[name] = np.concatenate([left_pixels, right_pixels], axis=1)
+        # 윈도우/채널 목록은 픽셀 크기로 다시 계산됨
+        header = {k: v for k, v in left_exr.header().items()
+                  if k not in ("channels", "dataWindow", "displayWindow")}
+
+    temp = _temp_path(output)
+    with OpenEXR.File(header, channels) as sbs_exr:
+        sbs_exr.write(str(temp))
+    os.replace(temp, output)
+
+
+def assemble_frame(left_path: str, right_path: str, output_path: str) -> Dict[str, Any]:
+    """SBS 프레임 하나 조립 (프로세스 풀에서 실행)
+
+    Returns:
+        {"ok": bool, "error": str}
+    """
+    left, right, output = Path(left_path), Path(right_path), Path(output_path)
+    try:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        if output.suffix.lower() == ".exr":
+            _assemble_exr(left, right, output)
+        else:
+            _assemble_ppm(left, right, output)
+        return {"ok": True, "error": ""}
+    except Exception as e:
+        try:
+            _temp_path(output).unlink(missing_ok=True)
+        except OSError:
+            pass
+        return {"ok": False, "error": str(e)[:200]}
+
+
+class SBSAssemblyPool:
+    """SBS 조립 프로세스 풀 (워커 스레드에서 비동기 제출)"""
+
+    def __init__(self, max_workers: int = SBS_ASSEMBLY_WORKERS):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def submit(self, left_path: Path, right_path: Path, output_path: Path) -> Future:
+        """프레임 조립 제출 (풀은 처음 제출 시 생성)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor.submit(assemble_frame, str(left_path), str(right_path), str(output_path))
+
+    def shutdown(self):
+        """풀 종료 (대기 중인 조립은 취소)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
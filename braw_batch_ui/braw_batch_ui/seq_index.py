@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 출력 폴더 시퀀스 인덱스
+폴더당 os.scandir 한 번으로 프레임 → (크기, mtime, 상태) 인덱스를 만들고,
+범위를 쓴 워커가 증분 기록하여 프레임별 exists()/stat() 네트워크 호출을 대체
+
+저장 구조 (출력 폴더 내부):
+    .seqindex/index.json      # 스냅샷 (scandir 재구성 결과 + 반영된 로그 오프셋)
+    .seqindex/{hostname}.log  # 호스트별 증분 기록 (append 전용, 탭 구분 한 줄 = 한 프레임)
+"""
+
+import json
+import os
+import re
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+INDEX_DIR_NAME = ".seqindex"
+INDEX_FILE_NAME = "index.json"
+INDEX_VERSION = 1
+
+STATUS_OK = "ok"
+STATUS_BAD = "bad"
+STATUS_GONE = "gone"  # 로그 전용: 삭제 기록
+
+# {prefix}_{frame}.{ext} - prefix에 _L/_R 접미사 포함 가능
+FRAME_FILE_PATTERN = re.compile(r"^(?P<prefix>.+)_(?P<frame>\d+)\.(?P<ext>exr|ppm)$", re.IGNORECASE)
+
+# (size, mtime_ms, status)
+Entry = Tuple[int, int, str]
+
+
+def split_frame_name(name: str) -> Optional[Tuple[str, int]]:
+    """파일명 → (시퀀스 키, 프레임 번호). 시퀀스 파일이 아니면 None"""
+    match = FRAME_FILE_PATTERN.match(name)
+    if not match:
+        return None
+    seq = f"{match.group('prefix')}.{match.group('ext').lower()}"
+    return seq, int(match.group("frame"))
+
+
+class SequenceIndex:
+    """출력 폴더 하나의 시퀀스 인덱스 (스레드 안전)"""
+
+    def __init__(self, folder: Path, ttl_sec: float = 5.0):
+        self.folder = Path(folder)
+        self.ttl_sec = ttl_sec
+        self.index_dir = self.folder / INDEX_DIR_NAME
+        self.index_file = self.index_dir / INDEX_FILE_NAME
+        self.log_file = self.index_dir / f"{socket.gethostname()}.log"
+
+        self._lock = threading.RLock()
+        self._sequences: Dict[str, Dict[int, Entry]] = {}
+        self._log_pos: Dict[str, int] = {}  # 로그별 반영 완료 오프셋
+        self._snapshot_mtime_ns = None
+        self._loaded_at = 0.0
+
+        # 통계
+        self.scandir_passes = 0
+        self.stat_calls = 0
+        self.lookups = 0
+
+    # ===== 조회 =====
+
+    def lookup(self, name: str) -> Optional[Entry]:
+        """파일명으로 (크기, mtime, 상태) 조회 - 없으면 None"""
+        key = split_frame_name(name)
+        if key is None:
+            return None
+        self.refresh()
+        with self._lock:
+            self.lookups += 1
+            return self._sequences.get(key[0], {}).get(key[1])
+
+    def exists(self, name: str) -> bool:
+        """파일 존재 여부 (손상 표시된 파일은 없는 것으로 취급)"""
+        entry = self.lookup(name)
+        return entry is not None and entry[2] == STATUS_OK
+
+    def size(self, name: str) -> Optional[int]:
+        """파일 크기 - 없으면 None"""
+        entry = self.lookup(name)
+        return entry[0] if entry is not None else None
+
+    def frames(self, seq: str) -> Dict[int, Entry]:
+        """시퀀스의 전체 프레임 맵 (복사본)"""
+        self.refresh()
+        with self._lock:
+            return dict(self._sequences.get(seq, {}))
+
+    # ===== 갱신 =====
+
+    def refresh(self, force: bool = False):
+        """TTL이 지났으면 스냅샷 + 다른 호스트의 증분 로그 반영"""
+        with self._lock:
+            if not force and self._loaded_at and time.time() - self._loaded_at < self.ttl_sec:
+                return
+            try:
+                mtime_ns = self.index_file.stat().st_mtime_ns
+            except (OSError, IOError):
+                mtime_ns = None
+
+            if mtime_ns is None:
+                # 인덱스가 아직 없음 - scandir로 생성
+                self.rebuild()
+                return
+            if mtime_ns != self._snapshot_mtime_ns:
+                self._load_snapshot(mtime_ns)
+            self._tail_logs()
+            self._loaded_at = time.time()
+
+    def rebuild(self) -> int:
+        """출력 폴더를 os.scandir 한 번으로 다시 읽어 스냅샷 저장
+
+        Returns:
+            인덱스된 프레임 파일 수
+        """
+        with self._lock:
+            # 스캔 전 로그 길이 기록 - 이후에 추가된 줄은 다음 refresh에서 재반영 (중복 무해)
+            offsets = self._log_sizes()
+            previous = self._sequences
+            sequences: Dict[str, Dict[int, Entry]] = {}
+            count = 0
+            scanned = False
+
+            try:
+                with os.scandir(self.folder) as it:
+                    for entry in it:
+                        key = split_frame_name(entry.name)
+                        if key is None or not entry.is_file():
+                            continue
+                        st = entry.stat()  # Windows에서는 디렉토리 목록에 포함되어 추가 호출 없음
+                        size, mtime = st.st_size, int(st.st_mtime * 1000)
+                        old = previous.get(key[0], {}).get(key[1])
+                        # 크기/시간이 같으면 이전 상태(손상 표시 등) 유지
+                        status = old[2] if old and old[0] == size and old[1] == mtime else STATUS_OK
+                        sequences.setdefault(key[0], {})[key[1]] = (size, mtime, status)
+                        count += 1
+                scanned = True
+            except (OSError, IOError):
+                pass  # 폴더 없음 - 빈 인덱스 (폴더를 만들지 않도록 저장 생략)
+            self.scandir_passes += 1
+
+            self._sequences = sequences
+            self._log_pos = dict(offsets)
+            if scanned:
+                self._save_snapshot(offsets)
+            self._loaded_at = time.time()
+            return count
+
+    def probe(self, names: Iterable[str]) -> Dict[str, Optional[Entry]]:
+        """이 워커가 방금 쓴 파일을 stat하여 인덱스와 증분 로그에 기록
+
+        범위 렌더를 끝낸(또는 진행 중인) 워커만 호출 - 유일하게 개별 stat이 발생하는 경로
+        """
+        result = {}
+        records = []
+        for name in names:
+            key = split_frame_name(name)
+            if key is None:
+                continue
+            self.stat_calls += 1
+            try:
+                st = os.stat(self.folder / name)
+            except (OSError, IOError):
+                result[name] = None
+                continue
+            entry = (st.st_size, int(st.st_mtime * 1000), STATUS_OK)
+            result[name] = entry
+            records.append((key[0], key[1], entry))
+
+        if records:
+            self._apply_and_log(records)
+        return result
+
+    def mark(self, name: str, status: str):
+        """상태 변경 기록 (손상 표시 STATUS_BAD, 삭제 STATUS_GONE)"""
+        key = split_frame_name(name)
+        if key is None:
+            return
+        with self._lock:
+            old = self._sequences.get(key[0], {}).get(key[1])
+        size, mtime = (old[0], old[1]) if old else (0, 0)
+        self._apply_and_log([(key[0], key[1], (size, mtime, status))])
+
+    # ===== 내부 =====
+
+    def _apply(self, seq: str, frame: int, entry: Entry):
+        """메모리 인덱스에 한 항목 반영"""
+        frames = self._sequences.setdefault(seq, {})
+        if entry[2] == STATUS_GONE:
+            frames.pop(frame, None)
+        else:
+            frames[frame] = entry
+
+    def _apply_and_log(self, records: List[Tuple[str, int, Entry]]):
+        """메모리 반영 + 내 로그에 한 번의 append로 기록"""
+        data = "".join(
+            f"{seq}\t{frame}\t{e[0]}\t{e[1]}\t{e[2]}\n" for seq, frame, e in records
+        ).encode("utf-8")
+        with self._lock:
+            for seq, frame, entry in records:
+                self._apply(seq, frame, entry)
+            try:
+                self.index_dir.mkdir(parents=True, exist_ok=True)
+                # 바이너리 append (줄바꿈 변환 없이 한 번의 write)
+                with open(self.log_file, "ab") as f:
+                    f.write(data)
+                    end = f.tell()
+                # 내 기록은 이미 메모리에 반영됨 - 다음 tail에서 건너뜀
+                if self._log_pos.get(self.log_file.name, 0) == end - len(data):
+                    self._log_pos[self.log_file.name] = end
+            except (OSError, IOError):
+                pass  # 로그 실패 시 다음 rebuild가 보정
+
+    def _log_sizes(self) -> Dict[str, int]:
+        """증분 로그 파일 목록과 크기 (.seqindex 폴더만 나열 - 작음)"""
+        sizes = {}
+        try:
+            with os.scandir(self.index_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".log"):
+                        sizes[entry.name] = entry.stat().st_size
+        except (OSError, IOError):
+            pass
+        return sizes
+
+    def _tail_logs(self):
+        """저장된 오프셋 이후의 로그 줄만 읽어 반영"""
+        for name, size in self._log_sizes().items():
+            pos = self._log_pos.get(name, 0)
+            if size <= pos:
+                continue
+            try:
+                with open(self.index_dir / name, "rb") as f:
+                    f.seek(pos)
+                    data = f.read(size - pos)
+            except (OSError, IOError):
+                continue
+            # 마지막 줄이 쓰는 중일 수 있으므로 완전한 줄까지만 반영
+            complete = data.rfind(b"\n") + 1
+            for line in data[:complete].decode("utf-8", errors="replace").splitlines():
+                parts = line.split("\t")
+                if len(parts) != 5:
+                    continue
+                try:
+                    self._apply(parts[0], int(parts[1]), (int(parts[2]), int(parts[3]), parts[4]))
+                except ValueError:
+                    continue
+            self._log_pos[name] = pos + complete
+
+    def _load_snapshot(self, mtime_ns: int):
+        """index.json 로드 (프레임/크기/시간 병렬 배열 형식)"""
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, IOError, json.JSONDecodeError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+
+        sequences = {}
+        for seq, block in data.get("sequences", {}).items():
+            statuses = block.get("status", {})
+            sequences[seq] = {
+                frame: (size, mtime, statuses.get(str(frame), STATUS_OK))
+                for frame, size, mtime in zip(block["frames"], block["sizes"], block["mtimes"])
+            }
+        self._sequences = sequences
+        self._log_pos = dict(data.get("log_offsets", {}))
+        self._snapshot_mtime_ns = mtime_ns
+
+    def _save_snapshot(self, offsets: Dict[str, int]):
+        """스냅샷을 임시 파일에 쓰고 원자적 교체"""
+        sequences = {}
+        for seq, frames in self._sequences.items():
+            ordered = sorted(frames.items())
+            sequences[seq] = {
+                "frames": [frame for frame, _ in ordered],
+                "sizes": [e[0] for _, e in ordered],
+                "mtimes": [e[1] for _, e in ordered],
+                "status": {str(frame): e[2] for frame, e in ordered if e[2] != STATUS_OK},
+            }
+        data = {
+            "version": INDEX_VERSION,
+            "built_at": time.time(),
+            "log_offsets": offsets,
+            "sequences": sequences,
+        }
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = self.index_dir / f"{INDEX_FILE_NAME}.{socket.gethostname()}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            temp_file.replace(self.index_file)
+            self._snapshot_mtime_ns = self.index_file.stat().st_mtime_ns
+        except (OSError, IOError):
+            pass  # 읽기 전용 공유 등 - 메모리 인덱스만 사용
+
+
+# ===== 프로세스 전역 레지스트리 =====
+
+_indexes: Dict[str, SequenceIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_sequence_index(folder: Path, ttl_sec: float = 5.0) -> SequenceIndex:
+    """폴더별 SequenceIndex 싱글톤"""
+    key = os.path.normcase(os.path.abspath(str(folder)))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SequenceIndex(Path(folder), ttl_sec)
+            _indexes[key] = index
+        return index
+
+
+def get_index_stats() -> Dict[str, int]:
+    """전체 인덱스 통계 (scandir 횟수, 개별 stat 횟수, 인덱스 조회 횟수)"""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    return {
+        "folders": len(indexes),
+        "scandir_passes": sum(i.scandir_passes for i in indexes),
+        "stat_calls": sum(i.stat_calls for i in indexes),
+        "lookups": sum(i.lookups for i in indexes),
+    }
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 출력 파일 크기 이상치 탐지
+눈(eye)/폴더별 그룹 + 이동 중앙값/MAD 기반 (장면 전환에 강함)
+"""
+
+import statistics
+from typing import Dict, Hashable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:  # PyInstaller 빌드(V1 exe)는 numpy 제외
+    np = None
+
+# MAD → 표준편차 환산 계수 (정규분포 기준)
+MAD_SCALE = 1.4826
+
+
+def _odd_window(window: int, count: int) -> int:
+    """윈도우 크기를 데이터 길이 이하의 홀수로 보정"""
+    window = max(1, min(window, count))
+    return window if window % 2 == 1 else window - 1
+
+
+def _detect_numpy(sizes: Sequence[int], window: int, ratio: float,
+                  mad_threshold: float) -> Tuple[List[bool], List[float]]:
+    """NumPy 벡터 연산 버전"""
+    arr = np.asarray(sizes, dtype=np.float64)
+    half = window // 2
+    padded = np.pad(arr, half, mode="edge")
+    # 홀수 윈도우이므로 partition 한 번으로 정확한 중앙값 (np.median보다 수 배 빠름)
+    reference = np.partition(sliding_window_view(padded, window), half, axis=1)[:, half]
+
+    residual = arr - reference
+    mad = np.median(np.abs(residual - np.median(residual)))
+    flags = (arr < reference * ratio) & (-residual > mad_threshold * MAD_SCALE * mad)
+    return flags, reference
+
+
+def _detect_python(sizes: Sequence[int], window: int, ratio: float,
+                   mad_threshold: float) -> Tuple[List[bool], List[float]]:
+    """순수 파이썬 버전 (numpy 미설치 시)"""
+    count = len(sizes)
+    half = window // 2
+    padded = [sizes[0]] * half + list(sizes) + [sizes[-1]] * half
+    reference = [statistics.median(padded[i:i + window]) for i in range(count)]
+
+    residual = [s - r for s, r in zip(sizes, reference)]
+    center = statistics.median(residual)
+    mad = statistics.median(abs(r - center) for r in residual)
+    limit = mad_threshold * MAD_SCALE * mad
+    flags = [s < r * ratio and -d > limit for s, r, d in zip(sizes, reference, residual)]
+    return flags, reference
+
+
+def detect_small_outliers(sizes: Sequence[int], window: int, ratio: float,
+                          mad_threshold: float) -> Tuple[List[bool], List[float]]:
+    """프레임 순서로 정렬된 크기 배열에서 비정상적으로 작은 파일 탐지
+
+    기준 크기는 이동 중앙값(window 프레임)이라 장면 전환으로 크기가 바뀌어도
+    오탐하지 않고, 소수의 거대 파일에도 흔들리지 않는다.
+    기준의 ratio 미만이면서 잔차가 MAD의 mad_threshold배를 넘을 때만 손상으로 판정
+    (크기가 모두 같은 PPM은 MAD=0이므로 ratio 조건만 적용됨).
+
+    Returns:
+        (손상 여부 리스트, 프레임별 기준 크기 리스트)
+    """
+    if len(sizes) == 0:
+        return [], []
+
+    window = _odd_window(window, len(sizes))
+    if np is not None:
+        return _detect_numpy(sizes, window, ratio, mad_threshold)
+    return _detect_python(sizes, window, ratio, mad_threshold)
+
+
+def detect_grouped_outliers(groups: Dict[Hashable, List[Tuple[int, int]]], window: int,
+                            ratio: float, mad_threshold: float) -> Dict[Hashable, List[Tuple[int, int, float]]]:
+    """그룹별(eye, 폴더) 이상치 탐지
+
+    Args:
+        groups: {그룹 키: [(frame_idx, size), ...]}
+
+    Returns:
+        {그룹 키: [(frame_idx, size, 기준 크기), ...]} - 손상 판정된 프레임만
+    """
+    result = {}
+    for key, entries in groups.items():
+        if not entries:
+            continue
+        if np is not None:
+            table = np.array(entries, dtype=np.int64)
+            table = table[np.argsort(table[:, 0], kind="stable")]
+            flags, reference = detect_small_outliers(table[:, 1], window, ratio, mad_threshold)
+            bad_idx = np.flatnonzero(flags)
+            bad = [(int(table[i, 0]), int(table[i, 1]), float(reference[i])) for i in bad_idx]
+        else:
+            entries = sorted(entries)
+            sizes = [size for _, size in entries]
+            flags, reference = detect_small_outliers(sizes, window, ratio, mad_threshold)
+            bad = [(frame, size, ref) for (frame, size), flag, ref in zip(entries, flags, reference) if flag]
+        if bad:
+            result[key] = bad
+    return result
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - V2 팜 현황 스냅샷 발행
+리스로 선출된 프로세스 하나만 farm.db에서 전체 현황(작업, eye별 진행률, 워커, 풀 통계)을 집계해
+DB 옆 farm_status.json.gz에 원자적으로 쓰고, 나머지 UI는 이 파일만 읽는다 (farm.db는 워커 클레임 전용)
+
+- 발행자: 변경(data_version, farm_state 카운터)이 있을 때만, 최대 interval_sec마다 다시 집계해 쓰기
+         변경이 없어도 max_age_sec마다 다시 써서 워커 오프라인 판정/파일 신선도 유지
+- 구독자: 파일 (mtime, size)가 바뀌었을 때만 읽음, 필터/정렬/페이지는 메모리에서 (query_jobs와 같은 의미)
+- 발행자가 없거나 파일이 stale_sec보다 오래되면 available=False - 호출자가 DB 직접 조회로 대체
+
+단독 실행 (코디네이터 머신에서 상시 발행):
+    python -m braw_batch_ui.status_publisher --db P:/.../farm.db
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import socket
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import (
+    STATUS_PUBLISH_INTERVAL_SEC,
+    STATUS_PUBLISHER_LEASE_TTL_SEC,
+    STATUS_SNAPSHOT_STALE_SEC,
+    UI_STATUS_FULL_REFRESH_SEC,
+)
+from .farm_db import FarmDatabase, JobPage, Worker, get_default_db_path
+from .lease import FileLease
+
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_FILE_NAME = "farm_status.json.gz"
+PUBLISHER_LEASE_NAME = "status_publisher.lease"
+
+FRAME_STATUSES = ("pending", "claimed", "completed", "failed")
+
+
+def snapshot_path_for(db_path: str) -> Path:
+    """DB 파일 옆 스냅샷 경로"""
+    return Path(db_path).with_name(SNAPSHOT_FILE_NAME)
+
+
+def build_status(db: FarmDatabase, versions: Dict[str, int] = None) -> Dict[str, Any]:
+    """farm.db 전체 현황 집계 (작업 목록 1회 + 프레임 GROUP BY 1회 + 워커 1회)"""
+    records = db.get_job_records()
+    eye_progress = db.get_all_eye_progress()
+    workers = db.get_active_workers()
+
+    columns = list(records[0].keys()) if records else []
+    pools: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for record in records:
+        stats = pools.setdefault(record["pool_id"], {"jobs": {}, "frames": {}, "workers": {}})
+        stats["jobs"][record["status"]] = stats["jobs"].get(record["status"], 0) + 1
+        for counts in eye_progress.get(record["job_id"], {}).values():
+            for st in FRAME_STATUSES:
+                if counts.get(st):
+                    stats["frames"][st] = stats["frames"].get(st, 0) + counts[st]
+    for worker in workers:
+        stats = pools.setdefault(worker.pool_id, {"jobs": {}, "frames": {}, "workers": {}})
+        stats["workers"]["total"] = stats["workers"].get("total", 0) + 1
+        stats["workers"][worker.status] = stats["workers"].get(worker.status, 0) + 1
+
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "published_at": time.time(),
+        "versions": versions or {},
+        "job_columns": columns,
+        "jobs": [[record[c] for c in columns] for record in records],
+        # 작업 ID -> eye -> [pending, claimed, completed, failed]
+        "progress": {
+            job_id: {eye: [counts.get(st, 0) for st in FRAME_STATUSES] for eye, counts in eyes.items()}
+            for job_id, eyes in eye_progress.items()
+        },
+        "workers": [dict(asdict(w), last_heartbeat=w.last_heartbeat.isoformat()) for w in workers],
+        "pools": pools,
+    }
+
+
+def write_snapshot(path: Path, status: Dict[str, Any]):
+    """임시 파일에 다 쓴 뒤 rename (읽는 쪽은 항상 완전한 파일만 봄)"""
+    data = gzip.compress(json.dumps(status, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 5)
+    temp = path.with_name(f".{path.name}.{socket.gethostname()}.{os.getpid()}.tmp")
+    with open(temp, "wb") as f:
+        f.write(data)
+    os.replace(temp, path)
+
+
+def read_snapshot(path: Path) -> Optional[Dict[str, Any]]:
+    """스냅샷 읽기 (없거나 손상/형식 불일치 시 None)"""
+    try:
+        status = json.loads(gzip.decompress(path.read_bytes()))
+    except (OSError, ValueError, EOFError):
+        return None
+    return status if status.get("format") == SNAPSHOT_FORMAT else None
+
+
+def status_workers(status: Dict[str, Any]) -> List[Worker]:
+    """스냅샷의 워커 목록"""
+    return [Worker(**dict(w, last_heartbeat=datetime.fromisoformat(w["last_heartbeat"])))
+            for w in status["workers"]]
+
+
+def page_from_status(status: Dict[str, Any], statuses: List[str] = None, pool_id: str = None,
+                     search: str = "", sort_by: str = "created_at", descending: bool = True,
+                     limit: int = 200, offset: int = 0) -> JobPage:
+    """스냅샷에서 작업 한 페이지 (FarmDatabase.query_jobs와 같은 필터/정렬 의미)"""
+    columns = status["job_columns"]
+    col = {name: i for i, name in enumerate(columns)}
+    records = status["jobs"]
+    if not records:
+        return JobPage([], {}, 0, {}, offset, limit)  # 작업이 없으면 열 목록도 비어 있음
+    if pool_id:
+        records = [r for r in records if r[col["pool_id"]] == pool_id]
+    if search:
+        pattern = re.compile(".*".join(re.escape(part) for part in search.split("*")), re.IGNORECASE)
+        records = [r for r in records if pattern.match(r[col["clip_name"]] or "")]
+
+    status_counts: Dict[str, int] = {}
+    for r in records:
+        status_counts[r[col["status"]]] = status_counts.get(r[col["status"]], 0) + 1
+    if statuses is not None:
+        wanted = set(statuses)
+        records = [r for r in records if r[col["status"]] in wanted]
+
+    i = col.get(sort_by, col["created_at"])
+    if sort_by == "clip_name":
+        key = lambda r: ((r[i] or "").lower(), r[col["job_id"]])
+    else:
+        key = lambda r: (r[i], r[col["job_id"]])
+    records = sorted(records, key=key, reverse=descending)
+
+    jobs = [FarmDatabase.row_to_job(dict(zip(columns, r))) for r in records[offset:offset + limit]]
+    eye_progress = {
+        job.job_id: {
+            eye: dict(zip(FRAME_STATUSES, counts), total=sum(counts))
+            for eye, counts in status["progress"].get(job.job_id, {}).items()
+        }
+        for job in jobs
+    }
+    return JobPage(FarmDatabase.jobs_with_status(jobs, eye_progress), eye_progress,
+                   len(records), status_counts, offset, limit)
+
+
+class StatusPublisher:
+    """스냅샷 발행/구독 (발행 리스를 얻으면 발행자, 아니면 구독자)
+
+    poll()은 발행 리스를 얻은 프로세스의 DB 연결을 쓰므로 항상 같은 스레드에서 호출
+    """
+
+    def __init__(self, db: FarmDatabase, path: Path = None, holder_id: str = None,
+                 interval_sec: float = STATUS_PUBLISH_INTERVAL_SEC,
+                 max_age_sec: float = UI_STATUS_FULL_REFRESH_SEC,
+                 stale_sec: float = STATUS_SNAPSHOT_STALE_SEC,
+                 lease_ttl_sec: float = STATUS_PUBLISHER_LEASE_TTL_SEC):
+        self.db = db
+        self.path = Path(path) if path else snapshot_path_for(str(db.db_path))
+        self.holder_id = holder_id or f"{socket.gethostname()}_{os.getpid()}"
+        self.interval_sec = interval_sec
+        self.max_age_sec = max_age_sec
+        self.stale_sec = stale_sec
+        self.lease = FileLease(self.path.with_name(PUBLISHER_LEASE_NAME), self.holder_id, lease_ttl_sec)
+
+        self.status: Optional[Dict[str, Any]] = None  # 마지막으로 발행/읽은 스냅샷
+        self._file_key = None  # 구독자: 마지막으로 읽은 파일 (mtime_ns, size)
+        self._data_version = None
+        self._versions: Dict[str, int] = {}
+        self._published_at = 0.0
+
+        # 통계
+        self.published = 0
+        self.reads = 0
+
+    @property
+    def is_publisher(self) -> bool:
+        return self.lease.held
+
+    def poll(self, force: bool = False) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """새 스냅샷 확인
+
+        Returns:
+            (바뀐 스냅샷 또는 None, 스냅샷 사용 가능 여부) - False면 호출자가 DB를 직접 조회
+        """
+        if self.lease.acquire():
+            return self._publish(force), True
+        return self._read(), self._is_fresh()
+
+    def _publish(self, force: bool) -> Optional[Dict[str, Any]]:
+        """변경이 있으면 집계해서 쓰기 (쓴 스냅샷 반환)"""
+        now = time.time()
+        expired = now - self._published_at >= self.max_age_sec
+        if not force and not expired:
+            if now - self._published_at < self.interval_sec:
+                return None
+            data_version = self.db.get_data_version()
+            if self.status is not None and data_version == self._data_version:
+                return None
+            versions = self.db.get_state_versions()
+            self._data_version = data_version
+            if self.status is not None and versions == self._versions:
+                return None  # 표시와 무관한 테이블만 바뀜
+        else:
+            self._data_version = self.db.get_data_version()
+            versions = self.db.get_state_versions()
+
+        self._versions = versions
+        self.status = build_status(self.db, versions)
+        write_snapshot(self.path, self.status)
+        self._published_at = now
+        self.published += 1
+        return self.status
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """파일이 바뀌었으면 읽기 (바뀐 스냅샷 반환)"""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self._file_key:
+            return None
+        status = read_snapshot(self.path)
+        if status is None:
+            return None
+        self._file_key = key
+        self.status = status
+        self.reads += 1
+        return status
+
+    def _is_fresh(self) -> bool:
+        return self.status is not None and time.time() - self.status["published_at"] < self.stale_sec
+
+    def close(self):
+        """발행 리스 반납 (다음 프로세스가 바로 넘겨받도록)"""
+        self.lease.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="팜 현황 스냅샷 발행 (코디네이터용)")
+    parser.add_argument("--db", default=get_default_db_path(), help="farm.db 경로")
+    parser.add_argument("--interval", type=float, default=STATUS_PUBLISH_INTERVAL_SEC, help="변경 확인/발행 간격 (초)")
+    args = parser.parse_args()
+
+    db = FarmDatabase(args.db)
+    publisher = StatusPublisher(db, interval_sec=args.interval)
+    print(f"스냅샷: {publisher.path} (발행자 ID: {publisher.holder_id})")
+    try:
+        while True:
+            started = time.perf_counter()
+            status, _ = publisher.poll()
+            if status is not None:
+                print(f"[{datetime.now():%H:%M:%S}] 발행: 작업 {len(status['jobs']):,}개, "
+                      f"워커 {len(status['workers'])}대 ({time.perf_counter() - started:.2f}초)")
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.close()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - V2 상태 조회 서비스
+작업/워커 현황 DB 조회를 UI 스레드 밖(QThread)에서 실행하고 결과를 읽기 전용 스냅샷으로 시그널 발행
+(네트워크 SQLite 락 대기 중에도 UI는 멈추지 않음)
+
+- DB 연결은 FarmDatabase의 스레드별 연결이라 이 스레드 전용 연결을 사용
+- request_refresh()는 어느 스레드에서나 호출 가능, 조회 중 들어온 요청은 하나로 합쳐 조회가 끝난 뒤 한 번만 다시 조회
+- UI가 이전 스냅샷을 아직 반영하지 않았으면(acknowledge 전) 주기 조회는 건너뜀
+- 작업 목록은 set_query()로 정한 필터/정렬/페이지만 조회 (전체 작업 수와 상태별 개수는 집계 쿼리로)
+- 주기 조회는 먼저 PRAGMA data_version만 확인하고, 바뀌었을 때만 farm_state 카운터를 읽어
+  작업/워커 중 바뀐 쪽만 다시 조회 (아무 변화가 없으면 DB 부하는 거의 없음)
+- 경과 시간/워커 오프라인 판정처럼 시간에 따라 바뀌는 표시는 full_refresh_sec마다 강제 조회로 갱신
+- publisher를 주면 farm.db 대신 발행된 현황 스냅샷을 읽음 (발행 리스를 얻은 UI 하나만 DB 집계,
+  스냅샷이 없거나 오래됐으면 위의 DB 직접 조회로 대체)
+- watch_job()으로 고른 작업 하나는 프레임 상태 구간(히트맵)도 함께 조회 - 그 작업의 eye별 진행 수가
+  바뀌었을 때만 DB에서 다시 조회 (발행 스냅샷을 쓰는 중에도 이 작업 하나만은 DB 조회)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from PySide6.QtCore import QThread, Signal
+
+from .farm_db import FarmDatabase, FrameRuns, Job, JobPage, Worker
+from .status_publisher import StatusPublisher, page_from_status, status_workers
+
+
+class JobEntry(NamedTuple):
+    """작업 한 개의 현황"""
+    job: Job
+    status: str
+    completed: int
+    total: int
+    eye_progress: Mapping[str, Mapping[str, int]]
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """한 번의 조회 결과 (발행 후 서비스는 수정하지 않음)"""
+    jobs: Tuple[JobEntry, ...]  # 현재 페이지의 작업
+    workers: Tuple[Worker, ...]
+    taken_at: datetime
+    elapsed_sec: float  # 조회 소요 시간
+    job_total: int  # 필터에 맞는 전체 작업 수
+    status_counts: Mapping[str, int]  # 상태 필터를 뺀 기준 상태별 작업 수
+    offset: int
+    limit: int
+    jobs_changed: bool = True  # False면 jobs는 이전 스냅샷과 같은 객체
+    workers_changed: bool = True
+    frames: Optional[FrameRuns] = None  # watch_job으로 고른 작업의 프레임 상태 구간
+    frames_changed: bool = False
+
+
+class StatusService(QThread):
+    """작업/워커 현황 백그라운드 조회 스레드"""
+
+    snapshot_ready = Signal(object)  # StatusSnapshot
+    error_signal = Signal(str)
+
+    def __init__(self, db: FarmDatabase, interval_sec: float = 1.0, page_size: int = 200,
+                 full_refresh_sec: float = 30.0, publisher: Optional[StatusPublisher] = None, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.publisher = publisher
+        self.interval_sec = interval_sec
+        self.full_refresh_sec = full_refresh_sec
+
+        # 변경 감지 상태 (서비스 스레드 전용)
+        self._data_version = None
+        self._versions: Dict[str, int] = {}
+        self._last: Optional[StatusSnapshot] = None
+        self._last_full = 0.0
+        self._frames: Optional[FrameRuns] = None
+        self._frames_version = None  # _frames를 확인했을 때의 jobs 변경 카운터 (팜 전체 프레임 상태가 바뀔 때마다 증가)
+        self._frames_fingerprint = None  # _frames를 조회했을 때의 감시 작업 프레임 지문
+        self._watch_job: Optional[str] = None
+
+        self._query_lock = threading.Lock()
+        self._query: Dict[str, Any] = {"sort_by": "created_at", "descending": True, "limit": page_size, "offset": 0}
+
+        self._wake = threading.Event()
+        self._stop = False
+        self._requested = False  # 명시적 요청 (UI 반영 대기와 무관하게 조회)
+        self._data_requested = False  # 데이터 변경 후 요청 (조회 조건만 바뀐 경우는 False)
+        self._delivered = True  # 마지막 스냅샷을 UI가 반영했는지
+
+        # 통계
+        self.polls = 0
+        self.skipped = 0
+        self.coalesced = 0
+        self.unchanged = 0  # 변경 확인만 하고 끝난 주기
+
+    def request_refresh(self, data_changed: bool = True):
+        """즉시 조회 요청 (조회 중이면 끝난 뒤 한 번만 다시 조회)"""
+        if self._requested:
+            self.coalesced += 1
+        if data_changed:
+            self._data_requested = True
+        self._requested = True
+        self._wake.set()
+
+    def set_query(self, **changes):
+        """작업 목록 조회 조건 변경 후 즉시 조회 (FarmDatabase.query_jobs 인자)"""
+        with self._query_lock:
+            self._query.update(changes)
+        self.request_refresh(data_changed=False)
+
+    def watch_job(self, job_id: Optional[str]):
+        """프레임 히트맵을 함께 조회할 작업 (None이면 중지) 변경 후 즉시 조회"""
+        if job_id == self._watch_job:
+            return
+        self._watch_job = job_id
+        self.request_refresh(data_changed=False)
+
+    def query(self) -> Dict[str, Any]:
+        """현재 조회 조건 (복사본)"""
+        with self._query_lock:
+            return dict(self._query)
+
+    def acknowledge(self):
+        """UI가 스냅샷 반영을 끝냈음을 알림"""
+        self._delivered = True
+
+    def stop(self):
+        """중지 요청 (현재 조회는 끝까지 진행)"""
+        self._stop = True
+        self._wake.set()
+
+    def run(self):
+        try:
+            while not self._stop:
+                requested = self._wake.wait(self.interval_sec)
+                self._wake.clear()
+                if self._stop:
+                    break
+                if not requested and not self._delivered:
+                    self.skipped += 1  # UI가 이전 스냅샷을 아직 그리는 중
+                    continue
+                self._requested = False
+                periodic = time.monotonic() - self._last_full >= self.full_refresh_sec
+                force_data = self._data_requested or periodic
+                self._data_requested = False
+                snapshot = self.poll(requested or periodic, force_data)
+                if snapshot is not None:
+                    self._delivered = False
+                    self.snapshot_ready.emit(snapshot)
+        finally:
+            if self.publisher is not None:
+                self.publisher.close()
+            self.db.close()  # 이 스레드의 연결만 닫힘
+
+    @staticmethod
+    def _entries(page: JobPage) -> Tuple[JobEntry, ...]:
+        """JobPage -> 읽기 전용 작업 항목"""
+        return tuple(
+            JobEntry(job, status, completed, total, MappingProxyType({
+                eye: MappingProxyType(counts) for eye, counts in page.eye_progress[job.job_id].items()
+            }))
+            for job, status, completed, total in page.rows
+        )
+
+    def _job_frames(self, force: bool, version: Optional[int]) -> Tuple[Optional[FrameRuns], bool]:
+        """감시 작업의 프레임 구간 → (구간, 바뀜 여부)
+
+        jobs 변경 카운터는 팜 전체 프레임 변경마다 오르므로, 카운터가 바뀌면 감시 작업의 지문
+        (get_frame_fingerprint)을 먼저 비교해 이 작업이 바뀌었을 때만 구간을 다시 조회
+        """
+        job_id = self._watch_job
+        last = self._frames
+        if job_id is None:
+            self._frames = None
+            return None, last is not None
+        same_job = not force and last is not None and last.job_id == job_id
+        if same_job and version == self._frames_version:
+            return last, False
+        self._frames_version = version
+        fingerprint = self.db.get_frame_fingerprint(job_id)
+        if same_job and fingerprint == self._frames_fingerprint:
+            return last, False
+        self._frames = self.db.get_frame_runs(job_id)
+        self._frames_fingerprint = fingerprint
+        return self._frames, True
+
+    def _poll_published(self, force: bool, force_data: bool, started: float) -> Tuple[bool, Optional[StatusSnapshot]]:
+        """발행 스냅샷에서 조회 → (스냅샷 사용 가능 여부, 스냅샷 또는 None)"""
+        status, available = self.publisher.poll(force_data)
+        if not available:
+            return False, None
+        if status is None:
+            if not force:
+                self.unchanged += 1
+                return True, None
+            status = self.publisher.status  # 조회 조건만 바뀜 - 가진 스냅샷으로 다시 페이지 계산
+        page = page_from_status(status, **self.query())
+        frames, frames_changed = self._job_frames(force_data, status["versions"].get("jobs"))
+        self.polls += 1
+        self._last_full = time.monotonic()
+        self._last = StatusSnapshot(self._entries(page), tuple(status_workers(status)), datetime.now(),
+                                    time.perf_counter() - started, page.total,
+                                    MappingProxyType(page.status_counts), page.offset, page.limit,
+                                    frames=frames, frames_changed=frames_changed)
+        return True, self._last
+
+    def poll(self, force: bool = True, force_data: bool = None) -> Optional[StatusSnapshot]:
+        """변경 확인 후 바뀐 부분만 조회 (변화 없음/오류 시 None)
+
+        force: 변경이 없어도 스냅샷 생성, force_data: 발행자라면 DB를 다시 집계 (기본값 force)
+        """
+        started = time.perf_counter()
+        force_data = force if force_data is None else force_data
+        try:
+            if self.publisher is not None:
+                available, snapshot = self._poll_published(force, force_data, started)
+                if available:
+                    return snapshot
+            data_version = self.db.get_data_version()
+            if not force and self._last is not None and data_version == self._data_version:
+                self.unchanged += 1
+                return None
+            versions = self.db.get_state_versions()
+            jobs_changed = force or self._last is None or versions.get("jobs") != self._versions.get("jobs")
+            workers_changed = force or self._last is None or versions.get("workers") != self._versions.get("workers")
+            self._data_version = data_version
+            self._versions = versions
+            if not jobs_changed and not workers_changed:
+                self.unchanged += 1  # 감사/QC 기록 등 표시와 무관한 테이블만 바뀜
+                return None
+
+            last = self._last
+            if jobs_changed:
+                page = self.db.query_jobs(**self.query())
+                jobs = self._entries(page)
+                page_info = (page.total, MappingProxyType(page.status_counts), page.offset, page.limit)
+            else:
+                jobs = last.jobs
+                page_info = (last.job_total, last.status_counts, last.offset, last.limit)
+            workers = tuple(self.db.get_active_workers()) if workers_changed else last.workers
+            if jobs_changed or self._watch_job != (self._frames.job_id if self._frames else None):
+                frames, frames_changed = self._job_frames(force_data, versions.get("jobs"))
+            else:
+                frames, frames_changed = self._frames, False
+        except Exception as e:
+            self.error_signal.emit(f"⚠️ 상태 조회 오류: {e}")
+            return None
+        self.polls += 1
+        if force:
+            self._last_full = time.monotonic()
+        self._last = StatusSnapshot(jobs, workers, datetime.now(), time.perf_counter() - started,
+                                    *page_info, jobs_changed=jobs_changed, workers_changed=workers_changed,
+                                    frames=frames, frames_changed=frames_changed)
+        return self._last
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+BRAW Render Farm - 키 기반 테이블 모델
+행마다 고유 키(작업 ID, 워커 ID)를 두고, 새 목록이 오면 키로 비교해 추가/삭제/바뀐 셀만 알린다
+(매 갱신마다 모든 항목을 새로 만들지 않으므로 비용 = 바뀐 수, 선택/스크롤 위치 유지)
+
+셀 값은 (표시 문자열, 정렬 값) 튜플 - 정렬은 QSortFilterProxyModel이 SORT_ROLE로 처리
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+
+SORT_ROLE = Qt.UserRole
+KEY_ROLE = Qt.UserRole + 1
+
+Cell = Tuple[str, Any]
+Row = Tuple[Cell, ...]
+
+
+class KeyedTableModel(QAbstractTableModel):
+    """키 -> 행 테이블 모델 (set_rows로 차이만 반영)"""
+
+    def __init__(self, headers: Sequence[str], parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self._keys: List[Hashable] = []
+        self._rows: List[Row] = []
+        self._index: Dict[Hashable, int] = {}  # 키 -> 행 번호
+
+    # ===== Qt 모델 인터페이스 =====
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()][0]
+        if role == SORT_ROLE:
+            return self._rows[index.row()][index.column()][1]
+        if role == KEY_ROLE:
+            return self._keys[index.row()]
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    # ===== 갱신 =====
+
+    def key(self, row: int) -> Hashable:
+        """행 번호의 키"""
+        return self._keys[row]
+
+    def set_rows(self, rows: Dict[Hashable, Row]) -> Tuple[int, int, int]:
+        """새 전체 목록 반영 (키로 비교)
+
+        Returns:
+            (추가 행 수, 삭제 행 수, 바뀐 행 수)
+        """
+        # 1. 사라진 키 삭제 (뒤에서부터 연속 구간 단위)
+        removed = sorted((self._index[k] for k in self._index if k not in rows), reverse=True)
+        i = 0
+        while i < len(removed):
+            last = first = removed[i]
+            while i + 1 < len(removed) and removed[i + 1] == first - 1:
+                i += 1
+                first = removed[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._keys[first:last + 1]
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+            i += 1
+        if removed:
+            self._index = {k: r for r, k in enumerate(self._keys)}
+
+        # 2. 남은 키는 바뀐 셀 구간만 알림
+        changed = 0
+        for r, k in enumerate(self._keys):
+            new_row = rows[k]
+            old_row = self._rows[r]
+            if new_row == old_row:
+                continue
+            cols = [c for c, (old, new) in enumerate(zip(old_row, new_row)) if old != new]
+            self._rows[r] = new_row
+            changed += 1
+            self.dataChanged.emit(self.index(r, cols[0]), self.index(r, cols[-1]), [Qt.DisplayRole, SORT_ROLE])
+
+        # 3. 새 키는 끝에 한 번에 추가 (보이는 순서는 프록시 정렬이 결정)
+        added = [k for k in rows if k not in self._index]
+        if added:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+            for k in added:
+                self._index[k] = len(self._keys)
+                self._keys.append(k)
+                self._rows.append(rows[k])
+            self.endInsertRows()
+
+        return len(added), len(removed), changed
+
+
+def make_proxy(model: KeyedTableModel, parent=None) -> QSortFilterProxyModel:
+    """정렬 값 기준 정렬 + 모든 열 대상 대소문자 무시 필터 프록시"""
+    proxy = QSortFilterProxyModel(parent)
+    proxy.setSourceModel(model)
+    proxy.setSortRole(SORT_ROLE)
+    proxy.setFilterKeyColumn(-1)
+    proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+    proxy.setDynamicSortFilter(True)
+    return proxy
+
+
+def selected_keys(view, proxy: QSortFilterProxyModel) -> List[Hashable]:
+    """뷰에서 선택된 행들의 키 (보이는 순서)"""
+    rows = sorted(view.selectionModel().selectedRows(), key=lambda idx: idx.row())
+    return [proxy.data(idx, KEY_ROLE) for idx in rows]
+
+
+def cell(text: str, sort_value: Optional[Any] = None) -> Cell:
+    """셀 값 (정렬 값 생략 시 표시 문자열로 정렬)"""
+    return (text, text if sort_value is None else sort_value)
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BRAW Render Farm - V1(JSON 공유 폴더) → V2(SQLite) 이전 도구
+실행 중인 V1 farm_root를 os.scandir 한 번씩으로 읽어 작업/완료 프레임/활성 클레임을 FarmDatabase에 일괄 삽입
+(이미 완료된 프레임은 completed로 넣어 다시 렌더하지 않음)
+
+읽는 것:
+    jobs/*.json                                 작업 정의
+    completed/<job_id>/                         완료 매니페스트 (manifest.json + 호스트별 로그)
+    completed/{job_id}_{frame}_{eye}.done       구버전 완료 파일 (아직 이전 안 된 것)
+    tickets/running/<worker>/<job_id>/*.ticket  실행 중 범위 티켓
+    claims/<job_id>/*.json, claims/{job_id}_*.json  프레임/범위 클레임 (구버전 포함)
+
+사용:
+    python -m braw_batch_ui.v1_import <farm_root> [--db farm.db] [--pool default] [--dry-run]
+
+DB에 이미 있는 작업은 건너뛰므로 여러 번 실행해도 안전하다.
+가져온 클레임은 claimed 상태로 들어가며, V2 워커가 이어받지 않으면 CLAIM_TIMEOUT_SEC 후 pending으로 돌아간다.
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .config import CLAIM_TIMEOUT_SEC, V1_IMPORT_BATCH_ROWS
+from .completion_manifest import CompletionManifest
+from .farm_db import FarmDatabase, JobStatus, clip_name_of, get_default_db_path
+
+# V1 배치 클레임 타임아웃 (V1 config의 BATCH_CLAIM_TIMEOUT_SEC와 같은 값 - 이보다 오래된 티켓/클레임은 만료로 간주)
+V1_RANGE_CLAIM_TIMEOUT_SEC = 600
+
+
+class V1Job:
+    """V1 작업 하나의 이전 대상 상태"""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.job_id = data["job_id"]
+        self.start_frame = int(data["start_frame"])
+        self.end_frame = int(data["end_frame"])
+        self.eyes = list(data["eyes"])
+        self.done: Dict[str, bytearray] = {}  # eye -> 완료 비트맵 (비트 i = 프레임 i)
+        self.claims: Dict[Tuple[int, str], Tuple[str, float]] = {}  # (frame, eye) -> (worker_id, claimed_at)
+
+    def mark_done(self, eye: str, start: int, end: int):
+        """완료 범위 반영 (작업 범위 밖은 무시)"""
+        start, end = max(start, self.start_frame), min(end, self.end_frame)
+        if start > end:
+            return
+        bitmap = self.done.setdefault(eye, bytearray((self.end_frame >> 3) + 1))
+        for frame_idx in range(start, end + 1):
+            bitmap[frame_idx >> 3] |= 1 << (frame_idx & 7)
+
+    def is_done(self, frame_idx: int, eye: str) -> bool:
+        bitmap = self.done.get(eye)
+        return bitmap is not None and bool(bitmap[frame_idx >> 3] & (1 << (frame_idx & 7)))
+
+    def mark_claimed(self, eye: str, start: int, end: int, worker_id: str, claimed_at: float):
+        """활성 클레임 반영 (완료된 프레임은 완료 우선)"""
+        for frame_idx in range(max(start, self.start_frame), min(end, self.end_frame) + 1):
+            self.claims[(frame_idx, eye)] = (worker_id, claimed_at)
+
+    def counts(self) -> Tuple[int, int, int]:
+        """(전체, 완료, 클레임) 프레임 수"""
+        total = (self.end_frame - self.start_frame + 1) * len(self.eyes)
+        completed = sum(self.is_done(f, eye) for f in range(self.start_frame, self.end_frame + 1)
+                        for eye in self.eyes)
+        claimed = sum(1 for (f, eye) in self.claims if eye in self.eyes and not self.is_done(f, eye))
+        return total, completed, claimed
+
+
+class V1FarmImporter:
+    """V1 farm_root → FarmDatabase 일괄 이전"""
+
+    def __init__(self, farm_root: str, db: Optional[FarmDatabase], pool_id: str = "default",
+                 batch_rows: int = V1_IMPORT_BATCH_ROWS, log: Callable[[str], None] = print):
+        self.farm_root = Path(farm_root)
+        self.db = db
+        self.pool_id = pool_id
+        self.batch_rows = batch_rows
+        self.log = log
+        self.jobs: Dict[str, V1Job] = {}
+
+        # 통계
+        self.stats = {
+            "entries_scanned": 0,
+            "jobs_found": 0,
+            "jobs_skipped": 0,
+            "jobs_imported": 0,
+            "done_files": 0,
+            "manifest_jobs": 0,
+            "active_claims": 0,
+            "frames_inserted": 0,
+            "frames_completed": 0,
+            "frames_claimed": 0,
+            "transactions": 0,
+            "scan_sec": 0.0,
+            "insert_sec": 0.0,
+        }
+
+    # ===== 읽기 =====
+
+    def _scandir(self, folder: Path) -> Iterator[os.DirEntry]:
+        """폴더 나열 (없으면 빈 목록)"""
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    self.stats["entries_scanned"] += 1
+                    yield entry
+        except FileNotFoundError:
+            return
+
+    def scan(self):
+        """farm_root 전체 읽기 (폴더마다 scandir 한 번)"""
+        started = time.time()
+        self._scan_jobs()
+        self._scan_completed()
+        self._scan_tickets()
+        self._scan_claims()
+        self.stats["scan_sec"] = time.time() - started
+        self.log(
+            f"스캔 완료: 작업 {self.stats['jobs_found']}개, 항목 {self.stats['entries_scanned']:,}개 "
+            f"({self.stats['scan_sec']:.1f}초, {self.stats['entries_scanned'] / max(self.stats['scan_sec'], 1e-6):,.0f}개/초)"
+        )
+
+    def _scan_jobs(self):
+        for entry in self._scandir(self.farm_root / "jobs"):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                with open(entry.path, "r", encoding="utf-8") as f:
+                    job = V1Job(json.load(f))
+            except (OSError, IOError, ValueError, KeyError, TypeError):
+                self.log(f"  ⚠️ 읽을 수 없는 작업 파일 건너뜀: {entry.name}")
+                continue
+            self.jobs[job.job_id] = job
+        self.stats["jobs_found"] = len(self.jobs)
+
+    def _scan_completed(self):
+        """완료 매니페스트 폴더 + 구버전 .done 파일"""
+        for entry in self._scandir(self.farm_root / "completed"):
+            name = entry.name
+            if name.endswith(".done"):
+                # {job_id}_{frame}_{eye}.done (job_id에는 '_'가 있을 수 있으므로 뒤에서 자름)
+                parts = name[:-len(".done")].rsplit("_", 2)
+                if len(parts) != 3 or parts[0] not in self.jobs:
+                    continue
+                try:
+                    frame_idx = int(parts[1])
+                except ValueError:
+                    continue
+                self.jobs[parts[0]].mark_done(parts[2], frame_idx, frame_idx)
+                self.stats["done_files"] += 1
+            elif name in self.jobs and entry.is_dir():
+                ranges = CompletionManifest(Path(entry.path)).completed_ranges()
+                if ranges:
+                    self.stats["manifest_jobs"] += 1
+                for eye, eye_ranges in ranges.items():
+                    for start, end in eye_ranges:
+                        self.jobs[name].mark_done(eye, start, end)
+
+    def _scan_tickets(self):
+        """실행 중 범위 티켓 (range_{start:06d}_{end:06d}_{eye}.ticket, mtime = 클레임 시각)"""
+        now = time.time()
+        for worker in self._scandir(self.farm_root / "tickets" / "running"):
+            if not worker.is_dir():
+                continue
+            for job_dir in self._scandir(Path(worker.path)):
+                job = self.jobs.get(job_dir.name)
+                if job is None or not job_dir.is_dir():
+                    continue
+                for ticket in self._scandir(Path(job_dir.path)):
+                    parts = ticket.name[:-len(".ticket")].split("_")
+                    if not ticket.name.endswith(".ticket") or len(parts) != 4:
+                        continue
+                    try:
+                        start, end = int(parts[1]), int(parts[2])
+                        claimed_at = ticket.stat().st_mtime
+                    except (ValueError, OSError):
+                        continue
+                    if now - claimed_at >= V1_RANGE_CLAIM_TIMEOUT_SEC:
+                        continue
+                    job.mark_claimed(parts[3], start, end, worker.name, claimed_at)
+                    self.stats["active_claims"] += 1
+
+    def _scan_claims(self):
+        """JSON 클레임 (작업별 폴더 + 구버전 평면 파일) - 만료되지 않은 것만"""
+        now = time.time()
+        claims_dir = self.farm_root / "claims"
+        files = []
+        for entry in self._scandir(claims_dir):
+            if entry.is_dir():
+                if entry.name in self.jobs:
+                    files.extend(e for e in self._scandir(Path(entry.path)) if e.name.endswith(".json"))
+            elif entry.name.endswith(".json"):
+                files.append(entry)
+        for entry in files:
+            try:
+                claimed_at = entry.stat().st_mtime
+                timeout = V1_RANGE_CLAIM_TIMEOUT_SEC if "range_" in entry.name else CLAIM_TIMEOUT_SEC
+                if now - claimed_at >= timeout:
+                    continue
+                with open(entry.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                job = self.jobs.get(data["job_id"])
+                if job is None:
+                    continue
+                if "start_frame" in data:
+                    start, end = int(data["start_frame"]), int(data["end_frame"])
+                else:
+                    start = end = int(data["frame_idx"])
+                job.mark_claimed(data["eye"], start, end, data.get("worker_id", ""), claimed_at)
+                self.stats["active_claims"] += 1
+            except (OSError, IOError, ValueError, KeyError, TypeError):
+                continue  # 쓰는 중/삭제됨/손상
+
+    # ===== 쓰기 =====
+
+    def _job_row(self, job: V1Job) -> Tuple:
+        """jobs 테이블 행 (V1 상태 + 진행률로 V2 상태 결정)"""
+        data = job.data
+        total, completed, claimed = job.counts()
+        v1_status = data.get("status", "active")
+        if v1_status == "excluded":
+            status = JobStatus.EXCLUDED
+        elif v1_status == "paused":
+            status = JobStatus.PAUSED
+        elif completed >= total and total > 0:
+            status = JobStatus.COMPLETED
+        elif completed > 0 or claimed > 0:
+            status = JobStatus.IN_PROGRESS
+        else:
+            status = JobStatus.PENDING
+        return (
+            job.job_id, self.pool_id, data["clip_path"], data["output_dir"],
+            job.start_frame, job.end_frame, json.dumps(job.eyes),
+            data.get("format", "exr"), int(data.get("separate_folders", False)),
+            int(data.get("use_aces", True)),
+            data.get("color_input_space", "BMDFilm WideGamut Gen5"),
+            data.get("color_output_space", "ACEScg"),
+            int(data.get("use_stmap", False)), data.get("stmap_path", ""),
+            status.value, max(0, min(100, int(data.get("priority", 50)))),
+            data.get("created_at") or datetime.now().isoformat(), data.get("created_by", ""),
+            clip_name_of(data["clip_path"]),
+        )
+
+    def _frame_rows(self, job: V1Job, imported_at: str) -> Iterator[Tuple]:
+        """frames 테이블 행 (job_id, frame_idx, eye, status, worker_id, claimed_at, completed_at)"""
+        for frame_idx in range(job.start_frame, job.end_frame + 1):
+            for eye in job.eyes:
+                if job.is_done(frame_idx, eye):
+                    self.stats["frames_completed"] += 1
+                    yield (job.job_id, frame_idx, eye, "completed", None, None, imported_at)
+                    continue
+                claim = job.claims.get((frame_idx, eye))
+                if claim is not None:
+                    self.stats["frames_claimed"] += 1
+                    worker_id, claimed_at = claim
+                    yield (job.job_id, frame_idx, eye, "claimed", worker_id,
+                           datetime.fromtimestamp(claimed_at).isoformat(), None)
+                else:
+                    yield (job.job_id, frame_idx, eye, "pending", None, None, None)
+
+    def _flush(self, job_rows: List[Tuple], frame_rows: List[Tuple]):
+        """트랜잭션 하나로 삽입"""
+        with self.db.transaction() as conn:
+            if job_rows:
+                conn.executemany("""
+                    INSERT INTO jobs (job_id, pool_id, clip_path, output_dir, start_frame, end_frame,
+                                     eyes, format, separate_folders, use_aces, color_input_space,
+                                     color_output_space, use_stmap, stmap_path, status, priority,
+                                     created_at, created_by, clip_name)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, job_rows)
+            if frame_rows:
+                conn.executemany("""
+                    INSERT INTO frames (job_id, frame_idx, eye, status, worker_id, claimed_at, completed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, frame_rows)
+        self.stats["transactions"] += 1
+
+    def _log_progress(self, started: float):
+        elapsed = time.time() - started
+        self.log(f"  {self.stats['frames_inserted']:,}프레임 삽입 "
+                 f"({self.stats['frames_inserted'] / max(elapsed, 1e-6):,.0f}프레임/초)")
+
+    def import_jobs(self, dry_run: bool = False):
+        """스캔 결과 삽입 (dry_run이면 집계만)"""
+        started = time.time()
+        existing = set()
+        if self.db is not None:
+            existing = self.db.get_job_ids()
+
+        imported_at = datetime.now().isoformat()
+        job_rows, frame_rows = [], []
+        for job_id in sorted(self.jobs):
+            job = self.jobs[job_id]
+            if job_id in existing:
+                self.stats["jobs_skipped"] += 1
+                self.log(f"  건너뜀 (이미 DB에 있음): {job_id}")
+                continue
+            try:
+                job_rows.append(self._job_row(job))
+            except (KeyError, TypeError, ValueError) as e:
+                self.stats["jobs_skipped"] += 1
+                self.log(f"  ⚠️ 작업 정보 불완전 - 건너뜀: {job_id} ({e})")
+                continue
+            self.stats["jobs_imported"] += 1
+
+            # 작업 하나의 행은 항상 같은 트랜잭션에 넣음 (중단 후 재실행 시 건너뛰는 작업이 반쪽이 되지 않도록)
+            rows = list(self._frame_rows(job, imported_at))
+            if dry_run:
+                self.stats["frames_inserted"] += len(rows)
+                job_rows = []
+                continue
+            if frame_rows and len(frame_rows) + len(rows) > self.batch_rows:
+                self._flush(job_rows[:-1], frame_rows)
+                job_rows, frame_rows = job_rows[-1:], []
+                self._log_progress(started)
+            self.stats["frames_inserted"] += len(rows)
+            frame_rows.extend(rows)
+            if len(frame_rows) >= self.batch_rows:
+                # batch_rows보다 큰 작업은 단독 트랜잭션
+                self._flush(job_rows, frame_rows)
+                job_rows, frame_rows = [], []
+                self._log_progress(started)
+
+        if not dry_run and (job_rows or frame_rows):
+            self._flush(job_rows, frame_rows)
+        self.stats["insert_sec"] = time.time() - started
+
+    def run(self, dry_run: bool = False) -> Dict[str, Any]:
+        """스캔 + 삽입 후 통계 반환"""
+        if not dry_run and self.db is not None:
+            pools = {pool.pool_id for pool in self.db.get_pools()}
+            if self.pool_id not in pools:
+                raise ValueError(f"풀이 없습니다: {self.pool_id}")
+
+        self.scan()
+        self.import_jobs(dry_run)
+
+        s = self.stats
+        mode = "[DRY RUN] " if dry_run else ""
+        self.log(
+            f"{mode}작업 {s['jobs_imported']}개 이전 (건너뜀 {s['jobs_skipped']}개), "
+            f"프레임 {s['frames_inserted']:,}개 (완료 {s['frames_completed']:,}, 클레임 {s['frames_claimed']:,})"
+        )
+        self.log(
+            f"{mode}완료 기록: 매니페스트 {s['manifest_jobs']}개 작업 + .done {s['done_files']:,}개, "
+            f"활성 클레임 {s['active_claims']}개"
+        )
+        self.log(
+            f"{mode}소요: 스캔 {s['scan_sec']:.1f}초 + 삽입 {s['insert_sec']:.1f}초 "
+            f"({s['frames_inserted'] / max(s['insert_sec'], 1e-6):,.0f}프레임/초, 트랜잭션 {s['transactions']}개)"
+        )
+        return s
+
+
+def main():
+    parser = argparse.ArgumentParser(description="V1 farm_root를 V2 SQLite DB로 이전")
+    parser.add_argument("farm_root", help="V1 팜 루트 폴더 (jobs/, completed/, claims/ 가 있는 곳)")
+    parser.add_argument("--db", default=None, help="V2 DB 경로 (기본: BRAW_FARM_DB 또는 기본 경로)")
+    parser.add_argument("--pool", default="default", help="작업을 넣을 풀 ID (기본: default)")
+    parser.add_argument("--batch-rows", type=int, default=V1_IMPORT_BATCH_ROWS, help="트랜잭션당 프레임 행 수 (작업 하나는 나누지 않음)")
+    parser.add_argument("--dry-run", action="store_true", help="DB에 쓰지 않고 집계만 출력")
+    args = parser.parse_args()
+
+    if not (Path(args.farm_root) / "jobs").is_dir():
+        parser.error(f"V1 팜 루트가 아닙니다 (jobs/ 없음): {args.farm_root}")
+
+    db = None
+    if not args.dry_run:
+        db = FarmDatabase(args.db or get_default_db_path())
+    try:
+        V1FarmImporter(args.farm_root, db, args.pool, args.batch_rows).run(args.dry_run)
+    finally:
+        if db is not None:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()